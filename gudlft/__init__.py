@@ -35,4 +35,16 @@ original.
 
 # Import explicite des éléments les plus utilisés pour les rendre disponibles directement
 # depuis le package principal (import gudlft) sans avoir à spécifier le sous-module
-from .server import app, loadClubs, loadCompetitions
+# AMÉLIORATION: import différé au premier accès (PEP 562). Importer le serveur
+# charge l'application et les fichiers de données du répertoire courant: les
+# commandes `gudlft` (cli.py) et les autres modules du package ne doivent pas
+# le déclencher.
+_SERVER_EXPORTS = ("app", "loadClubs", "loadCompetitions")
+
+
+def __getattr__(name):
+    if name in _SERVER_EXPORTS:
+        from . import server
+
+        return getattr(server, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,93 @@
+"""
+AJOUT: Contrôle d'admission des réservations par compétition.
+
+Lors de l'ouverture d'une compétition populaire, tous les clubs réservent en
+même temps sur le même compteur de places. Plutôt que de laisser des dizaines
+de threads relire et réécrire les mêmes fichiers en parallèle, chaque
+compétition n'admet qu'une réservation à la fois:
+
+- les requêtes suivantes attendent dans une file FIFO (ordre d'arrivée),
+- la file est bornée: au-delà, la requête est refusée immédiatement
+  (réponse 429 avec Retry-After),
+- une requête qui attend trop longtemps est aussi refusée.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class AdmissionRejected(Exception):
+    """Requête refusée: file d'attente pleine ou attente trop longue."""
+
+    def __init__(self, key, retry_after):
+        super().__init__(f"Too many booking requests for {key}")
+        self.key = key
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Admission d'une requête active par clé, avec une file d'attente FIFO
+    bornée par clé. À la fin d'une requête, le tour est transmis directement
+    à la plus ancienne requête en attente.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._active = set()
+        self._waiters = {}
+        # Durée d'attente de la dernière requête admise (secondes)
+        self.last_wait = 0.0
+
+    @contextmanager
+    def admit(self, key, max_waiting, timeout, retry_after=1):
+        """
+        Contexte exécuté lorsque la requête a obtenu son tour pour `key`.
+        Lève AdmissionRejected si `max_waiting` requêtes attendent déjà ou si
+        le tour n'arrive pas avant `timeout` secondes.
+        """
+        self._acquire(key, max_waiting, timeout, retry_after)
+        try:
+            yield
+        finally:
+            self._release(key)
+
+    def _acquire(self, key, max_waiting, timeout, retry_after):
+        start = time.perf_counter()
+        with self._lock:
+            if key not in self._active:
+                self._active.add(key)
+                self.last_wait = 0.0
+                return
+            waiters = self._waiters.setdefault(key, deque())
+            if len(waiters) >= max_waiting:
+                raise AdmissionRejected(key, retry_after)
+            turn = threading.Event()
+            waiters.append(turn)
+        if not turn.wait(timeout):
+            with self._lock:
+                # Le tour a pu être transmis juste à l'expiration du délai
+                if not turn.is_set():
+                    waiters.remove(turn)
+                    if not waiters:
+                        del self._waiters[key]
+                    raise AdmissionRejected(key, retry_after)
+        self.last_wait = time.perf_counter() - start
+
+    def _release(self, key):
+        with self._lock:
+            waiters = self._waiters.get(key)
+            if waiters:
+                # La clé reste active: le tour passe au premier en attente
+                waiters.popleft().set()
+                if not waiters:
+                    del self._waiters[key]
+            else:
+                self._active.discard(key)
+
+    def waiting(self, key):
+        """Nombre de requêtes en attente pour `key`."""
+        with self._lock:
+            return len(self._waiters.get(key, ()))
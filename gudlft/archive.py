@@ -0,0 +1,99 @@
+"""
+AJOUT: Archivage des compétitions passées et tâches de fond périodiques.
+
+Les compétitions passées restaient indéfiniment dans competitions.json et
+leurs réservations dans bookings.json: chaque requête continuait à vérifier
+leur date et les fichiers réécrits à chaque réservation ne faisaient que
+grossir. Une tâche de fond déplace périodiquement les compétitions dont la
+date est dépassée, avec les totaux de réservations correspondants, dans un
+fichier d'archive. Les données de travail ne contiennent alors que les
+compétitions à venir.
+"""
+
+import os
+import threading
+
+from . import jsoncodec
+from .validation import parse_id
+
+
+class Archive:
+    """
+    Fichier JSON d'archive:
+    {"competitions": [...], "bookings": {"club_compétition": places},
+    "lastId": plus grand identifiant de compétition archivé}.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        """Renvoie le contenu de l'archive (vide si le fichier n'existe pas)."""
+        try:
+            with open(self.path, "rb") as f:
+                return jsoncodec.loads(f.read())
+        except FileNotFoundError:
+            return {"competitions": [], "bookings": {}}
+
+    def last_id(self):
+        """
+        Plus grand identifiant de compétition archivé (0 si aucun): les
+        identifiants des compétitions archivées ne sont pas réattribués.
+        """
+        archive = self.load()
+        return max(
+            [archive.get("lastId", 0)]
+            + [parse_id(comp.get("id")) or 0 for comp in archive["competitions"]]
+        )
+
+    def add(self, competitions, bookings):
+        """
+        Ajoute des compétitions et leurs totaux de réservations à l'archive.
+        Le fichier est réécrit par remplacement atomique: une archive n'est
+        jamais à moitié écrite si le processus s'arrête.
+        """
+        archive = self.load()
+        archive["competitions"].extend(competitions)
+        archived_bookings = archive["bookings"]
+        for key, places in bookings.items():
+            archived_bookings[key] = archived_bookings.get(key, 0) + places
+        archive["lastId"] = max(
+            [archive.get("lastId", 0)]
+            + [parse_id(comp.get("id")) or 0 for comp in competitions]
+        )
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            jsoncodec.dump(archive, f)
+        os.replace(tmp_path, self.path)
+
+
+class PeriodicTask:
+    """Exécute `function` toutes les `interval` secondes dans un thread démon."""
+
+    def __init__(self, interval, function, name="periodic-task"):
+        self.interval = interval
+        self.function = function
+        self.name = name
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name=self.name, daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.function()
+            except Exception as e:
+                # Une erreur ponctuelle n'arrête pas les exécutions suivantes
+                print(f"Error in background task {self.name}: {e}")
@@ -0,0 +1,195 @@
+"""
+AJOUT: Journal d'audit des réservations, écrit hors du chemin des requêtes.
+
+bookings.json ne conserve que des totaux par club et par compétition: il ne
+permet pas de savoir qui a réservé quoi, ni quand. Écrire un journal pendant
+la requête ajouterait une écriture disque à chaque réservation. À la place:
+
+- la requête ajoute l'événement dans un tampon circulaire borné en mémoire
+  (opération O(1), sans entrée/sortie),
+- un thread de fond vide le tampon et écrit les événements, une ligne JSON
+  par événement, dans un fichier qui tourne au-delà d'une taille maximale
+  (audit.jsonl, audit.jsonl.1, ... audit.jsonl.N),
+- si le thread ne suit pas et que le tampon déborde, les événements les plus
+  anciens sont abandonnés et comptés (`dropped`).
+
+Chaque événement porte l'identifiant du journal qui l'a reçu (`log`, un par
+processus) et son numéro d'ordre (`seq`, à partir de 1): un événement
+abandonné ou une copie tournée supprimée laisse un trou dans la numérotation,
+que le rejeu (replay.py) détecte.
+
+Plusieurs processus peuvent écrire dans le même fichier: la vérification de
+taille, la rotation et l'ajout se font sous un verrou fcntl (`<path>.lock`),
+comme la réécriture de bookings.json. Sans lui, deux processus pouvaient
+tourner le fichier l'un après l'autre (une copie décalée deux fois, une autre
+écrasée) ou ajouter à un fichier venant d'être renommé.
+"""
+
+import glob
+import os
+import threading
+import uuid
+from collections import deque
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+from . import jsoncodec
+
+
+class AuditLog:
+    """
+    Tampon circulaire de `capacity` événements vidé toutes les
+    `flush_interval` secondes (ou dès que la moitié du tampon est remplie)
+    dans le fichier `path`, qui tourne au-delà de `max_bytes` octets en
+    conservant `backup_count` fichiers précédents.
+    """
+
+    def __init__(
+        self, path, capacity=10000, max_bytes=10_000_000, backup_count=5,
+        flush_interval=1.0,
+    ):
+        self.path = path
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.flush_interval = flush_interval
+        self._buffer = deque()
+        self._lock = threading.Lock()
+        # Une seule écriture à la fois (thread de fond ou flush explicite)
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self.instance = uuid.uuid4().hex[:12]
+        self.recorded = 0
+        self.written = 0
+        self.dropped = 0
+        self.write_errors = 0
+
+    def record(self, event):
+        """
+        Ajoute un événement (dictionnaire sérialisable) sans attendre
+        l'écriture, précédé de l'identifiant du journal et de son numéro.
+        """
+        with self._lock:
+            if len(self._buffer) >= self.capacity:
+                self._buffer.popleft()
+                self.dropped += 1
+            self.recorded += 1
+            self._buffer.append({"log": self.instance, "seq": self.recorded, **event})
+            pending = len(self._buffer)
+        if pending * 2 >= self.capacity:
+            self._wakeup.set()
+
+    def flush(self):
+        """Écrit immédiatement les événements en attente."""
+        with self._write_lock:
+            with self._lock:
+                events = list(self._buffer)
+                self._buffer.clear()
+            if not events:
+                return
+            data = "".join(jsoncodec.dumps(event) + "\n" for event in events)
+            try:
+                with self._file_lock():
+                    self._rotate_if_needed(len(data.encode("utf-8")))
+                    with open(self.path, "a", encoding="utf-8") as f:
+                        f.write(data)
+            except OSError as e:
+                self.write_errors += 1
+                self.dropped += len(events)
+                print(f"Error writing audit log {self.path}: {e}")
+                return
+            self.written += len(events)
+
+    @contextmanager
+    def _file_lock(self):
+        """Verrou exclusif inter-processus (fcntl) sur `<path>.lock`."""
+        if fcntl is None:
+            yield
+            return
+        fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            # La fermeture libère le verrou
+            os.close(fd)
+
+    def _rotate_if_needed(self, incoming):
+        """Décale les fichiers (.1 -> .2, ...) si l'écriture dépasserait max_bytes."""
+        try:
+            size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            return
+        if size == 0 or size + incoming <= self.max_bytes:
+            return
+        if self.backup_count <= 0:
+            os.remove(self.path)
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def files(self):
+        """Fichiers du journal du plus ancien au plus récent (existants seulement)."""
+        paths = [f"{self.path}.{index}" for index in range(self.backup_count, 0, -1)]
+        paths.append(self.path)
+        return [path for path in paths if os.path.exists(path)]
+
+    def stats(self):
+        """Compteurs du journal (événements reçus, écrits, abandonnés, en attente)."""
+        with self._lock:
+            pending = len(self._buffer)
+        return {
+            "recorded": self.recorded,
+            "written": self.written,
+            "dropped": self.dropped,
+            "pending": pending,
+            "writeErrors": self.write_errors,
+        }
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="audit-log", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout=None):
+        """Arrête le thread de fond après avoir écrit les derniers événements."""
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+
+def journal_files(path):
+    """
+    Fichiers existants du journal `path` du plus ancien au plus récent, quel
+    que soit le nombre de copies conservées (audit.jsonl.N, ..., audit.jsonl).
+    """
+    backups = []
+    for backup in glob.glob(glob.escape(path) + ".*"):
+        suffix = backup[len(path) + 1:]
+        if suffix.isdigit():
+            backups.append((int(suffix), backup))
+    paths = [backup for _, backup in sorted(backups, reverse=True)]
+    if os.path.exists(path):
+        paths.append(path)
+    return paths
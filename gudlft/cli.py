@@ -0,0 +1,313 @@
+"""
+AJOUT: Commandes d'administration des données (`gudlft <commande>`).
+
+    gudlft compile-data [--clubs clubs.json] [--competitions competitions.json]
+                        [--output data.snapshot] [--archive archive.json]
+    gudlft archive
+    gudlft assign-ids [--clubs clubs.json] [--competitions competitions.json]
+                      [--archive archive.json]
+    gudlft checkpoint [--clubs ...] [--competitions ...] [--bookings bookings.json]
+                      [--journal audit.jsonl] [--checkpoint audit.jsonl.checkpoint]
+    gudlft verify [--clubs ...] [--competitions ...] [--bookings bookings.json]
+                  [--journal audit.jsonl] [--checkpoint ...] [--no-numpy]
+    gudlft rebuild (mêmes options que verify)
+    gudlft eligibility [--json]
+    gudlft import {clubs,competitions} SOURCE [--output clubs.dat]
+                  [--skip-invalid] [--quiet]
+"""
+
+import argparse
+import sys
+
+from . import compiled, jsoncodec, replay, store
+from .archive import Archive
+from .audit import journal_files
+from .validation import assign_ids, parse_id
+
+
+def compile_data_command(args):
+    """Valide les sources JSON et écrit l'instantané binaire."""
+    errors = compiled.compile_data(
+        args.clubs, args.competitions, args.output, Archive(args.archive).last_id()
+    )
+    if errors:
+        for error in errors:
+            print(error, file=sys.stderr)
+        print(f"{len(errors)} error(s), snapshot not written", file=sys.stderr)
+        return 1
+    print(f"Snapshot written to {args.output}")
+    return 0
+
+
+def archive_command(args):
+    """Archive immédiatement les compétitions passées du répertoire courant."""
+    # Import tardif: l'application n'est chargée que pour cette commande
+    from . import server
+
+    archived = server.archive_past_competitions()
+    for name in archived:
+        print(f"Archived {name}")
+    print(f"{len(archived)} competition(s) archived")
+    return 0
+
+
+def assign_ids_command(args):
+    """
+    Écrit dans les fichiers JSON les identifiants des enregistrements qui
+    n'en ont pas encore (migration), les autres champs restant inchangés.
+    """
+    last_id = Archive(args.archive).last_id()
+    for path, root_key in ((args.clubs, "clubs"), (args.competitions, "competitions")):
+        with open(path, "rb") as f:
+            data = jsoncodec.loads(f.read())
+        records = data[root_key]
+        existing = {parse_id(record.get("id")) for record in records}
+        assign_ids(records, last_id if root_key == "competitions" else 0)
+        added = sum(1 for record in records if record["id"] not in existing)
+        with open(path, "w") as f:
+            jsoncodec.dump(data, f)
+        print(f"{path}: {added} id(s) assigned")
+    return 0
+
+
+def eligibility_command(args):
+    """
+    Affiche, pour chaque compétition des données du répertoire courant, le
+    nombre de clubs pouvant encore réserver et le total de places qu'ils
+    peuvent réserver (rapport complet en JSON avec --json).
+    """
+    from . import server
+
+    server.refresh_data()
+    view = server.current_view()
+    matrix = server.eligibility_matrix(view)
+    if args.json:
+        print(jsoncodec.dumps({"version": view.version, **matrix.report()}))
+        return 0
+    for comp, is_open, eligible, total in zip(
+        view.competitions,
+        matrix.open_mask,
+        matrix.eligible_clubs(),
+        matrix.bookable_places(),
+    ):
+        state = "open" if is_open else "closed"
+        print(
+            f"{comp['name']} ({state}, {comp['numberOfPlaces']} places):"
+            f" {eligible} eligible club(s), {total} place(s) bookable"
+        )
+    return 0
+
+
+def import_command(args):
+    """
+    Importe en flux les clubs ou les compétitions d'un fichier JSON dans un
+    fichier d'enregistrements (progression et erreurs sur la sortie d'erreur).
+    """
+    layout = store.CLUB_LAYOUT if args.kind == "clubs" else store.COMPETITION_LAYOUT
+    output = args.output or f"{args.kind}.dat"
+
+    def progress(count, position, total):
+        percent = 100 * position // total if total else 100
+        print(f"{count} record(s) read ({percent}%)", file=sys.stderr)
+
+    result = store.stream_import(
+        args.source, args.kind, output, layout,
+        skip_invalid=args.skip_invalid,
+        progress=None if args.quiet else progress,
+    )
+    for error in result.errors:
+        print(error, file=sys.stderr)
+    if result.store is None:
+        print(f"{len(result.errors)} error(s), {output} not written", file=sys.stderr)
+        return 1
+    result.store.close()
+    print(f"{result.count} record(s) written to {output}")
+    return 1 if result.errors else 0
+
+
+def _checkpoint_path(args):
+    return args.checkpoint or f"{args.journal}.checkpoint"
+
+
+def checkpoint_command(args):
+    """
+    Enregistre le point de reprise du rejeu: points, places, totaux de
+    bookings.json et position de fin du journal (application arrêtée).
+    """
+    path = _checkpoint_path(args)
+    checkpoint = replay.create_checkpoint(
+        args.clubs, args.competitions, args.bookings, journal_files(args.journal)
+    )
+    replay.save_checkpoint(path, checkpoint)
+    print(f"Checkpoint written to {path} ({len(checkpoint['bookings'])} booking total(s))")
+    return 0
+
+
+def _verification(args):
+    path = _checkpoint_path(args)
+    try:
+        checkpoint = replay.load_checkpoint(path)
+    except FileNotFoundError:
+        print(
+            f"No checkpoint found at {path}, run `gudlft checkpoint` first",
+            file=sys.stderr,
+        )
+        return None
+    journal = journal_files(args.journal)
+    verification = replay.Verification(
+        args.clubs, args.competitions, args.bookings, journal, checkpoint,
+        use_numpy=False if args.no_numpy else None,
+    )
+    result = verification.replay
+    print(
+        f"Replayed {result.events} booking(s) since the checkpoint from"
+        f" {len(journal)} file(s) ({result.unknown} for unknown records,"
+        f" {result.invalid_lines} invalid line(s))"
+    )
+    for problem in verification.problems:
+        print(f"Incomplete journal: {problem}", file=sys.stderr)
+    return verification
+
+
+def verify_command(args):
+    """
+    Rejoue le journal d'audit depuis le point de reprise et affiche les
+    écarts avec les fichiers de données (code de retour 1 s'il y en a ou si
+    le journal est incomplet). Les totaux modifiés sans réservation dans le
+    journal sont signalés comme invérifiables.
+    """
+    verification = _verification(args)
+    if verification is None:
+        return 2
+    for mismatch in verification.mismatches:
+        print(
+            f"{mismatch.kind} {mismatch.key}: stored {mismatch.stored},"
+            f" journal {mismatch.expected}"
+        )
+    for value in verification.unverifiable:
+        print(
+            f"unverifiable {value.kind} {value.key}: stored {value.stored},"
+            f" checkpoint {value.expected}"
+        )
+    if verification.mismatches:
+        print(f"{len(verification.mismatches)} mismatch(es)")
+        return 1
+    if verification.problems:
+        return 1
+    print("Data matches the journal")
+    return 0
+
+
+def rebuild_command(args):
+    """
+    Rejoue le journal d'audit, réécrit les valeurs qui en diffèrent puis
+    avance le point de reprise. Refuse si le journal est incomplet.
+    """
+    verification = _verification(args)
+    if verification is None:
+        return 2
+    if verification.problems:
+        print("Data files not rewritten", file=sys.stderr)
+        return 1
+    if verification.mismatches:
+        verification.repair()
+    replay.save_checkpoint(_checkpoint_path(args), verification.next_checkpoint())
+    print(f"{len(verification.mismatches)} value(s) repaired")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="gudlft")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = commands.add_parser(
+        "compile-data", help="validate the JSON data and write a binary snapshot"
+    )
+    compile_parser.add_argument("--clubs", default="clubs.json")
+    compile_parser.add_argument("--competitions", default="competitions.json")
+    compile_parser.add_argument("--output", default="data.snapshot")
+    compile_parser.add_argument(
+        "--archive", default="archive.json",
+        help="archive whose competition ids are never reassigned",
+    )
+    compile_parser.set_defaults(handler=compile_data_command)
+
+    archive_parser = commands.add_parser(
+        "archive", help="move past competitions and their bookings to the archive"
+    )
+    archive_parser.set_defaults(handler=archive_command)
+
+    ids_parser = commands.add_parser(
+        "assign-ids", help="write stable numeric ids into the JSON data files"
+    )
+    ids_parser.add_argument("--clubs", default="clubs.json")
+    ids_parser.add_argument("--competitions", default="competitions.json")
+    ids_parser.add_argument(
+        "--archive", default="archive.json",
+        help="archive whose competition ids are never reassigned",
+    )
+    ids_parser.set_defaults(handler=assign_ids_command)
+
+    checkpoint_parser = commands.add_parser(
+        "checkpoint", help="record the starting point of verify and rebuild"
+    )
+    checkpoint_parser.add_argument("--clubs", default="clubs.json")
+    checkpoint_parser.add_argument("--competitions", default="competitions.json")
+    checkpoint_parser.add_argument("--bookings", default="bookings.json")
+    checkpoint_parser.add_argument("--journal", default="audit.jsonl")
+    checkpoint_parser.add_argument(
+        "--checkpoint", help="checkpoint file (default: JOURNAL.checkpoint)"
+    )
+    checkpoint_parser.set_defaults(handler=checkpoint_command)
+
+    for name, handler, help_text in (
+        ("verify", verify_command, "compare the data files with the booking journal"),
+        ("rebuild", rebuild_command, "rewrite the data files from the booking journal"),
+    ):
+        replay_parser = commands.add_parser(name, help=help_text)
+        replay_parser.add_argument("--clubs", default="clubs.json")
+        replay_parser.add_argument("--competitions", default="competitions.json")
+        replay_parser.add_argument("--bookings", default="bookings.json")
+        replay_parser.add_argument("--journal", default="audit.jsonl")
+        replay_parser.add_argument(
+            "--checkpoint", help="checkpoint file (default: JOURNAL.checkpoint)"
+        )
+        replay_parser.add_argument(
+            "--no-numpy", action="store_true", help="aggregate in pure Python"
+        )
+        replay_parser.set_defaults(handler=handler)
+
+    eligibility_parser = commands.add_parser(
+        "eligibility", help="report which clubs can still book which competitions"
+    )
+    eligibility_parser.add_argument(
+        "--json", action="store_true", help="print the full club x competition matrix"
+    )
+    eligibility_parser.set_defaults(handler=eligibility_command)
+
+    import_parser = commands.add_parser(
+        "import", help="stream a JSON export into a fixed-size record store"
+    )
+    import_parser.add_argument("kind", choices=("clubs", "competitions"))
+    import_parser.add_argument("source", help="JSON file to import")
+    import_parser.add_argument(
+        "--output", help="record store to write (default: <kind>.dat)"
+    )
+    import_parser.add_argument(
+        "--skip-invalid", action="store_true",
+        help="write the valid records even if some records are invalid",
+    )
+    import_parser.add_argument(
+        "--quiet", action="store_true", help="do not report progress"
+    )
+    import_parser.set_defaults(handler=import_command)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""
+AJOUT: Instantané binaire précompilé des clubs et des compétitions.
+
+Au démarrage, l'application analyse clubs.json et competitions.json, convertit
+les compteurs en entiers, normalise les emails pour l'index et analyse les
+dates à chaque affichage. La commande `gudlft compile-data` fait ce travail une
+seule fois, après validation des sources, et l'écrit dans un fichier binaire
+versionné:
+
+- en-tête: signature, version du format, signature (mtime, taille) des deux
+  fichiers JSON sources et nombre d'enregistrements,
+- clubs: identifiant (entier 64 bits), nom, email, email normalisé (chaînes
+  préfixées par leur longueur) et points (entier 64 bits),
+- compétitions: identifiant, nom, date texte, date décomposée (année, mois,
+  jour, heure, minute, seconde) et nombre de places.
+
+Les identifiants absents des sources sont attribués à la compilation
+(assign_ids), comme au chargement des fichiers JSON.
+
+L'application n'utilise l'instantané que si la signature des sources
+correspond aux fichiers JSON actuels; sinon elle revient à l'analyse JSON.
+"""
+
+import os
+import struct
+from collections import namedtuple
+from datetime import datetime
+
+from . import jsoncodec
+from .validation import RecordValidator, assign_ids, normalize_email, parse_date
+
+MAGIC = b"GUDSNAP1"
+FORMAT_VERSION = 2
+# signature, version, (mtime_ns, taille) de clubs.json et competitions.json,
+# nombre de clubs, nombre de compétitions
+HEADER = struct.Struct("<8sHqqqqII")
+_LENGTH = struct.Struct("<I")
+_INT = struct.Struct("<q")
+_DATE = struct.Struct("<HBBBBB")
+
+Snapshot = namedtuple(
+    "Snapshot", ["sources", "clubs", "competitions", "email_keys", "dates"]
+)
+
+
+class SnapshotError(Exception):
+    """Instantané absent, tronqué ou d'une version de format inconnue."""
+
+
+def source_signature(clubs_path, competitions_path):
+    """Signature ((mtime_ns, taille), (mtime_ns, taille)) des fichiers sources."""
+    signature = []
+    for path in (clubs_path, competitions_path):
+        stat = os.stat(path)
+        signature.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _pack_text(value):
+    data = value.encode("utf-8")
+    return _LENGTH.pack(len(data)) + data
+
+
+def write_snapshot(path, clubs, competitions, email_keys, sources):
+    """
+    Écrit l'instantané de clubs et de compétitions déjà validés
+    (identifiants attribués, compteurs entiers, dates au format des
+    compétitions). L'écriture passe
+    par un fichier temporaire remplacé atomiquement.
+    """
+    (clubs_mtime, clubs_size), (comps_mtime, comps_size) = sources
+    parts = [
+        HEADER.pack(
+            MAGIC,
+            FORMAT_VERSION,
+            clubs_mtime,
+            clubs_size,
+            comps_mtime,
+            comps_size,
+            len(clubs),
+            len(competitions),
+        )
+    ]
+    for club, email_key in zip(clubs, email_keys):
+        parts.append(_INT.pack(club["id"]))
+        parts.append(_pack_text(club["name"]))
+        parts.append(_pack_text(club["email"]))
+        parts.append(_pack_text(email_key))
+        parts.append(_INT.pack(club["points"]))
+    for comp in competitions:
+        date = parse_date(comp["date"])
+        parts.append(_INT.pack(comp["id"]))
+        parts.append(_pack_text(comp["name"]))
+        parts.append(_pack_text(comp["date"]))
+        parts.append(
+            _DATE.pack(
+                date.year, date.month, date.day, date.hour, date.minute, date.second
+            )
+        )
+        parts.append(_INT.pack(comp["numberOfPlaces"]))
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(b"".join(parts))
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path):
+    """
+    Lit un instantané. Renvoie un Snapshot dont `email_keys` contient l'email
+    normalisé de chaque club et `dates` les dates analysées par date texte.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        raise SnapshotError(f"Cannot read snapshot {path}: {e}")
+    try:
+        return _parse(data)
+    except (struct.error, UnicodeDecodeError, ValueError) as e:
+        raise SnapshotError(f"Corrupted snapshot {path}: {e}")
+
+
+def _parse(data):
+    (
+        magic,
+        version,
+        clubs_mtime,
+        clubs_size,
+        comps_mtime,
+        comps_size,
+        club_count,
+        comp_count,
+    ) = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"unsupported format {magic!r} v{version}")
+    offset = HEADER.size
+
+    def text():
+        nonlocal offset
+        (length,) = _LENGTH.unpack_from(data, offset)
+        start = offset + _LENGTH.size
+        offset = start + length
+        if offset > len(data):
+            raise ValueError("truncated string")
+        return data[start:offset].decode("utf-8")
+
+    def integer(packer):
+        nonlocal offset
+        values = packer.unpack_from(data, offset)
+        offset += packer.size
+        return values
+
+    clubs = []
+    email_keys = []
+    for _ in range(club_count):
+        (club_id,) = integer(_INT)
+        name, email, email_key = text(), text(), text()
+        (points,) = integer(_INT)
+        clubs.append({"name": name, "email": email, "points": points, "id": club_id})
+        email_keys.append(email_key)
+    competitions = []
+    dates = {}
+    for _ in range(comp_count):
+        (comp_id,) = integer(_INT)
+        name, date_text = text(), text()
+        dates[date_text] = datetime(*integer(_DATE))
+        (places,) = integer(_INT)
+        competitions.append(
+            {"name": name, "date": date_text, "numberOfPlaces": places, "id": comp_id}
+        )
+    if offset != len(data):
+        raise ValueError("trailing data")
+    sources = ((clubs_mtime, clubs_size), (comps_mtime, comps_size))
+    return Snapshot(sources, clubs, competitions, email_keys, dates)
+
+
+def _load_records(path, root_key, errors):
+    """
+    Charge la liste `root_key` d'un fichier JSON source, ou note l'erreur.
+    Renvoie (enregistrements, (mtime_ns, taille)); la signature est lue avant
+    le contenu, si bien qu'une modification pendant la lecture rend
+    l'instantané périmé plutôt qu'incohérent.
+    """
+    try:
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            records = jsoncodec.loads(f.read())[root_key]
+    except OSError as e:
+        errors.append(f"{path}: {e}")
+        return [], None
+    except (KeyError, TypeError) + jsoncodec.DECODE_ERRORS as e:
+        errors.append(f"{path}: invalid JSON document ({e})")
+        return [], None
+    if not isinstance(records, list):
+        errors.append(f"{path}: '{root_key}' is not a list")
+        return [], None
+    return records, (stat.st_mtime_ns, stat.st_size)
+
+
+def compile_data(clubs_path, competitions_path, output, last_id=0):
+    """
+    Valide les fichiers JSON sources et écrit l'instantané `output`.
+    `last_id` est le plus grand identifiant des compétitions archivées
+    (voir assign_ids).
+    Renvoie la liste de toutes les erreurs trouvées; l'instantané n'est
+    écrit que si elle est vide.
+    """
+    errors = []
+    club_records, clubs_source = _load_records(clubs_path, "clubs", errors)
+    comp_records, comps_source = _load_records(
+        competitions_path, "competitions", errors
+    )
+    validator = RecordValidator()
+    clubs = [
+        validator.club(record, position)
+        for position, record in enumerate(club_records)
+    ]
+    competitions = [
+        validator.competition(record, position)
+        for position, record in enumerate(comp_records)
+    ]
+    errors.extend(validator.errors)
+    if errors:
+        return errors
+    assign_ids(clubs)
+    assign_ids(competitions, last_id)
+    email_keys = [normalize_email(club["email"]) for club in clubs]
+    write_snapshot(
+        output, clubs, competitions, email_keys, (clubs_source, comps_source)
+    )
+    return errors
@@ -0,0 +1,117 @@
+"""
+AJOUT: Compression des réponses HTTP (gzip, et brotli si installé).
+
+Les corps de réponse qui ne changent qu'avec la version des données sont
+compressés une seule fois par version puis servis tels quels: au niveau
+maximal pour les pages fixes (`compressed_variants`), au niveau rapide et à
+la première demande de chaque encodage pour les corps qui changent à chaque
+réservation (`LazyVariants`). Le choix de la variante se fait selon l'en-tête
+Accept-Encoding.
+Les autres réponses textuelles sont compressées à la volée avec un niveau
+rapide (`compress_response`), au-delà d'une taille minimale.
+"""
+
+import gzip
+import hashlib
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    brotli = None
+
+# Encodages proposés, par ordre de préférence à qualité égale
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+# Types de contenu compressibles
+COMPRESSIBLE_MIMETYPES = frozenset(
+    ["text/html", "text/css", "text/plain", "application/json", "application/javascript"]
+)
+
+
+def compress(data, encoding, fast=False):
+    """
+    Compresse `data` avec l'encodage demandé.
+    Niveau maximal pour les corps précalculés, niveau rapide (`fast`) pour
+    la compression à la volée.
+    """
+    if encoding == "br":
+        return brotli.compress(data, quality=5 if fast else 11)
+    return gzip.compress(data, compresslevel=6 if fast else 9)
+
+
+def decompress(data, encoding):
+    """Renvoie le contenu non compressé d'un corps encodé avec `encoding`."""
+    if encoding == "br":
+        return brotli.decompress(data)
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    return data
+
+
+def compressed_variants(data):
+    """
+    Précalcule les variantes d'un corps de réponse.
+    Renvoie un dictionnaire encodage -> octets, avec la variante "identity"
+    et une empreinte "etag" du contenu non compressé.
+    """
+    variants = {"identity": data}
+    for encoding in ENCODINGS:
+        variants[encoding] = compress(data, encoding)
+    variants["etag"] = hashlib.md5(data).hexdigest()
+    return variants
+
+
+class LazyVariants(dict):
+    """
+    Variantes d'un corps de réponse ("identity", "etag" et encodages), chaque
+    encodage n'étant compressé (niveau rapide) qu'à sa première demande.
+    """
+
+    def __init__(self, data):
+        super().__init__(identity=data, etag=hashlib.md5(data).hexdigest())
+
+    def __missing__(self, encoding):
+        if encoding not in ENCODINGS:
+            raise KeyError(encoding)
+        variant = self[encoding] = compress(self["identity"], encoding, fast=True)
+        return variant
+
+
+def negotiate(accept_encodings, available=ENCODINGS):
+    """
+    Choisit l'encodage à utiliser parmi `available` d'après l'objet
+    Accept-Encoding de la requête (request.accept_encodings).
+    Renvoie "identity" si aucun encodage compressé n'est accepté.
+    """
+    return accept_encodings.best_match(available, default="identity")
+
+
+def compress_response(response, accept_encodings, min_size):
+    """
+    Compresse à la volée le corps d'une réponse Flask si le client l'accepte.
+    Les réponses déjà encodées (variantes précalculées), en flux (SSE), sans
+    contenu ou d'un type non textuel sont laissées telles quelles.
+    """
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+        or response.status_code < 200
+        or response.status_code in (204, 304)
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+    ):
+        return response
+    response.vary.add("Accept-Encoding")
+    data = response.get_data()
+    if len(data) < min_size:
+        return response
+    encoding = negotiate(accept_encodings)
+    if encoding == "identity":
+        return response
+    response.set_data(compress(data, encoding, fast=True))
+    response.headers["Content-Encoding"] = encoding
+    # Le contenu envoyé diffère de l'original: un ETag fort n'est plus valable
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
@@ -0,0 +1,151 @@
+"""
+AJOUT: Calcul groupé de l'éligibilité de tous les clubs à toutes les compétitions.
+
+Savoir quels clubs peuvent encore réserver quelles compétitions revenait à
+appeler check_availability pour chaque paire club/compétition. Ce module
+calcule en une passe, pour toute la matrice clubs x compétitions, le nombre
+maximal de places encore réservables:
+
+    min(points du club, places restantes, limite - places déjà réservées)
+
+(0 si la compétition est fermée), un club étant éligible si ce nombre est
+positif. Les mêmes règles que check_availability sont appliquées. Le calcul
+utilise numpy s'il est installé, sinon une boucle en Python pur.
+"""
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    numpy = None
+
+
+class Eligibility:
+    """
+    Places réservables par club (lignes, dans l'ordre de `club_ids`) et par
+    compétition (colonnes, dans l'ordre de `competition_ids`). `max_bookable`
+    est un tableau numpy quand il a été calculé avec numpy (les totaux par
+    compétition sont alors calculés par numpy), sinon une liste de listes.
+    """
+
+    def __init__(self, club_ids, competition_ids, open_mask, max_bookable):
+        self.club_ids = club_ids
+        self.competition_ids = competition_ids
+        self.open_mask = open_mask
+        self.max_bookable = max_bookable
+        self._rows = {club_id: index for index, club_id in enumerate(club_ids)}
+
+    def _is_array(self):
+        return numpy is not None and isinstance(self.max_bookable, numpy.ndarray)
+
+    def eligible_clubs(self):
+        """Nombre de clubs éligibles pour chaque compétition."""
+        if self._is_array():
+            return (self.max_bookable > 0).sum(axis=0).tolist()
+        counts = [0] * len(self.competition_ids)
+        for row in self.max_bookable:
+            for index, places in enumerate(row):
+                if places > 0:
+                    counts[index] += 1
+        return counts
+
+    def bookable_places(self):
+        """Total des places réservables par l'ensemble des clubs, par compétition."""
+        if self._is_array():
+            return self.max_bookable.sum(axis=0).tolist()
+        totals = [0] * len(self.competition_ids)
+        for row in self.max_bookable:
+            for index, places in enumerate(row):
+                totals[index] += places
+        return totals
+
+    def row(self, club_id):
+        """Places réservables par le club `club_id` pour chaque compétition."""
+        row = self.max_bookable[self._rows[club_id]]
+        return row.tolist() if self._is_array() else row
+
+    def rows(self, start, stop):
+        """Lignes des clubs d'indices `start` à `stop` (exclu)."""
+        rows = self.max_bookable[start:stop]
+        return rows.tolist() if self._is_array() else rows
+
+    def summary(self):
+        """Totaux par compétition, sans la matrice (sérialisable en JSON)."""
+        return {
+            "competitions": self.competition_ids,
+            "open": self.open_mask,
+            "eligibleClubs": self.eligible_clubs(),
+            "bookablePlaces": self.bookable_places(),
+        }
+
+    def report(self):
+        """Rapport complet, matrice comprise (sérialisable en JSON)."""
+        return {
+            "clubs": self.club_ids,
+            "maxBookable": self.rows(0, len(self.club_ids)),
+            **self.summary(),
+        }
+
+
+def compute(clubs, competitions, club_bookings, open_mask, limit, use_numpy=None):
+    """
+    Calcule l'éligibilité de `clubs` (points entiers) à `competitions`
+    (places entières). `club_bookings` est indexé par identifiants
+    ({id du club: {id de la compétition: places}}), `open_mask` indique pour
+    chaque compétition si elle est encore ouverte et `limit` est le maximum
+    de places par club et par compétition.
+    """
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    club_ids = [club["id"] for club in clubs]
+    competition_ids = [comp["id"] for comp in competitions]
+    points = [club["points"] for club in clubs]
+    places = [comp["numberOfPlaces"] for comp in competitions]
+    open_mask = [bool(is_open) for is_open in open_mask]
+    if use_numpy:
+        max_bookable = _compute_numpy(
+            club_ids, competition_ids, points, places, club_bookings, open_mask, limit
+        )
+    else:
+        max_bookable = _compute_python(
+            club_ids, competition_ids, points, places, club_bookings, open_mask, limit
+        )
+    return Eligibility(club_ids, competition_ids, open_mask, max_bookable)
+
+
+def _compute_numpy(club_ids, competition_ids, points, places, club_bookings, open_mask, limit):
+    booked = numpy.zeros((len(club_ids), len(competition_ids)), dtype=numpy.int64)
+    column = {comp_id: index for index, comp_id in enumerate(competition_ids)}
+    rows, columns, values = [], [], []
+    for row, club_id in enumerate(club_ids):
+        for comp_id, count in club_bookings.get(club_id, {}).items():
+            if comp_id in column:
+                rows.append(row)
+                columns.append(column[comp_id])
+                values.append(count)
+    if rows:
+        booked[rows, columns] = values
+
+    result = numpy.minimum(
+        numpy.asarray(points, dtype=numpy.int64)[:, None],
+        numpy.asarray(places, dtype=numpy.int64)[None, :],
+    )
+    numpy.minimum(result, limit - booked, out=result)
+    numpy.maximum(result, 0, out=result)
+    result[:, ~numpy.asarray(open_mask, dtype=bool)] = 0
+    return result
+
+
+def _compute_python(club_ids, competition_ids, points, places, club_bookings, open_mask, limit):
+    columns = list(zip(competition_ids, places, open_mask))
+    max_bookable = []
+    for club_id, club_points in zip(club_ids, points):
+        booked = club_bookings.get(club_id, {})
+        max_bookable.append(
+            [
+                max(0, min(club_points, comp_places, limit - booked.get(comp_id, 0)))
+                if is_open
+                else 0
+                for comp_id, comp_places, is_open in columns
+            ]
+        )
+    return max_bookable
@@ -0,0 +1,34 @@
+"""
+AJOUT: Erreurs métier attendues des routes de connexion et de réservation.
+
+Les routes attrapaient toute exception (`except Exception`) et affichaient
+son texte: une réservation refusée, un formulaire incomplet ou un bug
+passaient par le même chemin. Les échecs attendus lèvent désormais une de ces
+exceptions, dont le message est destiné à l'utilisateur; elles sont traitées
+sans journaliser de trace de pile et leurs réponses sont précalculées (voir
+server.welcome_error). Toute autre exception est un bug: elle est journalisée
+et l'utilisateur ne voit qu'un message générique.
+"""
+
+
+class DomainError(Exception):
+    """Échec attendu d'une requête; `message` est affiché tel quel."""
+
+    def __init__(self, message):
+        super().__init__(message)
+        self.message = message
+
+
+class InvalidRequest(DomainError):
+    """Données du formulaire manquantes ou invalides."""
+
+
+class NotFound(DomainError):
+    """Club ou compétition introuvable."""
+
+
+class BookingRefused(DomainError):
+    """
+    Réservation refusée par une règle métier: compétition fermée ou complète,
+    places ou points insuffisants, limite de places par club.
+    """
@@ -0,0 +1,62 @@
+"""
+AJOUT: Diffusion en processus des changements de disponibilité des compétitions.
+
+Un unique `Publisher` reçoit les événements (par exemple après une réservation)
+et les recopie dans la file de chaque abonné. Chaque connexion Server-Sent
+Events possède sa propre file bornée: un client trop lent perd les événements
+les plus anciens au lieu de bloquer les réservations.
+"""
+
+import queue
+import threading
+
+
+class Publisher:
+    """Diffuseur d'événements vers des files d'abonnés."""
+
+    def __init__(self, max_queue_size=100):
+        self.max_queue_size = max_queue_size
+        self._lock = threading.Lock()
+        self._subscribers = set()
+
+    def subscribe(self):
+        """Crée et enregistre la file d'un nouvel abonné."""
+        subscriber = queue.Queue(maxsize=self.max_queue_size)
+        with self._lock:
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        """Retire la file d'un abonné (connexion fermée)."""
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def publish(self, event):
+        """
+        Envoie `event` à tous les abonnés sans jamais bloquer: si la file d'un
+        abonné est pleine, son plus ancien événement est abandonné.
+        """
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            while True:
+                try:
+                    subscriber.put_nowait(event)
+                    break
+                except queue.Full:
+                    try:
+                        subscriber.get_nowait()
+                    except queue.Empty:
+                        pass
+
+    def __len__(self):
+        with self._lock:
+            return len(self._subscribers)
+
+
+def format_sse(data, event=None):
+    """Formate un message Server-Sent Events (données déjà sérialisées)."""
+    message = f"data: {data}\n\n"
+    if event is not None:
+        message = f"event: {event}\n{message}"
+    return message
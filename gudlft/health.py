@@ -0,0 +1,46 @@
+"""
+AJOUT: Mesures en mémoire pour les sondes de santé (/healthz, /readyz).
+
+Les sondes du répartiteur de charge sont appelées très souvent: elles ne
+doivent ni lire de fichier ni prendre de verrou de données. Les routes de
+réservation enregistrent ici leurs durées (sauvegarde des fichiers, attente
+des verrous) au fil de l'eau, et les sondes n'en lisent qu'un résumé.
+"""
+
+import threading
+
+
+class LatencyGauge:
+    """
+    Dernière durée mesurée, moyenne mobile exponentielle (poids `alpha` de la
+    nouvelle mesure), maximum et nombre de mesures.
+    """
+
+    def __init__(self, alpha=0.2):
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        self._count = 0
+        self._last = None
+        self._average = None
+        self._max = None
+
+    def record(self, seconds):
+        with self._lock:
+            self._count += 1
+            self._last = seconds
+            if self._average is None:
+                self._average = seconds
+                self._max = seconds
+            else:
+                self._average += self.alpha * (seconds - self._average)
+                self._max = max(self._max, seconds)
+
+    def summary(self):
+        """Résumé en millisecondes ({"count", "lastMs", "avgMs", "maxMs"})."""
+        with self._lock:
+            values = (self._last, self._average, self._max)
+            count = self._count
+        last, average, maximum = (
+            None if value is None else round(value * 1000, 3) for value in values
+        )
+        return {"count": count, "lastMs": last, "avgMs": average, "maxMs": maximum}
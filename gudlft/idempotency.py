@@ -0,0 +1,85 @@
+"""
+AJOUT: Clés d'idempotence pour les demandes de réservation.
+
+Un client qui renvoie une réservation après un délai d'attente dépassé
+(même clé `Idempotency-Key`) reçoit le résultat de la première demande au lieu
+de déclencher une nouvelle réservation: pas de double débit de points et
+aucun accès aux fichiers pour la seconde demande.
+
+Les résultats récents sont conservés dans un magasin borné en mémoire
+(éviction LRU au-delà de `max_entries`, expiration après `ttl` secondes).
+Une demande répétée pendant le traitement de la première attend son résultat.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class IdempotencyEntry:
+    """Résultat, éventuellement encore en cours de calcul, d'une demande."""
+
+    __slots__ = ("done", "result", "expires_at")
+
+    def __init__(self, expires_at):
+        self.done = threading.Event()
+        self.result = None
+        self.expires_at = expires_at
+
+    def wait(self, timeout):
+        """Attend la fin de la première demande; renvoie son résultat ou None."""
+        self.done.wait(timeout)
+        return self.result
+
+
+class IdempotencyStore:
+    """Magasin LRU à expiration des résultats indexés par clé d'idempotence."""
+
+    def __init__(self, max_entries=10000, ttl=600, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def begin(self, key):
+        """
+        Enregistre le début d'une demande.
+        Renvoie (True, entrée) si la clé est nouvelle (la demande doit être
+        traitée puis terminée par `complete` ou `abandon`), sinon
+        (False, entrée existante).
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return False, entry
+            entry = IdempotencyEntry(now + self.ttl)
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return True, entry
+
+    def complete(self, entry, result):
+        """Enregistre le résultat de la demande et réveille les demandes en attente."""
+        entry.result = result
+        entry.expires_at = self._clock() + self.ttl
+        entry.done.set()
+
+    def abandon(self, key, entry):
+        """
+        Oublie une demande dont le résultat ne doit pas être réutilisé
+        (erreur transitoire): une nouvelle tentative sera traitée normalement.
+        """
+        with self._lock:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+        entry.done.set()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
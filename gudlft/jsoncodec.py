@@ -0,0 +1,112 @@
+"""
+AJOUT: Sélection d'un codec JSON rapide pour le chargement, la sauvegarde et l'API.
+
+Le module choisit au démarrage la bibliothèque la plus rapide disponible:
+
+1. orjson (sérialisation et analyse en Rust),
+2. msgspec,
+3. le module standard `json` en dernier recours.
+
+Ces dépendances sont optionnelles (`pip install gudlft[fast]`). Tous les
+backends décodent les documents sans schéma: les champs inconnus sont
+conservés et chaque enregistrement est ensuite converti et validé par
+l'application (loadClubs, loadCompetitions, assign_ids), de la même façon
+quel que soit le backend installé.
+"""
+
+import json
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    msgspec = None
+
+if orjson is not None:
+    BACKEND = "orjson"
+elif msgspec is not None:  # pragma: no cover - dépend de l'environnement
+    BACKEND = "msgspec"
+else:  # pragma: no cover - dépend de l'environnement
+    BACKEND = "json"
+
+# Exceptions levées par les différents backends pour un document invalide.
+# json.JSONDecodeError (et orjson.JSONDecodeError) héritent de ValueError.
+DECODE_ERRORS = (ValueError,)
+if msgspec is not None:  # pragma: no cover - dépend de l'environnement
+    DECODE_ERRORS += (msgspec.DecodeError,)
+
+
+def loads(data):
+    """Décode un document JSON (str ou bytes)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if msgspec is not None:  # pragma: no cover - dépend de l'environnement
+        return msgspec.json.decode(data)
+    return json.loads(data)  # pragma: no cover - dépend de l'environnement
+
+
+def load(fp):
+    """Décode le contenu d'un fichier ouvert."""
+    return loads(fp.read())
+
+
+def dumps(obj, indent=False, sort_keys=False, default=None):
+    """Sérialise `obj` en chaîne JSON compacte (ou indentée)."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+    if msgspec is not None:  # pragma: no cover - dépend de l'environnement
+        data = msgspec.json.encode(
+            obj, enc_hook=default, order="sorted" if sort_keys else None
+        )
+        if indent:
+            data = msgspec.json.format(data, indent=2)
+        return data.decode("utf-8")
+    return json.dumps(  # pragma: no cover - dépend de l'environnement
+        obj,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        sort_keys=sort_keys,
+        default=default,
+    )
+
+
+def dump(obj, fp):
+    """Sérialise `obj` dans un fichier ouvert en mode texte."""
+    if BACKEND == "json":  # pragma: no cover - dépend de l'environnement
+        json.dump(obj, fp)
+    else:
+        fp.write(dumps(obj))
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    Fournisseur JSON de Flask s'appuyant sur le codec sélectionné.
+    Les appels utilisant des options propres au module `json` sont délégués
+    au fournisseur par défaut.
+    """
+
+    def dumps(self, obj, **kwargs):
+        if BACKEND == "json" or set(kwargs) - {"indent", "separators"}:
+            return super().dumps(obj, **kwargs)
+        return dumps(
+            obj,
+            indent=bool(kwargs.get("indent")),
+            sort_keys=self.sort_keys,
+            default=self.default,
+        )
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return loads(s)
@@ -0,0 +1,181 @@
+"""
+AJOUT: Lecture incrémentale des enregistrements d'un fichier JSON.
+
+`jsoncodec.load` décode le document entier: le texte du fichier et tous les
+dictionnaires sont en mémoire en même temps, soit plusieurs fois la taille du
+fichier. Pour importer de très gros exports ({"clubs": [...]}), ce module
+renvoie les éléments de la liste un par un en ne gardant en mémoire que le
+bloc de texte en cours de lecture:
+
+- avec ijson s'il est installé (analyseur incrémental en C),
+- sinon par blocs, chaque élément étant décodé par `json.JSONDecoder.raw_decode`
+  dès que son texte est complet.
+"""
+
+import codecs
+import json
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    ijson = None
+
+CHUNK_SIZE = 1 << 16
+# Taille maximale du texte d'un élément (caractères): au-delà, le document est
+# refusé plutôt que lu en entier en mémoire
+MAX_ITEM_SIZE = 1 << 24
+
+_WHITESPACE = " \t\n\r"
+# Une valeur coupée en fin de bloc ("fals", "-", "\u12") est signalée au plus
+# à cette distance de la fin du tampon
+_TRUNCATED_TAIL = 6
+# Caractères pouvant continuer un nombre ("10000000000" puis ".0")
+_NUMBER_CHARS = "0123456789+-.eE"
+
+
+class JSONStreamError(ValueError):
+    """Document JSON invalide ou sans la liste d'enregistrements attendue."""
+
+
+def iter_items(
+    fp, root_key, use_ijson=None, chunk_size=CHUNK_SIZE, max_item_size=MAX_ITEM_SIZE
+):
+    """
+    Renvoie un par un les éléments de la liste `root_key` du document JSON
+    lu dans le fichier binaire `fp`. Lève JSONStreamError si le document est
+    invalide, si la liste est absente ou (sans ijson) si le texte d'un
+    élément dépasse `max_item_size` caractères.
+    """
+    if use_ijson is None:
+        use_ijson = ijson is not None
+    if use_ijson:
+        return _ijson_items(fp, root_key)
+    return _Reader(fp, chunk_size, max_item_size).items(root_key)
+
+
+def _ijson_items(fp, root_key):
+    found = []
+
+    def events():
+        for prefix, event, value in ijson.parse(fp, use_float=True):
+            if prefix == root_key and event == "start_array":
+                found.append(True)
+            yield prefix, event, value
+
+    try:
+        yield from ijson.items(events(), f"{root_key}.item")
+    except ijson.JSONError as e:
+        raise JSONStreamError(f"invalid JSON document ({e})") from e
+    if not found:
+        raise JSONStreamError(f"'{root_key}' list not found")
+
+
+class _Reader:
+    """Texte du fichier lu par blocs, décodé de l'UTF-8 au fil de l'eau."""
+
+    def __init__(self, fp, chunk_size, max_item_size=MAX_ITEM_SIZE):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._max_item_size = max_item_size
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self):
+        """
+        Ajoute le bloc suivant au tampon (en abandonnant le texte déjà lu).
+        Le bloc lu est au moins aussi grand que le tampon: un élément plus
+        grand qu'un bloc est décodé en temps linéaire.
+        """
+        if self._eof:
+            return False
+        self._buffer = self._buffer[self._pos:]
+        self._pos = 0
+        data = self._fp.read(max(self._chunk_size, len(self._buffer)))
+        if not data:
+            self._eof = True
+            self._buffer += self._text.decode(b"", final=True)
+            return False
+        self._buffer += self._text.decode(data)
+        return True
+
+    def _peek(self):
+        """Caractère suivant hors espaces ("" en fin de fichier)."""
+        while True:
+            buffer = self._buffer
+            while self._pos < len(buffer) and buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(buffer):
+                return buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char, message):
+        if self._peek() != char:
+            raise JSONStreamError(message)
+        self._pos += 1
+
+    def _value(self):
+        """
+        Décode la valeur suivante, en lisant des blocs tant qu'elle est
+        incomplète. Une erreur loin de la fin du tampon est une vraie erreur
+        de syntaxe: elle est signalée sans lire la suite du fichier.
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                truncated = (
+                    len(self._buffer) - e.pos <= _TRUNCATED_TAIL
+                    or e.msg.startswith("Unterminated string")
+                )
+                if truncated and self._fill_item():
+                    continue
+                raise JSONStreamError(f"invalid JSON document ({e.msg})") from None
+            # Un nombre en fin de tampon peut continuer dans le bloc suivant
+            if not self._buffer[end:].strip(_NUMBER_CHARS) and self._fill_item():
+                continue
+            self._pos = end
+            return value
+
+    def _fill_item(self):
+        """Lit le bloc suivant d'un élément incomplet, dans la limite de max_item_size."""
+        if len(self._buffer) - self._pos > self._max_item_size:
+            raise JSONStreamError(
+                f"item larger than {self._max_item_size} characters"
+            )
+        return self._fill()
+
+    def items(self, root_key):
+        self._expect("{", "document is not a JSON object")
+        if self._peek() == "}":
+            raise JSONStreamError(f"'{root_key}' list not found")
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise JSONStreamError("invalid JSON document (object key)")
+            self._expect(":", "invalid JSON document (expected ':')")
+            if key == root_key:
+                yield from self._array(root_key)
+                return
+            # Valeur d'une autre clé: décodée puis ignorée
+            self._value()
+            if self._peek() != ",":
+                self._expect("}", "invalid JSON document (expected ',' or '}')")
+                raise JSONStreamError(f"'{root_key}' list not found")
+            self._pos += 1
+
+    def _array(self, root_key):
+        self._expect("[", f"'{root_key}' is not a list")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            if self._peek() != ",":
+                self._expect("]", "invalid JSON document (expected ',' or ']')")
+                return
+            self._pos += 1
@@ -0,0 +1,110 @@
+"""
+AJOUT: Classement des clubs par points.
+
+Le classement est tenu à jour au lieu d'être recalculé: les clubs sont rangés
+dans une liste triée par (-points, nom), si bien que
+
+- le débit des points d'un club (réservation) déplace une seule entrée:
+  O(log n) avec sortedcontainers,
+- les N premiers clubs se lisent directement en tête de liste,
+- le rang d'un club est le nombre de clubs ayant strictement plus de points
+  plus un (les ex aequo partagent le même rang), trouvé par dichotomie.
+
+Sans sortedcontainers, une liste Python maintenue avec bisect est utilisée
+(recherche en O(log n), insertion en O(n) mais par simple décalage mémoire).
+"""
+
+import bisect
+import threading
+
+try:
+    from sortedcontainers import SortedList
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    SortedList = None
+
+
+class _BisectList:
+    """Sous-ensemble de l'interface de SortedList, basé sur bisect."""
+
+    def __init__(self, iterable=()):
+        self._items = sorted(iterable)
+
+    def add(self, value):
+        bisect.insort(self._items, value)
+
+    def remove(self, value):
+        index = bisect.bisect_left(self._items, value)
+        if index == len(self._items) or self._items[index] != value:
+            raise ValueError(f"{value!r} not in list")
+        del self._items[index]
+
+    def bisect_left(self, value):
+        return bisect.bisect_left(self._items, value)
+
+    def islice(self, start=None, stop=None):
+        return iter(self._items[start:stop])
+
+    def __len__(self):
+        return len(self._items)
+
+
+def _sorted_list(iterable=()):
+    if SortedList is not None:
+        return SortedList(iterable)
+    return _BisectList(iterable)
+
+
+class Leaderboard:
+    """
+    Classement des clubs par points décroissants (nom croissant en cas
+    d'égalité). `lock` protège les mises à jour et les lectures.
+    """
+
+    def __init__(self, clubs=()):
+        self.lock = threading.Lock()
+        self.reset(clubs)
+
+    def reset(self, clubs):
+        """Reconstruit le classement à partir de la liste complète des clubs."""
+        self._points = {}
+        for club in clubs:
+            self._points.setdefault(club["name"], club["points"])
+        self._entries = _sorted_list(
+            (-points, name) for name, points in self._points.items()
+        )
+
+    def update(self, name, points):
+        """Déplace un club après la modification de ses points."""
+        old_points = self._points.get(name)
+        if old_points == points:
+            return
+        if old_points is not None:
+            self._entries.remove((-old_points, name))
+        self._entries.add((-points, name))
+        self._points[name] = points
+
+    def top(self, limit=None):
+        """
+        Renvoie les `limit` premiers clubs (tous si None) sous la forme
+        [{"name", "points", "rank"}].
+        """
+        rows = []
+        rank = 0
+        previous = None
+        for position, (negated, name) in enumerate(
+            self._entries.islice(0, limit), start=1
+        ):
+            if negated != previous:
+                rank, previous = position, negated
+            rows.append({"name": name, "points": -negated, "rank": rank})
+        return rows
+
+    def rank(self, name):
+        """Rang du club (1 pour le premier), ou None si le club est inconnu."""
+        points = self._points.get(name)
+        if points is None:
+            return None
+        return self._entries.bisect_left((-points,)) + 1
+
+    def __len__(self):
+        return len(self._entries)
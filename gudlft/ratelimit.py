@@ -0,0 +1,113 @@
+"""
+AJOUT: Limitation de débit par seaux à jetons (token buckets).
+
+Rien ne limitait la fréquence des appels à /showSummary (énumération des
+emails) ou à /purchasePlaces, alors que chaque réservation relit et réécrit
+les fichiers de données. Chaque client dispose d'un seau par clé (adresse IP,
+club) et par route:
+
+- le seau contient au plus `capacity` jetons (rafale autorisée),
+- il se remplit de `capacity` jetons par `period` secondes,
+- chaque requête consomme un jeton; un seau vide fait refuser la requête
+  (réponse 429 avec Retry-After).
+
+Deux backends sont disponibles:
+
+- `MemoryRateLimiter`: en mémoire du processus, sans verrou (voir consume),
+- `CacheRateLimiter`: dans un cache Flask-Caching, partagé entre processus si
+  le cache l'est (Redis, Memcached...).
+"""
+
+import math
+import time
+
+
+def _refill(state, capacity, period, now):
+    """Nombre de jetons d'un seau à l'instant `now` (plein s'il est nouveau)."""
+    if state is None:
+        return float(capacity)
+    tokens, updated = state
+    return min(float(capacity), tokens + (now - updated) * capacity / period)
+
+
+def _take(state, capacity, period, now):
+    """
+    Consomme un jeton du seau `state` ((jetons, date de mise à jour) ou None).
+    Renvoie (autorisé, nouvel état, secondes avant le prochain jeton).
+    """
+    tokens = _refill(state, capacity, period, now)
+    if tokens >= 1:
+        return True, (tokens - 1, now), 0
+    retry_after = (1 - tokens) * period / capacity
+    return False, (tokens, now), retry_after
+
+
+class MemoryRateLimiter:
+    """
+    Seaux à jetons en mémoire du processus.
+
+    Le chemin critique ne prend aucun verrou: l'état d'un seau est un tuple
+    immuable lu puis remplacé en une affectation (atomique avec le GIL). Deux
+    requêtes simultanées pour la même clé peuvent au pire consommer le même
+    jeton, ce qui reste acceptable pour une protection contre les abus.
+    Au-delà de `max_keys` seaux, les seaux redevenus pleins sont oubliés.
+    """
+
+    def __init__(self, max_keys=100000, clock=time.monotonic):
+        self.max_keys = max_keys
+        self._clock = clock
+        self._buckets = {}
+
+    def consume(self, key, capacity, period):
+        """
+        Consomme un jeton pour `key`. Renvoie (autorisé, secondes avant le
+        prochain jeton disponible).
+        """
+        now = self._clock()
+        allowed, state, retry_after = _take(
+            self._buckets.get(key), capacity, period, now
+        )
+        self._buckets[key] = state
+        if len(self._buckets) > self.max_keys:
+            self._prune(now, period)
+        return allowed, retry_after
+
+    def _prune(self, now, period):
+        """
+        Oublie les seaux inactifs depuis au moins `period` secondes (donc de
+        nouveau pleins), puis les plus anciens s'il en reste trop.
+        """
+        buckets = dict(self._buckets)
+        idle = [key for key, (_, updated) in buckets.items() if now - updated >= period]
+        for key in idle:
+            buckets.pop(key, None)
+        if len(buckets) > self.max_keys:
+            oldest = sorted(buckets, key=lambda key: buckets[key][1])
+            for key in oldest[: len(buckets) - self.max_keys // 2]:
+                del buckets[key]
+        self._buckets = buckets
+
+    def __len__(self):
+        return len(self._buckets)
+
+
+class CacheRateLimiter:
+    """
+    Seaux à jetons stockés dans un cache Flask-Caching (clé "ratelimit:<clé>"),
+    qui expirent une fois le seau de nouveau plein.
+    La lecture et l'écriture d'un seau ne sont pas atomiques entre processus:
+    la limite est approximative sous forte concurrence.
+    """
+
+    def __init__(self, cache, clock=time.time):
+        self.cache = cache
+        self._clock = clock
+
+    def consume(self, key, capacity, period):
+        cache_key = f"ratelimit:{key}"
+        now = self._clock()
+        allowed, state, retry_after = _take(
+            self.cache.get(cache_key), capacity, period, now
+        )
+        self.cache.set(cache_key, state, timeout=math.ceil(period))
+        return allowed, retry_after
@@ -0,0 +1,425 @@
+"""
+AJOUT: Rejeu du journal d'audit pour vérifier et reconstruire les données.
+
+clubs.json, competitions.json et bookings.json sont écrits l'un après l'autre
+par process_booking: une mise à jour perdue ou un arrêt entre deux écritures
+les rend incohérents sans que rien ne le signale. Le journal d'audit
+(audit.py) contient chaque réservation effectuée; le rejouer permet de
+recalculer, à partir des valeurs du point de reprise:
+
+- le total réservé par chaque club pour chaque compétition (bookings.json),
+- les points de chaque club, diminués d'un point par place réservée
+  (clubs.json),
+- les places de chaque compétition, diminuées des places réservées
+  (competitions.json),
+
+puis de comparer ces valeurs aux fichiers (`gudlft verify`) ou de les y
+écrire (`gudlft rebuild`). Le journal est lu ligne à ligne et agrégé par
+blocs: la mémoire utilisée dépend du nombre de clubs et de compétitions, pas
+du nombre d'événements. Les blocs sont agrégés avec numpy s'il est installé,
+sinon en Python pur.
+
+Le journal ne contient pas tout l'historique (réservations antérieures au
+journal, copies tournées supprimées, journal désactivé): le rejeu part d'un
+point de reprise (`gudlft checkpoint`) qui enregistre les totaux de
+bookings.json, les points des clubs, les places des compétitions et la
+position atteinte dans le journal. Seuls les événements suivants sont
+rejoués, et les données ne sont réécrites que si le journal remonte jusqu'au
+point de reprise sans événement manquant. Les valeurs attendues sont des
+sommes: elles ne dépendent pas de l'ordre des événements, qui n'est pas
+l'ordre des réservations entre les journaux de plusieurs processus. Les
+clubs, compétitions et paires club/compétition sans réservation depuis le
+point de reprise ne sont ni vérifiés ni modifiés.
+"""
+
+import os
+import re
+from collections import namedtuple
+
+from . import jsoncodec
+from .validation import assign_ids
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    numpy = None
+
+CHUNK_SIZE = 65536
+
+# Écart entre les fichiers et le journal: type ("points", "places" ou
+# "bookings"), clé (nom du club, de la compétition ou "club_compétition"),
+# valeur enregistrée et valeur attendue d'après le point de reprise et le journal
+Mismatch = namedtuple("Mismatch", ["kind", "key", "stored", "expected"])
+
+# Identifiant du journal et numéro d'un événement (voir audit.AuditLog.record),
+# lus sans décoder la ligne
+_POSITION = re.compile(rb'"log":\s*"(\w+)",\s*"seq":\s*(\d+)')
+
+
+class IncompleteJournalError(RuntimeError):
+    """Le journal ne couvre pas toutes les réservations depuis le point de reprise."""
+
+
+class Replay:
+    """
+    Agrégats des réservations du journal pour les clubs et les compétitions
+    donnés (identifiés par leur "id"). Les événements visant un club ou une
+    compétition inconnus (archivés, supprimés) sont comptés dans `unknown`.
+
+    `positions` ({identifiant du journal: numéro}) est la position du point
+    de reprise: les événements jusqu'à cette position sont ignorés
+    (`skipped`), comme ceux écrits avant la numérotation. Les numéros absents
+    après le point de reprise sont comptés dans `missing`; `reached` contient
+    les journaux dont l'événement du point de reprise a été retrouvé.
+    """
+
+    def __init__(
+        self, clubs, competitions, positions=None, use_numpy=None, chunk_size=CHUNK_SIZE
+    ):
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        self.use_numpy = use_numpy
+        self.chunk_size = chunk_size
+        self.club_ids = [club["id"] for club in clubs]
+        self.competition_ids = [comp["id"] for comp in competitions]
+        self._club_index = {club_id: i for i, club_id in enumerate(self.club_ids)}
+        self._competition_index = {
+            comp_id: i for i, comp_id in enumerate(self.competition_ids)
+        }
+        self._checkpoint = dict(positions or {})
+        self.positions = dict(self._checkpoint)
+        self.reached = set()
+        self.events = 0
+        self.unknown = 0
+        self.invalid_lines = 0
+        self.skipped = 0
+        self.missing = 0
+        self._chunk = ([], [], [])
+        if use_numpy:
+            shape = (len(self.club_ids), len(self.competition_ids))
+            self._totals = numpy.zeros(shape, dtype=numpy.int64)
+        else:
+            self._totals = {}
+
+    def feed(self, paths):
+        """Rejoue les réservations des fichiers `paths` (du plus ancien au plus récent)."""
+        for path in paths:
+            with open(path, "rb") as f:
+                for line in f:
+                    position = _POSITION.search(line)
+                    if position is None:
+                        self._unnumbered(line)
+                        continue
+                    if not self._advance(position.group(1).decode(), int(position.group(2))):
+                        continue
+                    # Filtre rapide avant décodage: seules les réservations
+                    # effectuées modifient les données
+                    if b'"booked"' not in line:
+                        continue
+                    try:
+                        event = jsoncodec.loads(line)
+                    except jsoncodec.DECODE_ERRORS:
+                        self.invalid_lines += 1
+                        continue
+                    if event.get("outcome") == "booked":
+                        self._add(event)
+        self._flush()
+        return self
+
+    def _unnumbered(self, line):
+        """Ligne sans numéro: événement antérieur à la numérotation ou ligne illisible."""
+        try:
+            jsoncodec.loads(line)
+        except jsoncodec.DECODE_ERRORS:
+            self.invalid_lines += 1
+        else:
+            self.skipped += 1
+
+    def _advance(self, log, seq):
+        """
+        Avance la position du journal `log` jusqu'à l'événement `seq`; renvoie
+        False si l'événement précède le point de reprise.
+        """
+        checkpoint = self._checkpoint.get(log, 0)
+        if seq <= checkpoint:
+            if seq == checkpoint:
+                self.reached.add(log)
+            self.skipped += 1
+            return False
+        last = self.positions.get(log, 0)
+        if seq > last + 1:
+            self.missing += seq - last - 1
+        self.positions[log] = max(last, seq)
+        return True
+
+    def _add(self, event):
+        club = self._club_index.get(event.get("clubId"))
+        competition = self._competition_index.get(event.get("competitionId"))
+        if club is None or competition is None:
+            self.unknown += 1
+            return
+        self.events += 1
+        clubs, competitions, places = self._chunk
+        clubs.append(club)
+        competitions.append(competition)
+        places.append(event["places"])
+        if len(clubs) >= self.chunk_size:
+            self._flush()
+
+    def _flush(self):
+        if not self._chunk[0]:
+            return
+        if self.use_numpy:
+            self._aggregate_numpy(*self._chunk)
+        else:
+            self._aggregate_python(*self._chunk)
+        self._chunk = ([], [], [])
+
+    def _aggregate_numpy(self, clubs, competitions, places):
+        numpy.add.at(
+            self._totals,
+            (numpy.asarray(clubs, dtype=numpy.intp),
+             numpy.asarray(competitions, dtype=numpy.intp)),
+            numpy.asarray(places, dtype=numpy.int64),
+        )
+
+    def _aggregate_python(self, clubs, competitions, places):
+        totals = self._totals
+        for club, competition, count in zip(clubs, competitions, places):
+            totals[club, competition] = totals.get((club, competition), 0) + count
+
+    def totals(self):
+        """Places réservées d'après le journal: {(id du club, id de la compétition): places}."""
+        if self.use_numpy:
+            clubs, competitions = numpy.nonzero(self._totals)
+            pairs = zip(clubs.tolist(), competitions.tolist())
+            values = self._totals[clubs, competitions].tolist()
+        else:
+            pairs = list(self._totals)
+            values = list(self._totals.values())
+        return {
+            (self.club_ids[club], self.competition_ids[competition]): value
+            for (club, competition), value in zip(pairs, values)
+            if value
+        }
+
+    def club_totals(self):
+        """Places réservées par chaque club, toutes compétitions: {id du club: places}."""
+        return self._sums(0, self.club_ids)
+
+    def competition_totals(self):
+        """Places réservées pour chaque compétition: {id de la compétition: places}."""
+        return self._sums(1, self.competition_ids)
+
+    def _sums(self, axis, ids):
+        if self.use_numpy:
+            sums = self._totals.sum(axis=1 - axis)
+            indexes = numpy.nonzero(sums)[0]
+            return dict(zip((ids[i] for i in indexes.tolist()), sums[indexes].tolist()))
+        sums = {}
+        for pair, value in self._totals.items():
+            sums[ids[pair[axis]]] = sums.get(ids[pair[axis]], 0) + value
+        return {key: value for key, value in sums.items() if value}
+
+
+def _load(path, root_key=None):
+    with open(path, "rb") as f:
+        data = jsoncodec.loads(f.read())
+    return data if root_key is None else data[root_key]
+
+
+def _load_bookings(path):
+    try:
+        return _load(path)
+    except FileNotFoundError:
+        return {}
+
+
+def journal_positions(paths):
+    """Dernier numéro de chaque journal dans les fichiers `paths`: {identifiant: numéro}."""
+    positions = {}
+    for path in paths:
+        with open(path, "rb") as f:
+            for line in f:
+                position = _POSITION.search(line)
+                if position is not None:
+                    log = position.group(1).decode()
+                    positions[log] = max(positions.get(log, 0), int(position.group(2)))
+    return positions
+
+
+def _counters(clubs, competitions):
+    """Points des clubs et places des compétitions, par identifiant (texte)."""
+    return {
+        "points": {str(club["id"]): int(club["points"]) for club in clubs},
+        "places": {str(comp["id"]): int(comp["numberOfPlaces"]) for comp in competitions},
+    }
+
+
+def create_checkpoint(clubs_path, competitions_path, bookings_path, journal):
+    """
+    Point de reprise: points des clubs, places des compétitions, totaux de
+    bookings.json et position de fin du journal (fichiers `journal`). À créer
+    application arrêtée, le journal étant alors entièrement écrit.
+    """
+    return {
+        "positions": journal_positions(journal),
+        "bookings": _load_bookings(bookings_path),
+        **_counters(
+            assign_ids(_load(clubs_path, "clubs")),
+            assign_ids(_load(competitions_path, "competitions")),
+        ),
+    }
+
+
+def load_checkpoint(path):
+    return _load(path)
+
+
+def save_checkpoint(path, checkpoint):
+    _write(path, checkpoint)
+
+
+class Verification:
+    """
+    Données chargées, rejeu du journal depuis le point de reprise `checkpoint`
+    (voir create_checkpoint), écarts trouvés (`mismatches`) et valeurs
+    modifiées sans réservation dans le journal (`unverifiable`: points, places
+    ou totaux qui diffèrent du point de reprise pour des clubs, compétitions
+    ou paires absents du journal).
+    `problems` explique pourquoi le journal est incomplet, le cas échéant.
+    """
+
+    def __init__(
+        self, clubs_path, competitions_path, bookings_path, journal, checkpoint,
+        use_numpy=None,
+    ):
+        self.paths = (clubs_path, competitions_path, bookings_path)
+        self.clubs = assign_ids(_load(clubs_path, "clubs"))
+        self.competitions = assign_ids(_load(competitions_path, "competitions"))
+        self.bookings = _load_bookings(bookings_path)
+        self.checkpoint = checkpoint
+        self.replay = Replay(
+            self.clubs, self.competitions, checkpoint["positions"], use_numpy
+        ).feed(journal)
+        self.problems = self._problems()
+        self.unverifiable = []
+        self.mismatches = self._compare()
+
+    def _problems(self):
+        problems = []
+        unreached = set(self.checkpoint["positions"]) - self.replay.reached
+        if unreached:
+            problems.append(
+                f"the journal does not reach back to the checkpoint ({len(unreached)} log(s))"
+            )
+        if self.replay.missing:
+            problems.append(f"{self.replay.missing} event(s) missing from the journal")
+        if self.replay.invalid_lines:
+            problems.append(f"{self.replay.invalid_lines} invalid line(s) in the journal")
+        return problems
+
+    def _compare(self):
+        mismatches = []
+        expected_points, expected_places = self.expected_counters()
+        for kind, records, field, expected_values in (
+            ("points", self.clubs, "points", expected_points),
+            ("places", self.competitions, "numberOfPlaces", expected_places),
+        ):
+            initial = self.checkpoint.get(kind, {})
+            for record in records:
+                stored = int(record[field])
+                if record["id"] in expected_values:
+                    expected = expected_values[record["id"]]
+                    if stored != expected:
+                        mismatches.append(Mismatch(kind, record["name"], stored, expected))
+                elif str(record["id"]) in initial and stored != initial[str(record["id"])]:
+                    self.unverifiable.append(
+                        Mismatch(kind, record["name"], stored, initial[str(record["id"])])
+                    )
+        expected_bookings = self.expected_bookings()
+        initial = self.checkpoint["bookings"]
+        # Seules les paires présentes dans les fichiers, le point de reprise ou
+        # le journal peuvent différer (les autres valent 0 partout)
+        for key in sorted(set(self.bookings) | set(initial) | set(expected_bookings)):
+            stored = int(self.bookings.get(key, 0))
+            if key in expected_bookings:
+                if stored != expected_bookings[key]:
+                    mismatches.append(
+                        Mismatch("bookings", key, stored, expected_bookings[key])
+                    )
+            elif stored != int(initial.get(key, 0)):
+                self.unverifiable.append(
+                    Mismatch("bookings", key, stored, int(initial.get(key, 0)))
+                )
+        return mismatches
+
+    def expected_counters(self):
+        """
+        Points et places attendus ({id: valeur}) pour les clubs et les
+        compétitions réservés depuis le point de reprise: valeur du point de
+        reprise moins les places réservées (un point par place). Les
+        enregistrements absents du point de reprise ne sont pas vérifiables.
+        """
+        expected = []
+        for kind, totals in (
+            ("points", self.replay.club_totals()),
+            ("places", self.replay.competition_totals()),
+        ):
+            initial = self.checkpoint.get(kind, {})
+            expected.append({
+                record_id: initial[str(record_id)] - booked
+                for record_id, booked in totals.items()
+                if str(record_id) in initial
+            })
+        return expected
+
+    def expected_bookings(self):
+        """
+        Totaux attendus pour les paires club/compétition réservées depuis le
+        point de reprise: total du point de reprise plus réservations du journal.
+        """
+        clubs = {club["id"]: club["name"] for club in self.clubs}
+        competitions = {comp["id"]: comp["name"] for comp in self.competitions}
+        initial = self.checkpoint["bookings"]
+        expected = {}
+        for (club_id, comp_id), total in self.replay.totals().items():
+            key = f"{clubs[club_id]}_{competitions[comp_id]}"
+            expected[key] = int(initial.get(key, 0)) + total
+        return expected
+
+    def repair(self):
+        """
+        Écrit dans les fichiers les valeurs attendues (remplacement atomique).
+        Lève IncompleteJournalError si le journal est incomplet; les valeurs
+        absentes du journal ne sont pas modifiées.
+        """
+        if self.problems:
+            raise IncompleteJournalError("; ".join(self.problems))
+        clubs_path, competitions_path, bookings_path = self.paths
+        points, places = self.expected_counters()
+        for club in self.clubs:
+            if club["id"] in points:
+                club["points"] = str(points[club["id"]])
+        for comp in self.competitions:
+            if comp["id"] in places:
+                comp["numberOfPlaces"] = str(places[comp["id"]])
+        self.bookings.update(self.expected_bookings())
+        _write(clubs_path, {"clubs": self.clubs})
+        _write(competitions_path, {"competitions": self.competitions})
+        _write(bookings_path, self.bookings)
+
+    def next_checkpoint(self):
+        """Point de reprise à la fin du journal rejoué, pour les données actuelles."""
+        return {
+            "positions": dict(self.replay.positions),
+            "bookings": dict(self.bookings),
+            **_counters(self.clubs, self.competitions),
+        }
+
+
+def _write(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        jsoncodec.dump(data, f)
+    os.replace(tmp_path, path)
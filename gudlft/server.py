@@ -33,7 +33,15 @@ AMÉLIORATIONS MAJEURES PAR RAPPORT AU REPOSITORY ORIGINAL:
 --------------------------------------------------------------------------------
 """
 
-import json
+import atexit
+import hmac
+import math
+import os
+import queue
+import threading
+import time
+import uuid
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
 from flask import (
     Flask,
@@ -41,22 +49,310 @@ from flask import (
     request,
     redirect,
     flash,
+    g,
+    get_flashed_messages,
     url_for,
+    make_response,
+    session,
+    Response,
 )
+from markupsafe import Markup
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
 from flask_caching import (
     Cache,
 )  # AJOUT: Système de cache pour optimiser les performances
+from . import compiled, compression, eligibility, jsoncodec
+from .admission import AdmissionController, AdmissionRejected
+from .archive import Archive, PeriodicTask
+from .audit import AuditLog
+from .errors import BookingRefused, DomainError, InvalidRequest, NotFound
+from .events import Publisher, format_sse
+from .health import LatencyGauge
+from .idempotency import IdempotencyStore
+from .ranking import Leaderboard
+from .ratelimit import CacheRateLimiter, MemoryRateLimiter
+from .sessions import CacheSessionBackend, MemorySessionBackend
+from .shards import ClubLocks, SharedLock, ShardRouter, booking_locks
+from .store import (
+    CLUB_LAYOUT,
+    COMPETITION_LAYOUT,
+    RecordStore,
+    StoreError,
+)
+from .validation import assign_ids, normalize_email, parse_date, parse_id
+from .views import DataView
 
 app = Flask(__name__)
 app.secret_key = "something_special"
+# AJOUT: Fournisseur JSON rapide (orjson/msgspec si installés, sinon json standard)
+app.json = jsoncodec.FastJSONProvider(app)
 
 # AJOUT: Configuration du cache pour optimiser les performances
 # Cache SimpleCache en mémoire, idéal pour le développement
 cache = Cache(app, config={"CACHE_TYPE": "SimpleCache"})
 
-# Global variables
-clubs = []
-competitions = []
+# AJOUT: Backend de stockage des données ("json" par défaut, ou "mmap" pour les
+# fichiers d'enregistrements de taille fixe mis à jour en place, voir store.py)
+app.config.setdefault("DATA_BACKEND", os.environ.get("GUDLFT_DATA_BACKEND", "json"))
+
+# AJOUT: Fichiers d'enregistrements et fichiers JSON servant d'import/export
+STORES = {
+    "clubs": ("clubs.dat", "clubs.json", CLUB_LAYOUT),
+    "competitions": ("competitions.dat", "competitions.json", COMPETITION_LAYOUT),
+}
+_open_stores = {}
+
+# AJOUT: Compression des réponses selon Accept-Encoding (voir compression.py)
+app.config.setdefault("COMPRESS_RESPONSES", True)
+# Taille minimale (octets) d'une réponse pour la compresser à la volée
+app.config.setdefault("COMPRESS_MIN_SIZE", 500)
+
+# AJOUT: Instantané binaire produit par `gudlft compile-data` (voir compiled.py),
+# utilisé au chargement tant que clubs.json et competitions.json n'ont pas changé
+app.config.setdefault(
+    "SNAPSHOT_PATH", os.environ.get("GUDLFT_SNAPSHOT", "data.snapshot")
+)
+
+# AJOUT: Diffuseur des changements de places des compétitions (flux SSE)
+competition_publisher = Publisher()
+# Intervalle (secondes) des commentaires keep-alive envoyés sur les flux SSE
+app.config.setdefault("SSE_KEEPALIVE", 15)
+
+# AJOUT: Contrôle d'admission des réservations par compétition (voir admission.py)
+admission_controller = AdmissionController()
+# Nombre maximal de réservations en attente par compétition
+app.config.setdefault("ADMISSION_MAX_WAITING", 32)
+# Attente maximale (secondes) avant de refuser une réservation
+app.config.setdefault("ADMISSION_TIMEOUT", 5)
+# Valeur de l'en-tête Retry-After (secondes) des réponses 429
+app.config.setdefault("ADMISSION_RETRY_AFTER", 1)
+
+# AJOUT: Partitionnement des compétitions en shards verrouillés séparément et
+# verrous par club pour le débit des points (voir shards.py)
+app.config.setdefault("SHARD_COUNT", int(os.environ.get("GUDLFT_SHARD_COUNT", 16)))
+shard_router = ShardRouter(app.config["SHARD_COUNT"])
+club_locks = ClubLocks()
+# Verrou des données partagées par tous les shards: exclusif pour le
+# rechargement des fichiers et l'archivage, partagé pour les réservations
+# (voir shards.SharedLock)
+_data_lock = SharedLock()
+# AJOUT: Réécriture des fichiers JSON complets (backend "json"), une à la fois
+_json_files_lock = threading.Lock()
+
+# AJOUT: Résultats récents des réservations par clé d'idempotence
+app.config.setdefault("IDEMPOTENCY_MAX_ENTRIES", 10000)
+app.config.setdefault("IDEMPOTENCY_TTL", 600)
+# Attente maximale (secondes) du résultat d'une demande identique en cours
+app.config.setdefault("IDEMPOTENCY_WAIT", 10)
+idempotency_store = IdempotencyStore(
+    app.config["IDEMPOTENCY_MAX_ENTRIES"], app.config["IDEMPOTENCY_TTL"]
+)
+
+# AJOUT: Archivage périodique des compétitions passées (voir archive.py)
+app.config.setdefault(
+    "ARCHIVE_PATH", os.environ.get("GUDLFT_ARCHIVE", "archive.json")
+)
+# Intervalle (secondes) entre deux archivages; 0 désactive la tâche de fond
+app.config.setdefault("ARCHIVE_INTERVAL", 3600)
+# Démarrage de la tâche de fond à l'initialisation de l'application (sous
+# tout serveur WSGI); désactivé avec GUDLFT_ARCHIVE_SCHEDULER=0
+app.config.setdefault(
+    "ARCHIVE_SCHEDULER", os.environ.get("GUDLFT_ARCHIVE_SCHEDULER") != "0"
+)
+archive_task = None
+
+# AJOUT: Sessions côté serveur du club connecté (voir sessions.py): "memory"
+# (processus courant) ou "cache" (cache Flask-Caching, partageable)
+app.config.setdefault(
+    "SESSION_BACKEND", os.environ.get("GUDLFT_SESSION_BACKEND", "memory")
+)
+app.config.setdefault("SESSION_TTL", 1800)
+app.config.setdefault("SESSION_MAX_ENTRIES", 10000)
+app.config.setdefault("SESSION_ID_COOKIE", "gudlft_session")
+# Si True, book et purchasePlaces exigent un club connecté
+app.config.setdefault("REQUIRE_LOGIN", False)
+_session_store = None
+
+# AJOUT: Limitation de débit par adresse IP et par club (voir ratelimit.py):
+# "memory" (processus courant) ou "cache" (cache Flask-Caching, partageable)
+# (GUDLFT_RATELIMIT=0 la désactive, par exemple pour les tests de charge)
+app.config.setdefault("RATELIMIT_ENABLED", os.environ.get("GUDLFT_RATELIMIT") != "0")
+app.config.setdefault(
+    "RATELIMIT_BACKEND", os.environ.get("GUDLFT_RATELIMIT_BACKEND", "memory")
+)
+# Limites par route: {endpoint: {"ip" ou "club": (requêtes, période en secondes)}}
+app.config.setdefault(
+    "RATE_LIMITS",
+    {
+        "showSummary": {"ip": (10, 60), "club": (10, 60)},
+        "purchasePlaces": {"ip": (30, 60), "club": (10, 60)},
+        "api_eligibility": {"ip": (30, 60)},
+    },
+)
+_rate_limiter = None
+
+# AJOUT: Jeton des routes d'administration (en-tête "Authorization: Bearer
+# <jeton>"); sans jeton configuré, ces routes sont refusées
+app.config.setdefault("ADMIN_TOKEN", os.environ.get("GUDLFT_ADMIN_TOKEN"))
+# Nombre maximal de clubs par page de la matrice d'éligibilité
+app.config.setdefault("ELIGIBILITY_PAGE_SIZE", 1000)
+
+# AJOUT: Journal d'audit des demandes de réservation (voir audit.py), écrit
+# par un thread de fond dans des fichiers JSON lines tournants
+app.config.setdefault("AUDIT_ENABLED", True)
+app.config.setdefault(
+    "AUDIT_PATH", os.environ.get("GUDLFT_AUDIT_PATH", "audit.jsonl")
+)
+# Nombre d'événements en attente d'écriture au-delà duquel les plus anciens
+# sont abandonnés (et comptés)
+app.config.setdefault("AUDIT_BUFFER_SIZE", 10000)
+app.config.setdefault("AUDIT_MAX_BYTES", 10_000_000)
+app.config.setdefault("AUDIT_BACKUP_COUNT", 5)
+app.config.setdefault("AUDIT_FLUSH_INTERVAL", 1.0)
+_audit_log = None
+
+# AJOUT: Mode sans session pour les messages des routes de réservation: les
+# messages sont rendus dans la réponse ou transmis par un code dans l'URL au
+# lieu d'être stockés dans le cookie de session (aucun Set-Cookie, réponses
+# cachables par un proxy)
+app.config.setdefault(
+    "SESSIONLESS_MESSAGES", os.environ.get("GUDLFT_SESSIONLESS_MESSAGES") == "1"
+)
+# Codes des messages transmis à la page d'accueil en mode sans session
+MESSAGE_CODES = {
+    "email-required": "Please provide an email",
+    "unknown-email": "Unknown email, please try again",
+    "club-not-found": "Club not found",
+    "competition-not-found": "Competition not found",
+    "missing-information": "Error: Missing required information",
+    "invalid-places": "Error: Invalid number of places",
+    "not-found": "Error: Club or competition not found",
+    "error": "An error occurred, please try again",
+}
+_MESSAGE_CODES_BY_TEXT = {message: code for code, message in MESSAGE_CODES.items()}
+
+# AJOUT: Limite de places réservées par un club pour une compétition
+MAX_PLACES_PER_COMPETITION = 12
+
+# AJOUT: Vue immuable courante des données (clubs, compétitions, index par
+# email normalisé et par nom, agrégats des réservations), voir views.py.
+# Sa version, incrémentée à chaque changement, sert de clé aux fragments de
+# templates mis en cache.
+_view = DataView(0, (), (), {})
+_data_signature = None
+
+# AJOUT: État lu par les sondes /healthz et /readyz, sans accès disque:
+# dates (timestamps) du dernier chargement des fichiers et de la dernière
+# sauvegarde réussie, durées des sauvegardes et de l'attente des verrous
+_started_at = time.time()
+_last_load = None
+# Erreurs du dernier chargement des clubs et des compétitions ({type: message}):
+# une liste vide renvoyée par loadClubs ne distingue pas un fichier invalide
+# d'un fichier sans enregistrement
+_load_errors = {}
+_last_save = None
+save_latency = LatencyGauge()
+lock_latency = LatencyGauge()
+
+# AJOUT: Classement des clubs par points (voir ranking.py), mis à jour avec
+# chaque nouvelle vue sous son verrou
+leaderboard = Leaderboard()
+
+# AJOUT: Dates des compétitions déjà analysées ({date texte: datetime}),
+# préremplies par l'instantané précompilé
+_competition_dates = {}
+
+# AJOUT: Durée de vie des fragments en cache. La liste des compétitions dépend
+# aussi de l'heure (compétitions qui se terminent), d'où une durée limitée.
+FRAGMENT_TIMEOUT = 60
+# AJOUT: Corps des réponses /points et /api/points (HTML, JSON et leurs variantes
+# compressées) pour la version courante des données: {"version": ..., ...},
+# chaque corps étant construit à sa première demande
+_points_bodies = {}
+# AJOUT: Corps précalculés des pages statiques, par nom de template
+_static_bodies = {}
+# AJOUT: Matrice d'éligibilité (voir eligibility.py) de la version courante
+# des données et de l'état ouvert/fermé des compétitions
+_eligibility = {}
+
+# AJOUT: Plus grand identifiant des compétitions archivées, avec la signature
+# (date de modification, taille) du fichier d'archive lu
+_archived_last_id = {}
+
+# Valeur fictive du club utilisée lors du rendu partagé de la liste des
+# compétitions, remplacée ensuite par l'identifiant du club dans les liens.
+CLUB_PLACEHOLDER = "__gudlft_club__"
+
+
+def use_record_store():
+    """AJOUT: Indique si les données sont servies par les fichiers mmap."""
+    return app.config["DATA_BACKEND"] == "mmap"
+
+
+def get_store(kind):
+    """
+    AJOUT: Renvoie le fichier d'enregistrements ouvert pour `kind`
+    ("clubs" ou "competitions"). S'il n'existe pas encore, il est créé
+    par import du fichier JSON correspondant.
+    AJOUT: il est rouvert s'il a été remplacé depuis son ouverture.
+    """
+    store = _open_stores.get(kind)
+    # AJOUT: fichier remplacé par un autre processus (archivage): il est
+    # rouvert. L'ancien n'est pas fermé ici, un autre thread pouvant encore
+    # le lire; il est libéré avec sa dernière référence.
+    if store is not None and not store.is_current():
+        store = None
+    if store is None:
+        store_path, json_path, layout = STORES[kind]
+        if os.path.exists(store_path):
+            store = RecordStore(store_path, layout)
+        else:
+            store = RecordStore.import_json(json_path, kind, store_path, layout)
+        _open_stores[kind] = store
+    return store
+
+
+def close_stores():
+    """AJOUT: Ferme les fichiers d'enregistrements ouverts."""
+    while _open_stores:
+        _, store = _open_stores.popitem()
+        store.close()
+
+
+def export_stores():
+    """
+    AJOUT: Exporte le contenu des fichiers d'enregistrements vers les fichiers
+    JSON (clubs.json, competitions.json).
+    """
+    for kind, (_, json_path, _) in STORES.items():
+        get_store(kind).export_json(json_path, kind)
+
+
+def archived_last_id():
+    """
+    AJOUT: Plus grand identifiant des compétitions archivées, relu seulement
+    si le fichier d'archive a changé: les nouvelles compétitions ne reprennent
+    pas l'identifiant d'une compétition archivée.
+    """
+    path = app.config["ARCHIVE_PATH"]
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return 0
+    signature = (path, stat.st_mtime_ns, stat.st_size)
+    if _archived_last_id.get("signature") != signature:
+        try:
+            _archived_last_id["value"] = Archive(path).last_id()
+        except (KeyError, TypeError, AttributeError) + jsoncodec.DECODE_ERRORS as e:
+            # Archive illisible: les compétitions restent chargées
+            print(f"Error reading archive {path}: {e}")
+            return 0
+        _archived_last_id["signature"] = signature
+    return _archived_last_id["value"]
 
 
 def loadClubs():
@@ -71,14 +367,23 @@ def loadClubs():
     - Pas de fallback en cas d'erreur
     """
     try:
+        # AJOUT: Lecture directe des enregistrements projetés en mémoire
+        # AJOUT: identifiants stables attribués aux clubs qui n'en ont pas
+        if use_record_store():
+            records = assign_ids(get_store("clubs").records())
+            _load_errors.pop("clubs", None)
+            return records
         with open("clubs.json") as c:
-            listOfClubs = json.load(c)["clubs"]
+            listOfClubs = jsoncodec.load(c)["clubs"]
             # AMÉLIORATION: Conversion des points en entiers pour éviter les erreurs de type
             for club in listOfClubs:
                 club["points"] = int(club["points"])
-            return listOfClubs
-    except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
+            _load_errors.pop("clubs", None)
+            return assign_ids(listOfClubs)
+    except (FileNotFoundError, KeyError, StoreError) + jsoncodec.DECODE_ERRORS as e:
         print(f"Error loading clubs: {e}")
+        # AJOUT: échec conservé pour /readyz
+        _load_errors["clubs"] = f"{type(e).__name__}: {e}"
         # AMÉLIORATION: Retour d'une liste vide comme fallback pour éviter les crashes
         return []
 
@@ -95,14 +400,25 @@ def loadCompetitions():
     - Pas de fallback en cas d'erreur
     """
     try:
+        # AJOUT: Lecture directe des enregistrements projetés en mémoire
+        # AJOUT: identifiants stables attribués aux compétitions qui n'en ont pas
+        if use_record_store():
+            records = assign_ids(
+                get_store("competitions").records(), archived_last_id()
+            )
+            _load_errors.pop("competitions", None)
+            return records
         with open("competitions.json") as comps:
-            listOfCompetitions = json.load(comps)["competitions"]
+            listOfCompetitions = jsoncodec.load(comps)["competitions"]
             # AMÉLIORATION: Conversion des places en entiers pour éviter les erreurs de type
             for comp in listOfCompetitions:
                 comp["numberOfPlaces"] = int(comp["numberOfPlaces"])
-            return listOfCompetitions
-    except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
+            _load_errors.pop("competitions", None)
+            return assign_ids(listOfCompetitions, archived_last_id())
+    except (FileNotFoundError, KeyError, StoreError) + jsoncodec.DECODE_ERRORS as e:
         print(f"Error loading competitions: {e}")
+        # AJOUT: échec conservé pour /readyz
+        _load_errors["competitions"] = f"{type(e).__name__}: {e}"
         # AMÉLIORATION: Retour d'une liste vide comme fallback pour éviter les crashes
         return []
 
@@ -126,7 +442,7 @@ def saveClubs(clubs_data):
         clubs_to_save.append(club_copy)
 
     with open("clubs.json", "w") as c:
-        json.dump({"clubs": clubs_to_save}, c)
+        jsoncodec.dump({"clubs": clubs_to_save}, c)
 
 
 def saveCompetitions(competitions_data):
@@ -148,7 +464,87 @@ def saveCompetitions(competitions_data):
         comps_to_save.append(comp_copy)
 
     with open("competitions.json", "w") as comps:
-        json.dump({"competitions": comps_to_save}, comps)
+        jsoncodec.dump({"competitions": comps_to_save}, comps)
+
+
+def load_bookings():
+    """
+    AJOUT: Charge le fichier des réservations ({"club_compétition": places}).
+    Renvoie un dictionnaire vide si le fichier est absent ou invalide.
+    """
+    try:
+        with open("bookings.json", "r") as f:
+            return jsoncodec.load(f)
+    except (FileNotFoundError,) + jsoncodec.DECODE_ERRORS:
+        return {}
+
+
+@contextmanager
+def bookings_lock():
+    """
+    AJOUT: Verrou exclusif inter-processus (fcntl, sur bookings.json.lock)
+    de la lecture-modification-écriture de bookings.json. Les verrous
+    d'enregistrement ne protègent qu'un club et une compétition: deux
+    processus réservant pour des paires différentes réécrivent sinon le
+    fichier chacun de son côté et perdent la mise à jour de l'autre.
+    """
+    if fcntl is None:
+        yield
+        return
+    fd = os.open("bookings.json.lock", os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        # La fermeture libère le verrou
+        os.close(fd)
+
+
+def write_bookings(bookings):
+    """
+    AJOUT: Écrit bookings.json via un fichier temporaire remplacé
+    atomiquement: un autre processus ne lit jamais un fichier tronqué (qui
+    remettrait à zéro les totaux de la limite de 12 places).
+    """
+    with open("bookings.json.tmp", "w") as f:
+        jsoncodec.dump(bookings, f)
+    os.replace("bookings.json.tmp", "bookings.json")
+
+
+def _split_booking_key(key, club_names, competition_names):
+    """
+    AJOUT: Sépare une clé "club_compétition" en (club, compétition).
+    Les noms pouvant contenir "_", chaque position est essayée jusqu'à trouver
+    un club et une compétition connus. Renvoie None si la clé est inconnue.
+    """
+    position = key.find("_")
+    while position != -1:
+        club_name, competition_name = key[:position], key[position + 1:]
+        if club_name in club_names and competition_name in competition_names:
+            return club_name, competition_name
+        position = key.find("_", position + 1)
+    return None
+
+
+def aggregate_bookings(bookings, clubs_data, competitions_data):
+    """
+    AJOUT: Construit les agrégats {id du club: {id de la compétition: places}}
+    à partir du contenu de bookings.json (indexé par noms). Les clés ne
+    correspondant à aucun club ou compétition connus sont ignorées.
+    """
+    club_ids = {}
+    for club in clubs_data:
+        club_ids.setdefault(club["name"], club["id"])
+    competition_ids = {}
+    for comp in competitions_data:
+        competition_ids.setdefault(comp["name"], comp["id"])
+    aggregates = {}
+    for key, places in bookings.items():
+        names = _split_booking_key(key, club_ids, competition_ids)
+        if names is not None:
+            club_id, competition_id = club_ids[names[0]], competition_ids[names[1]]
+            aggregates.setdefault(club_id, {})[competition_id] = int(places)
+    return aggregates
 
 
 def is_competition_open(competition):
@@ -159,24 +555,696 @@ def is_competition_open(competition):
     Nouvelle fonctionnalité qui n'existait pas dans le code original.
     Cette fonction permet de filtrer les compétitions passées qui ne devraient
     plus être disponibles pour réservation.
+
+    AMÉLIORATION: Chaque date n'est analysée qu'une fois (voir _competition_dates).
     """
     try:
-        date_format = "%Y-%m-%d %H:%M:%S"
-        competition_date = datetime.strptime(competition["date"], date_format)
-        return datetime.now() < competition_date
+        return datetime.now() < competition_date(competition)
     except (ValueError, TypeError) as e:
         print(f"Error parsing competition date: {e}")
         return False
 
 
+def competition_date(competition):
+    """
+    AJOUT: Date d'une compétition, analysée une seule fois par date texte.
+    Lève ValueError ou TypeError si la date est invalide.
+    """
+    date = _competition_dates.get(competition["date"])
+    if date is None:
+        date = parse_date(competition["date"])
+        _competition_dates[competition["date"]] = date
+    return date
+
+
+def current_view():
+    """
+    AJOUT: Vue courante des données. Une requête la récupère une fois, sans
+    verrou, et l'utilise jusqu'à sa fin: les réservations publient une
+    nouvelle vue au lieu de modifier celle-ci.
+    """
+    return _view
+
+
+def ranked_clubs(limit=None):
+    """
+    AJOUT: Renvoie (vue courante, `limit` premiers clubs du classement), lus
+    ensemble sous le verrou du classement pour qu'ils correspondent.
+    Chaque ligne porte aussi l'identifiant du club.
+    """
+    with leaderboard.lock:
+        view, ranking = _view, leaderboard.top(limit)
+    return view, [
+        {"id": view.clubs_by_name[row["name"]]["id"], **row} for row in ranking
+    ]
+
+
+def club_rank(club_name):
+    """AJOUT: Renvoie (vue courante, rang du club ou None)."""
+    with leaderboard.lock:
+        return _view, leaderboard.rank(club_name)
+
+
+def _data_files():
+    """AJOUT: Fichiers dont dépendent les données en mémoire."""
+    if use_record_store():
+        return [store_path for store_path, _, _ in STORES.values()] + ["bookings.json"]
+    return ["clubs.json", "competitions.json", "bookings.json"]
+
+
+def _files_signature():
+    """
+    AJOUT: Signature (date de modification, taille) des fichiers de données.
+    Un simple stat par fichier suffit à détecter une modification externe.
+    """
+    signature = []
+    for path in _data_files():
+        try:
+            stat = os.stat(path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def load_snapshot():
+    """
+    AJOUT: Renvoie l'instantané précompilé s'il correspond aux fichiers JSON
+    actuels, sinon None (instantané absent, invalide ou périmé).
+    """
+    if use_record_store():
+        return None
+    try:
+        snapshot = compiled.read_snapshot(app.config["SNAPSHOT_PATH"])
+        sources = compiled.source_signature("clubs.json", "competitions.json")
+    except (compiled.SnapshotError, OSError):
+        return None
+    if snapshot.sources != sources:
+        return None
+    return snapshot
+
+
+def save_snapshot(view):
+    """
+    AJOUT: Réécrit l'instantané précompilé, s'il est utilisé, après une
+    sauvegarde des fichiers JSON par l'application: sa signature (date de
+    modification, taille) ne correspondrait plus aux fichiers et les
+    démarrages suivants reviendraient à l'analyse JSON.
+    """
+    path = app.config["SNAPSHOT_PATH"]
+    if use_record_store() or not os.path.exists(path):
+        return
+    try:
+        compiled.write_snapshot(
+            path,
+            view.clubs,
+            view.competitions,
+            [normalize_email(club.get("email", "")) for club in view.clubs],
+            compiled.source_signature("clubs.json", "competitions.json"),
+        )
+    except (OSError, ValueError, TypeError, KeyError) as e:
+        # L'instantané périmé est ignoré au démarrage suivant
+        print(f"Error writing snapshot {path}: {e}")
+
+
+def refresh_data(force=False):
+    """
+    AJOUT: Recharge les clubs et les compétitions si les fichiers ont changé
+    depuis le dernier chargement (par un autre processus ou à la main).
+    Une nouvelle vue n'est publiée que si le contenu des données a changé.
+    Renvoie True si les données en mémoire ont été remplacées.
+
+    AMÉLIORATION: les lectures ne bloquent pas derrière une écriture. Si une
+    réservation ou un archivage de ce processus tient le verrou des données
+    (ses fichiers sont déjà en partie réécrits), la vue courante continue
+    d'être servie: l'écrivain publie lui-même la vue suivante. La signature
+    est relue une fois le verrou obtenu, l'écrivain ayant pu l'enregistrer.
+    """
+    global _view, _data_signature, _last_load
+    if not force and _files_signature() == _data_signature:
+        return False
+    if not _data_lock.acquire(blocking=force):
+        return False
+    try:
+        signature = _files_signature()
+        if not force and signature == _data_signature:
+            return False
+        snapshot = load_snapshot()
+        if snapshot is not None:
+            new_clubs, new_competitions = snapshot.clubs, snapshot.competitions
+            _competition_dates.update(snapshot.dates)
+            # Instantané valide: les fichiers sources ont été validés
+            _load_errors.clear()
+        else:
+            new_clubs = loadClubs()
+            new_competitions = loadCompetitions()
+        _data_signature = signature
+        _last_load = time.time()
+        bookings = aggregate_bookings(load_bookings(), new_clubs, new_competitions)
+        view = _view
+        if (
+            list(view.clubs) == new_clubs
+            and list(view.competitions) == new_competitions
+            and view.club_bookings == bookings
+        ):
+            return False
+        _publish_competition_changes(view.competitions, new_competitions)
+        new_view = DataView(
+            view.version + 1,
+            new_clubs,
+            new_competitions,
+            bookings,
+            snapshot.email_keys if snapshot is not None else None,
+        )
+        with leaderboard.lock:
+            leaderboard.reset(new_view.clubs)
+            _view = new_view
+        return True
+    finally:
+        _data_lock.release()
+
+
+def competition_state(competition):
+    """AJOUT: État public d'une compétition (places et ouverture)."""
+    return {
+        "id": competition["id"],
+        "name": competition["name"],
+        "date": competition["date"],
+        "numberOfPlaces": competition["numberOfPlaces"],
+        "open": is_competition_open(competition),
+    }
+
+
+def _publish_competition_changes(old_competitions, new_competitions):
+    """
+    AJOUT: Publie les compétitions dont les places ont changé lors d'un
+    rechargement (modification faite par un autre processus).
+    """
+    old_places = {comp["name"]: comp["numberOfPlaces"] for comp in old_competitions}
+    for comp in new_competitions:
+        if old_places.get(comp["name"]) != comp["numberOfPlaces"]:
+            competition_publisher.publish(competition_state(comp))
+
+
+def _record_saved():
+    """
+    AJOUT: Enregistre une modification faite par ce processus: les fichiers
+    ne seront pas rechargés (la nouvelle vue est publiée par l'appelant).
+    La date de la sauvegarde est reprise par /readyz.
+    """
+    global _data_signature, _last_save
+    _data_signature = _files_signature()
+    _last_save = time.time()
+
+
+def _rewrite_store(kind, records):
+    """
+    AJOUT: Recrée le fichier d'enregistrements `kind` avec `records`
+    (suppression d'enregistrements, impossible en place).
+    """
+    store_path, _, layout = STORES[kind]
+    # L'ancien fichier n'est pas fermé ici: l'appelant peut encore tenir son
+    # verrou (lock_file); il est libéré avec sa dernière référence
+    _open_stores[kind] = RecordStore.create(store_path, layout, records)
+
+
+def _store_file_lock(kind):
+    """
+    AJOUT: Verrou inter-processus de tout le fichier d'enregistrements
+    `kind` (backend "mmap"), sans effet avec les fichiers JSON.
+    """
+    if not use_record_store():
+        return nullcontext()
+    return get_store(kind).lock_file()
+
+
+def _stored_counters(competitions):
+    """
+    AJOUT: Avec le backend "mmap", compétitions portant les places relues
+    dans le fichier (modifiées en place par les autres processus).
+    """
+    if not use_record_store():
+        return competitions
+    places = {
+        record["name"]: record["numberOfPlaces"]
+        for record in get_store("competitions").records()
+    }
+    return [
+        {**comp, "numberOfPlaces": places.get(comp["name"], comp["numberOfPlaces"])}
+        for comp in competitions
+    ]
+
+
+def archive_past_competitions(now=None):
+    """
+    AJOUT: Déplace les compétitions dont la date est passée, avec leurs
+    totaux de réservations, dans l'archive (ARCHIVE_PATH), puis publie une vue
+    qui ne contient plus que les compétitions à venir.
+    Les compétitions à la date invalide restent en place pour être corrigées.
+    Renvoie les noms des compétitions archivées.
+
+    AJOUT: avec le backend "mmap", le fichier des compétitions est verrouillé
+    en entier et ses places relues avant d'être remplacé; les autres
+    processus rouvrent le nouveau fichier (voir get_store).
+    """
+    global _view
+    now = now or datetime.now()
+    with _data_lock, _store_file_lock("competitions"):
+        refresh_data()
+        view = _view
+        past, upcoming = [], []
+        for comp in _stored_counters(view.competitions):
+            try:
+                is_past = competition_date(comp) <= now
+            except (ValueError, TypeError):
+                is_past = False
+            (past if is_past else upcoming).append(comp)
+        if not past:
+            return []
+
+        past_names = {comp["name"] for comp in past}
+        past_ids = {comp["id"] for comp in past}
+        club_names = {club["name"] for club in view.clubs}
+        with bookings_lock():
+            bookings = load_bookings()
+            archived_bookings = {}
+            for key in list(bookings):
+                if _split_booking_key(key, club_names, past_names) is not None:
+                    archived_bookings[key] = bookings.pop(key)
+            Archive(app.config["ARCHIVE_PATH"]).add(past, archived_bookings)
+            write_bookings(bookings)
+        if use_record_store():
+            _rewrite_store("competitions", upcoming)
+        else:
+            saveCompetitions(upcoming)
+        _record_saved()
+        _view = DataView(
+            view.version + 1,
+            view.clubs,
+            upcoming,
+            {
+                club_id: {
+                    comp_id: places
+                    for comp_id, places in booked.items()
+                    if comp_id not in past_ids
+                }
+                for club_id, booked in view.club_bookings.items()
+            },
+        )
+        save_snapshot(_view)
+        for comp in past:
+            _competition_dates.pop(comp["date"], None)
+
+    # AJOUT: Les abonnés au flux apprennent la fermeture des compétitions
+    for comp in past:
+        competition_publisher.publish(competition_state(comp))
+    return sorted(past_names)
+
+
+def start_scheduler():
+    """
+    AJOUT: Démarre la tâche de fond d'archivage (toutes les ARCHIVE_INTERVAL
+    secondes) si elle est activée et pas encore démarrée.
+    """
+    global archive_task
+    if archive_task is None and app.config["ARCHIVE_INTERVAL"] > 0:
+        archive_task = PeriodicTask(
+            app.config["ARCHIVE_INTERVAL"],
+            archive_past_competitions,
+            name="archive-competitions",
+        )
+        archive_task.start()
+    return archive_task
+
+
+def competitions_fragment(view):
+    """
+    AJOUT: Liste HTML des compétitions ouvertes, rendue une seule fois par
+    version des données. Les liens de réservation contiennent CLUB_PLACEHOLDER
+    à la place de l'identifiant du club.
+    """
+    key = f"fragment:competitions:{view.version}"
+    fragment = cache.get(key)
+    if fragment is None:
+        open_competitions = [
+            comp for comp in view.competitions if is_competition_open(comp)
+        ]
+        fragment = render_template(
+            "_competitions.html",
+            competitions=open_competitions,
+            club_id=CLUB_PLACEHOLDER,
+        )
+        cache.set(key, fragment, timeout=FRAGMENT_TIMEOUT)
+    return fragment
+
+
+def points_table_fragment(view, ranking=None):
+    """
+    AJOUT: Tableau HTML des points des clubs, rendu une seule fois par version.
+    Avec `ranking` (voir ranked_clubs), les clubs sont classés par points.
+    """
+    order = "file" if ranking is None else "ranked"
+    key = f"fragment:points:{order}:{view.version}"
+    fragment = cache.get(key)
+    if fragment is None:
+        fragment = render_template(
+            "_points_table.html",
+            clubs=view.clubs if ranking is None else ranking,
+            ranked=ranking is not None,
+        )
+        cache.set(key, fragment, timeout=FRAGMENT_TIMEOUT)
+    return fragment
+
+
+def points_body(name):
+    """
+    AJOUT: Corps de /points ("html", "ranked_html") ou de /api/points ("json")
+    pour la version courante. Les deux vues sont construites à partir des mêmes
+    données en mémoire, une seule fois par version et seulement à la première
+    demande de chacune; leurs variantes gzip/brotli sont compressées à la
+    demande, au niveau rapide (ces corps changent à chaque réservation).
+    La page classée (/points?sort=points) est lue dans le classement maintenu.
+    """
+    global _points_bodies
+    if name == "ranked_html":
+        view, ranking = ranked_clubs()
+    else:
+        view, ranking = current_view(), None
+    bodies = _points_bodies
+    if bodies.get("version") != view.version:
+        bodies = {"version": view.version}
+        _points_bodies = bodies
+    variants = bodies.get(name)
+    if variants is None:
+        if name == "json":
+            clubs_points = [
+                {"id": club["id"], "name": club["name"], "points": club["points"]}
+                for club in view.clubs
+            ]
+            body = app.json.dumps({"clubs": clubs_points}, separators=(",", ":"))
+        else:
+            body = render_template(
+                "points.html",
+                points_table_html=Markup(points_table_fragment(view, ranking)),
+            )
+        variants = bodies[name] = compression.LazyVariants(body.encode("utf-8"))
+    return variants
+
+
+def static_page_bodies(template, messages=()):
+    """
+    AJOUT: Corps précalculés (et compressés) d'une page sans contenu
+    dynamique, rendue une seule fois pour toute la durée du processus
+    (une fois par message affiché, voir MESSAGE_CODES).
+    """
+    key = (template, messages)
+    bodies = _static_bodies.get(key)
+    if bodies is None:
+        bodies = compression.compressed_variants(
+            render_template(template, messages=messages).encode("utf-8")
+        )
+        _static_bodies[key] = bodies
+    return bodies
+
+
+def precomputed_response(variants, mimetype, status=200):
+    """
+    AJOUT: Réponse servie depuis des variantes précalculées, avec l'encodage
+    choisi selon Accept-Encoding.
+    """
+    encoding = compression.negotiate(request.accept_encodings)
+    response = app.response_class(variants[encoding], status, mimetype=mimetype)
+    if encoding != "identity":
+        response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+def versioned_response(variants, mimetype):
+    """
+    AJOUT: Réponse servie depuis des variantes précalculées: choix de
+    l'encodage selon Accept-Encoding, ETag du contenu et réponse 304 si le
+    client possède déjà cette version.
+    """
+    response = precomputed_response(variants, mimetype)
+    encoding = response.headers.get("Content-Encoding", "identity")
+    response.set_etag(f"{variants['etag']}-{encoding}")
+    return response.make_conditional(request)
+
+
+def sessionless_messages():
+    """AJOUT: Indique si les messages sont transmis sans la session."""
+    return app.config["SESSIONLESS_MESSAGES"]
+
+
+def notify(message):
+    """
+    AJOUT: Message destiné à l'utilisateur, affiché par la page rendue pour
+    cette requête: conservé dans la requête en mode sans session, sinon
+    stocké dans la session (flash).
+    """
+    if sessionless_messages():
+        g.setdefault("messages", []).append(message)
+    else:
+        flash(message)
+
+
+@app.template_global()
+def pending_messages():
+    """AJOUT: Messages à afficher par la page en cours de rendu."""
+    if sessionless_messages():
+        return g.get("messages", [])
+    return get_flashed_messages()
+
+
+def redirect_home(message):
+    """
+    AJOUT: Redirection vers la page d'accueil avec un message: par un code
+    dans l'URL en mode sans session (message inconnu: code générique "error"),
+    sinon par la session.
+    """
+    if sessionless_messages():
+        code = _MESSAGE_CODES_BY_TEXT.get(message, "error")
+        return redirect(url_for("index", msg=code))
+    flash(message)
+    return redirect(url_for("index"))
+
+
+def get_session_store():
+    """AJOUT: Backend des sessions côté serveur, créé selon SESSION_BACKEND."""
+    global _session_store
+    if _session_store is None:
+        if app.config["SESSION_BACKEND"] == "cache":
+            _session_store = CacheSessionBackend(cache, app.config["SESSION_TTL"])
+        else:
+            _session_store = MemorySessionBackend(
+                app.config["SESSION_MAX_ENTRIES"], app.config["SESSION_TTL"]
+            )
+    return _session_store
+
+
+def logged_in_club(view):
+    """
+    AJOUT: Club de la session côté serveur de la requête, ou None.
+    La session (qui conserve l'identifiant du club) n'est lue qu'une fois par
+    requête.
+    """
+    if "session_club" not in g:
+        session_id = request.cookies.get(app.config["SESSION_ID_COOKIE"])
+        data = get_session_store().get(session_id) if session_id else None
+        g.session_club = data["club"] if data else None
+    if g.session_club is None:
+        return None
+    return view.clubs_by_id.get(g.session_club)
+
+
+def resolve_club(view, club_name=None, club_id=None):
+    """
+    AJOUT: Club concerné par une requête. Si un club est connecté, c'est lui
+    (l'identifiant ou le nom transmis, s'il y en a un, doit alors être le
+    sien); sinon le club est recherché par son identifiant ou, à défaut, par
+    son nom, sauf si REQUIRE_LOGIN est activé.
+    """
+    club = logged_in_club(view)
+    if club is not None:
+        if club_id is not None:
+            return club if club_id == club["id"] else None
+        return club if club_name in (None, club["name"]) else None
+    if app.config["REQUIRE_LOGIN"]:
+        return None
+    if club_id is not None:
+        return view.clubs_by_id.get(club_id)
+    if club_name is None:
+        return None
+    return view.clubs_by_name.get(club_name)
+
+
+def find_club(view, club):
+    """
+    AJOUT: Club désigné dans une URL d'API par son identifiant ou son nom.
+    Renvoie None s'il est inconnu.
+    """
+    club_id = parse_id(club) if club.isdigit() else None
+    if club_id is not None and club_id in view.clubs_by_id:
+        return view.clubs_by_id[club_id]
+    return view.clubs_by_name.get(club)
+
+
+def login(response, club):
+    """AJOUT: Ouvre une session côté serveur pour `club` et pose son cookie."""
+    store = get_session_store()
+    previous = request.cookies.get(app.config["SESSION_ID_COOKIE"])
+    if previous:
+        # Nouvel identifiant à chaque connexion (pas de fixation de session)
+        store.delete(previous)
+    response.set_cookie(
+        app.config["SESSION_ID_COOKIE"],
+        store.create({"club": club["id"]}),
+        max_age=app.config["SESSION_TTL"],
+        httponly=True,
+        samesite="Lax",
+    )
+    return response
+
+
+def render_welcome(club, view=None, messages=None):
+    """
+    AJOUT: Rendu de la page d'accueil d'un club. Seules les parties propres
+    au club (email, points, messages) sont rendues à chaque requête; la liste
+    des compétitions provient du fragment en cache.
+    Sans `messages`, la page affiche les messages en attente (notify).
+    """
+    fragment = competitions_fragment(view or current_view()).replace(
+        CLUB_PLACEHOLDER, str(club["id"])
+    )
+    return render_template(
+        "welcome.html",
+        club=club,
+        competitions_html=Markup(fragment),
+        messages=messages,
+    )
+
+
+def welcome_error(club, message, view=None):
+    """
+    AJOUT: Page d'accueil du club affichant `message` après un refus attendu
+    (réservation refusée, compétition complète ou fermée). Elle est rendue et
+    compressée une fois par version des données, club et message, puis servie
+    depuis le cache: une demande invalide répétée ne coûte aucun rendu.
+    """
+    if not sessionless_messages() and "_flashes" in session:
+        # Des messages plus anciens attendent d'être affichés avec celui-ci
+        notify(message)
+        return render_welcome(club, view)
+    view = view or current_view()
+    key = f"page:welcome-error:{view.version}:{club['id']}:{message}"
+    bodies = cache.get(key)
+    if bodies is None:
+        html = render_welcome(club, view, messages=[message])
+        bodies = compression.compressed_variants(html.encode("utf-8"))
+        cache.set(key, bodies, timeout=FRAGMENT_TIMEOUT)
+    return precomputed_response(bodies, "text/html")
+
+
+def unexpected_error(context):
+    """
+    AJOUT: Réponse à une exception inattendue (un bug, pas un refus métier):
+    la trace est journalisée et l'utilisateur ne voit qu'un message générique.
+    """
+    app.logger.exception("Unexpected error in %s", context)
+    return redirect_home(MESSAGE_CODES["error"])
+
+
 # Load initial data
-clubs = loadClubs()
-competitions = loadCompetitions()
+refresh_data(force=True)
+# AJOUT: Archivage périodique démarré avec l'application
+if app.config["ARCHIVE_SCHEDULER"]:
+    start_scheduler()
 
 
 @app.route("/")
 def index():
-    return render_template("index.html")
+    """
+    AMÉLIORATION: page statique, rendue et compressée une seule fois.
+    AJOUT: affiche le message transmis par code (?msg=, mode sans session) ou
+    les messages en attente dans la session, rendus alors à la demande.
+    """
+    message = MESSAGE_CODES.get(request.args.get("msg"))
+    if message is not None:
+        return versioned_response(
+            static_page_bodies("index.html", (message,)), "text/html"
+        )
+    # (en mode sans session, le cookie n'est pas lu: pas de Vary: Cookie)
+    if not sessionless_messages() and "_flashes" in session:
+        return render_template("index.html", messages=get_flashed_messages())
+    return versioned_response(static_page_bodies("index.html"), "text/html")
+
+
+def get_rate_limiter():
+    """AJOUT: Limiteur de débit, créé selon RATELIMIT_BACKEND."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        if app.config["RATELIMIT_BACKEND"] == "cache":
+            _rate_limiter = CacheRateLimiter(cache)
+        else:
+            _rate_limiter = MemoryRateLimiter()
+    return _rate_limiter
+
+
+def _rate_limit_subject(scope):
+    """
+    AJOUT: Adresse IP du client ("ip") ou identifiant du club connecté
+    ("club"). Le seau d'un club n'est jamais choisi d'après le formulaire
+    (email, club_id): sinon n'importe qui pourrait épuiser celui d'un autre
+    club. Renvoie None sans session, seul le seau par IP s'appliquant alors.
+    """
+    if scope == "ip":
+        return request.remote_addr
+    club = logged_in_club(current_view())
+    return club["id"] if club else None
+
+
+@app.before_request
+def rate_limit():
+    """
+    AJOUT: Refuse les requêtes dépassant les limites de leur route
+    (RATE_LIMITS) par adresse IP et par club, avant tout accès aux fichiers:
+    réponse 429 avec Retry-After.
+    """
+    if not app.config["RATELIMIT_ENABLED"]:
+        return None
+    limits = app.config["RATE_LIMITS"].get(request.endpoint)
+    if not limits:
+        return None
+    limiter = get_rate_limiter()
+    for scope, (capacity, period) in limits.items():
+        subject = _rate_limit_subject(scope)
+        if subject is None:
+            continue
+        allowed, retry_after = limiter.consume(
+            f"{request.endpoint}:{scope}:{subject}", capacity, period
+        )
+        if not allowed:
+            return (
+                "Too many requests, please retry later",
+                429,
+                {"Retry-After": str(max(1, math.ceil(retry_after)))},
+            )
+    return None
+
+
+@app.after_request
+def compress_dynamic_response(response):
+    """
+    AJOUT: Compression gzip/brotli des réponses rendues à chaque requête.
+    Les réponses précalculées portent déjà leur Content-Encoding et ne sont
+    pas recompressées.
+    """
+    if not app.config["COMPRESS_RESPONSES"]:
+        return response
+    return compression.compress_response(
+        response, request.accept_encodings, app.config["COMPRESS_MIN_SIZE"]
+    )
 
 
 @app.route("/showSummary", methods=["POST"])
@@ -189,31 +1257,31 @@ def showSummary():
     Changements:
     - Validation de l'email non vide
     - Recherche du club avec gestion d'erreur
+    - Recherche insensible à la casse via l'index des emails normalisés
     - Filtrage des compétitions passées
-    - Block try/except global pour éviter les crashs
+    - Block try/except global pour éviter les crashs (les erreurs inattendues
+      sont journalisées, voir unexpected_error)
     """
     email = request.form.get("email", "").strip()
 
     if not email:
-        flash("Please provide an email")
-        return redirect(url_for("index"))
+        return redirect_home("Please provide an email")
 
     try:
-        club = next((club for club in clubs if club["email"] == email), None)
+        refresh_data()
+        view = current_view()
+        # AMÉLIORATION: recherche en temps constant dans l'index des emails
+        # normalisés (au lieu d'un parcours de tous les clubs)
+        club = view.clubs_by_email.get(normalize_email(email))
         if club:
-            # AJOUT: Filtre des compétitions pour ne montrer que celles qui sont encore ouvertes
-            open_competitions = [
-                comp for comp in competitions if is_competition_open(comp)
-            ]
-            return render_template(
-                "welcome.html", club=club, competitions=open_competitions
-            )
+            # AJOUT: Seules les compétitions encore ouvertes sont affichées
+            # (liste rendue une fois par version des données)
+            # AJOUT: le club résolu est conservé dans une session côté serveur
+            return login(make_response(render_welcome(club, view)), club)
         else:
-            flash("Unknown email, please try again")
-            return redirect(url_for("index"))
-    except Exception as e:
-        flash(f"An error occurred: {str(e)}")
-        return redirect(url_for("index"))
+            return redirect_home("Unknown email, please try again")
+    except Exception:
+        return unexpected_error("showSummary")
 
 
 @app.route("/book/<competition>/<club>")
@@ -227,40 +1295,75 @@ def book(competition, club):
     - Validation de l'existence du club et de la compétition
     - Vérification que la compétition n'est pas passée
     - Gestion globale des erreurs
+
+    AJOUT: ancienne adresse par noms, conservée pour les liens existants et
+    redirigée vers la page adressée par identifiants (book_by_id).
     """
     try:
-        foundClub = next((c for c in clubs if c["name"] == club), None)
-        foundCompetition = next(
-            (c for c in competitions if c["name"] == competition), None
+        refresh_data()
+        view = current_view()
+        # AJOUT: club de la session si connecté, sinon recherche par nom
+        foundClub = resolve_club(view, club)
+        foundCompetition = view.competitions_by_name.get(competition)
+
+        if not foundClub:
+            return redirect_home("Club not found")
+
+        if not foundCompetition:
+            return redirect_home("Competition not found")
+
+        return redirect(
+            url_for(
+                "book_by_id",
+                competition_id=foundCompetition["id"],
+                club_id=foundClub["id"],
+            )
         )
+    except Exception:
+        return unexpected_error("book")
+
+
+# L'identifiant du club reste un segment texte: les liens de la liste des
+# compétitions sont rendus avec CLUB_PLACEHOLDER (voir competitions_fragment)
+@app.route("/book/<int:competition_id>/<club_id>")
+def book_by_id(competition_id, club_id):
+    """
+    AJOUT: Page de réservation adressée par les identifiants stables de la
+    compétition et du club, avec les mêmes vérifications que book.
+    """
+    try:
+        refresh_data()
+        view = current_view()
+        club_id = parse_id(club_id)
+        foundClub = resolve_club(view, club_id=club_id) if club_id else None
+        foundCompetition = view.competitions_by_id.get(competition_id)
 
         if not foundClub:
-            flash("Club not found")
-            return redirect(url_for("index"))
+            return redirect_home("Club not found")
 
         if not foundCompetition:
-            flash("Competition not found")
-            return redirect(url_for("index"))
+            return redirect_home("Competition not found")
 
         # AJOUT: Vérification si la compétition est encore ouverte
+        # (page d'erreur précalculée)
         if not is_competition_open(foundCompetition):
-            flash("This competition is no longer open for booking")
-            open_competitions = [
-                comp for comp in competitions if is_competition_open(comp)
-            ]
-            return render_template(
-                "welcome.html", club=foundClub, competitions=open_competitions
+            return welcome_error(
+                foundClub, "This competition is no longer open for booking", view
             )
 
+        # AJOUT: Clé d'idempotence propre à ce formulaire: un double envoi ou
+        # une nouvelle tentative ne réserve pas deux fois
         return render_template(
-            "booking.html", club=foundClub, competition=foundCompetition
+            "booking.html",
+            club=foundClub,
+            competition=foundCompetition,
+            idempotency_key=uuid.uuid4().hex,
         )
-    except Exception as e:
-        flash(f"Something went wrong: {str(e)}")
-        return redirect(url_for("index"))
+    except Exception:
+        return unexpected_error("book")
 
 
-def get_club_competition_bookings(club_name, competition_name):
+def get_club_competition_bookings(club_name, competition_name, view=None):
     """
     AJOUT: Fonction pour obtenir le nombre de places déjà réservées 
     par un club pour une compétition.
@@ -269,17 +1372,16 @@ def get_club_competition_bookings(club_name, competition_name):
     Nouvelle fonctionnalité qui n'existait pas dans le code original.
     Cette fonction permet de tracer les réservations et d'appliquer la règle
     des 12 places maximum par club et par compétition.
-    """
-    # Load bookings from a JSON file or create a new one if it doesn't exist
-    try:
-        with open("bookings.json", "r") as f:
-            bookings = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        bookings = {}
 
-    # Get bookings for this club and competition
-    booking_key = f"{club_name}_{competition_name}"
-    return bookings.get(booking_key, 0)
+    AMÉLIORATION: lecture dans les agrégats en mémoire au lieu de relire
+    bookings.json à chaque vérification (indexés par identifiants).
+    """
+    view = view or current_view()
+    club = view.clubs_by_name.get(club_name)
+    competition = view.competitions_by_name.get(competition_name)
+    if club is None or competition is None:
+        return 0
+    return view.booked(club["id"], competition["id"])
 
 
 def save_booking(club_name, competition_name, places):
@@ -289,92 +1391,154 @@ def save_booking(club_name, competition_name, places):
 
     Nouvelle fonctionnalité qui n'existait pas dans le code original.
     Cette fonction sauvegarde l'historique des réservations dans un fichier JSON.
+
+    AMÉLIORATION: renvoie le nouveau total du club pour la compétition, repris
+    dans l'agrégat de la vue publiée par process_booking.
+
+    AMÉLIORATION: lecture et écriture sous le verrou inter-processus du
+    fichier, écriture atomique (voir bookings_lock et write_bookings).
     """
-    # Load existing bookings
-    try:
-        with open("bookings.json", "r") as f:
-            bookings = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        bookings = {}
+    with bookings_lock():
+        # Load existing bookings
+        bookings = load_bookings()
 
-    # Update booking
-    booking_key = f"{club_name}_{competition_name}"
-    current_places = bookings.get(booking_key, 0)
-    bookings[booking_key] = current_places + places
+        # Update booking
+        booking_key = f"{club_name}_{competition_name}"
+        current_places = bookings.get(booking_key, 0)
+        bookings[booking_key] = current_places + places
 
-    # Save bookings
-    with open("bookings.json", "w") as f:
-        json.dump(bookings, f)
+        # Save bookings
+        write_bookings(bookings)
+
+    return bookings[booking_key]
 
 
 def validate_booking_request(competition_name, club_name, places_str):
     """
     Valide les données de base d'une demande de réservation.
-    Renvoie un tuple (succès, message d'erreur, places nécessaires).
+    Renvoie le nombre de places nécessaires.
+
+    AMÉLIORATION: lève InvalidRequest au lieu de renvoyer un tuple
+    (succès, message d'erreur, places nécessaires).
     """
     if not competition_name or not club_name or not places_str:
-        return False, "Error: Missing required information", None
+        raise InvalidRequest("Error: Missing required information")
     
     try:
         places_required = int(places_str)
     except ValueError:
-        return False, "Error: Invalid number of places", None
+        raise InvalidRequest("Error: Invalid number of places") from None
     
     if places_required <= 0:
-        return False, "Error: Invalid number of places", None
+        raise InvalidRequest("Error: Invalid number of places")
     
-    return True, "", places_required
+    return places_required
 
 
-def check_availability(competition, club, places_required):
+def check_availability(competition, club, places_required, view=None):
     """
     Vérifie la disponibilité des places et les contraintes liées à la compétition.
-    Renvoie un tuple (succès, message d'erreur).
+
+    AMÉLIORATION: lève BookingRefused au lieu de renvoyer un tuple
+    (succès, message d'erreur).
     """
     # Vérifier si la compétition est encore ouverte
     if not is_competition_open(competition):
-        return False, "Error: This competition is no longer open for booking"
+        raise BookingRefused("Error: This competition is no longer open for booking")
     
     # Vérifier si la compétition a des places disponibles
     if competition["numberOfPlaces"] <= 0:
-        return False, "Error: Competition is full"
+        raise BookingRefused("Error: Competition is full")
     
     if places_required > competition["numberOfPlaces"]:
-        return False, "Error: Not enough places available"
+        raise BookingRefused("Error: Not enough places available")
     
     # Vérifier la limite de 12 places par club
     club_name = club["name"]
     comp_name = competition["name"]
-    current_bookings = get_club_competition_bookings(club_name, comp_name)
+    current_bookings = get_club_competition_bookings(club_name, comp_name, view)
     booking_total = current_bookings + places_required
-    if booking_total > 12:
-        return False, "Error: Cannot book more than 12 places per competition"
+    if booking_total > MAX_PLACES_PER_COMPETITION:
+        raise BookingRefused("Error: Cannot book more than 12 places per competition")
     
     # Vérifier les points du club
     if places_required > club["points"]:
-        return False, "Error: Not enough points"
-    
-    return True, ""
+        raise BookingRefused("Error: Not enough points")
 
 
-def process_booking(club, competition, places_required):
+def process_booking(club, competition, places_required, started=None):
     """
     Traite la réservation effective après validation.
     Met à jour les points et les places, sauvegarde les changements.
+
+    AJOUT: la réservation est ajoutée au journal d'audit une fois publiée
+    (durée mesurée depuis `started`).
+
+    AMÉLIORATION: les enregistrements de la vue courante ne sont pas modifiés;
+    une nouvelle vue portant les nouveaux compteurs est publiée une fois les
+    fichiers sauvegardés, puis renvoyée.
+
+    AMÉLIORATION: appelée sous les verrous du shard et du club (voir
+    booking_locks), elle ne tient le verrou des données qu'en mode partagé:
+    avec le backend "mmap", les réservations d'autres shards s'exécutent en
+    même temps. Restent sérialisées la réécriture de bookings.json, la
+    publication de la vue et, avec le backend "json", la réécriture des
+    fichiers complets.
     """
+    global _view
     club_name = club["name"]
     comp_name = competition["name"]
     
-    # Mettre à jour les points et les places
-    club["points"] = club["points"] - places_required
-    competition["numberOfPlaces"] = competition["numberOfPlaces"] - places_required
-    
-    # Sauvegarder la réservation
-    save_booking(club_name, comp_name, places_required)
+    # Calculer les nouveaux points et places
+    # (sous les verrous du shard et du club, voir booking_locks)
+    points = club["points"] - places_required
+    places = competition["numberOfPlaces"] - places_required
     
-    # Sauvegarder les changements dans les fichiers
-    saveClubs(clubs)
-    saveCompetitions(competitions)
+    # AJOUT: Le rechargement et l'archivage sont exclus (mode partagé)
+    with _data_lock.shared():
+        # La compétition a pu être archivée depuis la vérification
+        if comp_name not in _view.competitions_by_name:
+            raise BookingRefused("Error: This competition is no longer open for booking")
+        # Sauvegarder la réservation
+        # (AJOUT: durée des écritures mesurée pour /readyz; `started` reste
+        # le début de la requête, repris dans le journal d'audit)
+        save_started = time.perf_counter()
+        booked = save_booking(club_name, comp_name, places_required)
+        
+        # Sauvegarder les changements dans les fichiers
+        if use_record_store():
+            # AJOUT: Mise à jour en place des deux compteurs, sans réécrire les
+            # fichiers, sous les verrous de leurs enregistrements
+            get_store("clubs").set_value(club_name, points)
+            get_store("competitions").set_value(comp_name, places)
+            save_latency.record(time.perf_counter() - save_started)
+            _record_saved()
+            # AJOUT: Publication atomique de la nouvelle vue, construite depuis
+            # la vue courante (réservations des autres shards comprises), avec
+            # le déplacement du club dans le classement (O(log n))
+            with leaderboard.lock:
+                view = _view.with_booking(club, competition, points, places, booked)
+                leaderboard.update(club_name, points)
+                _view = view
+        else:
+            # Les fichiers complets sont écrits depuis la vue publiée ensuite
+            with _json_files_lock:
+                view = _view.with_booking(club, competition, points, places, booked)
+                saveClubs(view.clubs)
+                saveCompetitions(view.competitions)
+                save_snapshot(view)
+                save_latency.record(time.perf_counter() - save_started)
+                _record_saved()
+                with leaderboard.lock:
+                    leaderboard.update(club_name, points)
+                    _view = view
+    audit_booking("booked", started, club, competition, places_required, view=view)
+
+    # AJOUT: Notification des abonnés au flux /api/competitions/stream
+    competition_publisher.publish(
+        competition_state(view.competitions_by_name[comp_name])
+    )
+    return view
 
 
 @app.route("/purchasePlaces", methods=["POST"])
@@ -396,96 +1560,645 @@ def purchasePlaces():
     - Implémentation de la règle des 12 places maximum par club
     - Traçabilité des réservations
     - Rechargement des données pour assurer la cohérence
+
+    AJOUT: Contrôle d'admission pour les pics de réservations:
+    - réponse immédiate, sans accès disque, si la compétition est complète
+    - une réservation à la fois par compétition, les autres attendent leur
+      tour dans une file FIFO bornée
+    - réponse 429 avec Retry-After si la file est pleine ou l'attente trop longue
+
+    AJOUT: Clé d'idempotence optionnelle (en-tête Idempotency-Key ou champ
+    idempotency_key): une nouvelle tentative renvoie le résultat de la
+    première demande sans refaire la réservation.
+    """
+    key = request.headers.get("Idempotency-Key") or request.form.get(
+        "idempotency_key"
+    )
+    if not key:
+        return _admit_purchase()
+    # La clé est propre au club pour éviter les collisions entre clients
+    club = request.form.get("club_id") or request.form.get("club")
+    return _idempotent_purchase(f"{club}:{key}")
+
+
+# AJOUT: En-têtes propres à une réponse, non rejoués avec une clé d'idempotence
+_UNREPLAYED_HEADERS = frozenset(
+    ["Set-Cookie", "Content-Encoding", "Content-Length", "Vary"]
+)
+
+
+def _idempotent_purchase(key):
+    """
+    AJOUT: Traite une réservation identifiée par une clé d'idempotence.
+    Le résultat (corps, statut, en-têtes et messages flash en attente) est
+    conservé et rejoué pour les demandes suivantes portant la même clé.
+    Les refus transitoires (429, erreurs 5xx) ne sont pas conservés.
+    """
+    is_new, entry = idempotency_store.begin(key)
+    if not is_new:
+        result = entry.wait(app.config["IDEMPOTENCY_WAIT"])
+        if result is None:
+            return "A booking with this idempotency key is in progress", 409
+        body, status, headers, flashes = result
+        for category, message in flashes:
+            flash(message, category)
+        response = make_response(body, status, headers)
+        response.headers["Idempotent-Replayed"] = "true"
+        return response
+
+    try:
+        response = make_response(_admit_purchase())
+    except BaseException:
+        idempotency_store.abandon(key, entry)
+        raise
+    if response.status_code == 429 or response.status_code >= 500:
+        idempotency_store.abandon(key, entry)
+        return response
+    # Le corps est conservé non compressé, sans ses en-têtes d'encodage:
+    # l'encodage est à nouveau négocié pour chaque demande rejouée
+    # (compress_dynamic_response), selon son propre Accept-Encoding
+    body = compression.decompress(
+        response.get_data(), response.headers.get("Content-Encoding", "identity")
+    )
+    headers = [
+        (name, value)
+        for name, value in response.headers
+        if name not in _UNREPLAYED_HEADERS
+    ]
+    idempotency_store.complete(
+        entry,
+        (
+            body,
+            response.status_code,
+            headers,
+            [] if sessionless_messages() else list(session.get("_flashes", [])),
+        ),
+    )
+    return response
+
+
+def _admit_purchase():
     """
+    AJOUT: Réponse immédiate si la compétition est complète, sinon traitement
+    de la réservation une fois admise par le contrôle d'admission.
+    """
+    started = time.perf_counter()
+    view = current_view()
+    club, competition = _form_records(view)
+    sold_out = _sold_out_response(view, club, competition)
+    if sold_out is not None:
+        audit_booking(
+            "refused", started, club, competition, request.form.get("places"),
+            "Error: Competition is full",
+        )
+        return sold_out
+
+    # Une file par compétition, quelle que soit la façon de la désigner
+    admission_key = (
+        competition["name"] if competition else request.form.get("competition")
+    )
+    try:
+        with admission_controller.admit(
+            admission_key or "",
+            app.config["ADMISSION_MAX_WAITING"],
+            app.config["ADMISSION_TIMEOUT"],
+            app.config["ADMISSION_RETRY_AFTER"],
+        ):
+            return _purchase_places(started)
+    except AdmissionRejected as e:
+        audit_booking(
+            "rejected", started, club, competition, request.form.get("places"),
+            "Too many booking requests for this competition, please retry later",
+        )
+        return (
+            "Too many booking requests for this competition, please retry later",
+            429,
+            {"Retry-After": str(e.retry_after)},
+        )
+
+
+def _form_records(view):
+    """
+    AJOUT: (club, compétition) désignés par le formulaire de réservation, par
+    leurs identifiants (club_id, competition_id) ou, pour les anciens
+    formulaires, par leurs noms. Chacun vaut None s'il est inconnu.
+    """
+    competition_ref = request.form.get("competition_id")
+    if competition_ref is not None:
+        competition = view.competitions_by_id.get(parse_id(competition_ref))
+    else:
+        competition = view.competitions_by_name.get(request.form.get("competition"))
+    club_ref = request.form.get("club_id")
+    if club_ref is not None:
+        club_id = parse_id(club_ref)
+        club = resolve_club(view, club_id=club_id) if club_id else None
+    else:
+        club = resolve_club(view, request.form.get("club") or None)
+    return club, competition
+
+
+def _sold_out_response(view, club, competition):
+    """
+    AJOUT: Réponse immédiate lorsque la compétition n'a plus de places,
+    déterminée à partir des données en mémoire uniquement (le nombre de places
+    ne fait que diminuer avec les réservations). Renvoie None sinon.
+    """
+    if competition is None or competition["numberOfPlaces"] > 0:
+        return None
+    if club is None:
+        return redirect_home("Error: Competition is full")
+    return welcome_error(club, "Error: Competition is full", view)
+
+
+def _record_locks(club_name, competition_name):
+    """
+    AJOUT: Verrous inter-processus des enregistrements concernés par une
+    réservation (backend "mmap" uniquement), compétition avant club.
+    """
+    if not use_record_store():
+        return ()
+    return (
+        get_store("competitions").lock_record(competition_name),
+        get_store("clubs").lock_record(club_name),
+    )
+
+
+def _sync_counters(view, club, competition):
+    """
+    AJOUT: Avec le backend "mmap", relit sous verrou les compteurs partagés
+    avec les autres processus avant de vérifier la réservation, ainsi que le
+    total déjà réservé par le club pour la compétition (bookings.json).
+    Renvoie (vue, club, compétition); la vue n'est pas publiée, elle ne sert
+    qu'à la vérification.
+    """
+    if use_record_store():
+        club = {**club, "points": get_store("clubs").get_value(club["name"])}
+        competition = {
+            **competition,
+            "numberOfPlaces": get_store("competitions").get_value(
+                competition["name"]
+            ),
+        }
+        key = f"{club['name']}_{competition['name']}"
+        booked = int(load_bookings().get(key, 0))
+        if booked != view.booked(club["id"], competition["id"]):
+            view = view.with_booking(
+                club, competition, club["points"], competition["numberOfPlaces"], booked
+            )
+    return view, club, competition
+
+
+def _purchase_places(started=None):
+    """
+    Traitement d'une demande de réservation, exécuté une fois la requête admise
+    pour sa compétition.
+    AJOUT: chaque issue est ajoutée au journal d'audit (voir audit_booking).
+    """
+    club = competition = None
+    places = request.form.get("places")
     try:
-        global clubs, competitions
         # Reload data to ensure we have the latest state
-        clubs = loadClubs()
-        competitions = loadCompetitions()
+        # AMÉLIORATION: rechargement uniquement si les fichiers ont changé
+        refresh_data()
 
         # Récupérer les données du formulaire
-        competition_name = request.form.get("competition")
-        club_name = request.form.get("club")
-        places_str = request.form.get("places")
+        # AJOUT: le club connecté est retrouvé par sa session, sans son nom;
+        # le club et la compétition sont désignés par leurs identifiants
+        view = current_view()
+        club, competition = _form_records(view)
+        form = request.form
+        club_ref = club["name"] if club else form.get("club_id") or form.get("club")
+        competition_ref = form.get("competition_id") or form.get("competition")
+        places_str = form.get("places")
         
         # Étape 1 : Valider les données de base
-        valid, error_msg, places_required = validate_booking_request(
-            competition_name, club_name, places_str
-        )
-        if not valid:
-            flash(error_msg)
-            return redirect(url_for("index"))
-        
-        # Étape 2 : Récupérer le club et la compétition
-        competition = next(
-            (c for c in competitions if c["name"] == competition_name), None
+        places = places_required = validate_booking_request(
+            competition_ref, club_ref, places_str
         )
-        club = next((c for c in clubs if c["name"] == club_name), None)
-        
-        if not competition or not club:
-            flash("Error: Club or competition not found")
-            return redirect(url_for("index"))
-        
-        # Étape 3 : Vérifier la disponibilité et les contraintes
-        valid, error_msg = check_availability(competition, club, places_required)
-        if not valid:
-            flash(error_msg)
-            open_comps = [
-                comp for comp in competitions if is_competition_open(comp)
-            ]
-            return render_template("welcome.html", club=club, competitions=open_comps)
-        
-        # Étape 4 : Traiter la réservation
-        process_booking(club, competition, places_required)
-        
-        # Étape 5 : Recharger les données pour la cohérence
-        clubs = loadClubs()
-        competitions = loadCompetitions()
         
-        # Récupérer les données mises à jour pour l'affichage
-        updated_club = next((c for c in clubs if c["name"] == club_name), None)
-        open_comps = [comp for comp in competitions if is_competition_open(comp)]
+        # Étape 2 : Vérifier le club et la compétition
+        if competition is None or club is None:
+            raise NotFound("Error: Club or competition not found")
+        club_id, competition_id = club["id"], competition["id"]
+        club_name, competition_name = club["name"], competition["name"]
         
-        flash("Great-booking complete!")
-        return render_template("welcome.html", club=updated_club, competitions=open_comps)
-
+        # AJOUT: Vérification et traitement sous les verrous du shard de la
+        # compétition et du club: les réservations sur d'autres shards se
+        # poursuivent en parallèle (AJOUT: attente mesurée pour /readyz)
+        waiting = time.perf_counter()
+        with booking_locks(
+            shard_router,
+            club_locks,
+            club_name,
+            competition_name,
+            _record_locks(club_name, competition_name),
+        ):
+            lock_latency.record(time.perf_counter() - waiting)
+            # La vue a pu être remplacée pendant l'attente des verrous: les
+            # compteurs vérifiés sont ceux de la vue courante
+            view = current_view()
+            if competition_id not in view.competitions_by_id:
+                raise BookingRefused(
+                    "Error: This competition is no longer open for booking"
+                )
+            view, club, competition = _sync_counters(
+                view,
+                view.clubs_by_id[club_id],
+                view.competitions_by_id[competition_id],
+            )
+            
+            # Étape 3 : Vérifier la disponibilité et les contraintes
+            check_availability(competition, club, places_required, view)
+            
+            # Étape 4 : Traiter la réservation
+            # (une nouvelle vue des données est publiée)
+            view = process_booking(club, competition, places_required, started)
+
+    # AJOUT: Refus attendus sans trace de pile ni rendu complet
+    except BookingRefused as e:
+        audit_booking("refused", started, club, competition, places, e.message)
+        view = current_view()
+        return welcome_error(view.clubs_by_id[club_id], e.message, view)
+    except DomainError as e:
+        audit_booking("invalid", started, club, competition, places, e.message)
+        return redirect_home(e.message)
     except Exception as e:
-        flash(f"Error: {str(e)}")
-        return redirect(url_for("index"))
+        audit_booking("error", started, club, competition, places, repr(e))
+        return unexpected_error("purchasePlaces")
+
+    notify("Great-booking complete!")
+    return render_welcome(view.clubs_by_id[club_id], view)
 
 
 @app.route("/points")
 def displayPoints():
-    """Route pour afficher les points des clubs sur une page HTML."""
-    return render_template("points.html", clubs=clubs)
+    """
+    Route pour afficher les points des clubs sur une page HTML.
+    AMÉLIORATION: page pré-rendue (et pré-compressée) une fois par version des
+    données, à partir des mêmes données que /api/points.
+    AJOUT: ?sort=points affiche les clubs classés par points.
+    """
+    refresh_data()
+    body = "ranked_html" if request.args.get("sort") == "points" else "html"
+    return versioned_response(points_body(body), "text/html")
 
 
 @app.route("/api/points")
-@cache.cached(timeout=30)  # AJOUT: Cache pour 30 secondes
 def api_points():
     """
     AJOUT: API endpoint pour récupérer les points des clubs.
-    Implémente un cache de 30 secondes pour optimiser les performances.
     Renvoie les points des clubs au format JSON.
 
     Nouvelle fonctionnalité qui n'existait pas dans le code original.
     Cette API RESTful permet l'accès aux données des clubs au format JSON,
     avec mise en cache pour optimiser les performances.
+
+    AMÉLIORATION: la réponse est précalculée une fois par version des données
+    (au lieu d'un cache de 30 secondes rechargeant le fichier à chaque échec),
+    ce qui garantit la cohérence avec la page /points.
+
+    AJOUT: ?top=N renvoie les N premiers clubs du classement avec leur rang.
     """
+    top = request.args.get("top")
+    if top is not None:
+        try:
+            limit = int(top)
+        except ValueError:
+            limit = 0
+        if limit < 1:
+            return {"error": "top must be a positive integer"}, 400
     try:
-        clubs_data = loadClubs()
-        clubs_points = [
-            {"name": club["name"], "points": club["points"]} for club in clubs_data
-        ]
-        return {"clubs": clubs_points}
+        refresh_data()
+        if top is not None:
+            return {"clubs": ranked_clubs(limit)[1]}
+        return versioned_response(points_body("json"), "application/json")
     except Exception as e:
         return {"error": str(e)}, 500
 
 
+@app.route("/api/clubs/<club>/rank")
+def api_club_rank(club):
+    """
+    AJOUT: Rang d'un club (désigné par son identifiant ou son nom) dans le
+    classement par points (les ex aequo partagent le même rang), lu dans le
+    classement maintenu sans tri.
+    """
+    refresh_data()
+    found_club = find_club(current_view(), club)
+    if found_club is None:
+        return {"error": "Club not found"}, 404
+    view, rank = club_rank(found_club["name"])
+    if rank is None:
+        return {"error": "Club not found"}, 404
+    return {
+        "id": found_club["id"],
+        "club": found_club["name"],
+        "points": view.clubs_by_name[found_club["name"]]["points"],
+        "rank": rank,
+        "clubs": len(view.clubs),
+    }
+
+
+@app.route("/api/clubs/<club>/bookings")
+def api_club_bookings(club):
+    """
+    AJOUT: Résumé des réservations d'un club (désigné par son identifiant ou
+    son nom).
+    Pour chaque compétition: places déjà réservées, places encore réservables
+    sous la limite de 12 et état ouvert/fermé, ainsi que les points du club.
+    Servi depuis les agrégats en mémoire, sans lecture de bookings.json.
+    """
+    refresh_data()
+    view = current_view()
+    found_club = find_club(view, club)
+    if found_club is None:
+        return {"error": "Club not found"}, 404
+    booked = view.club_bookings.get(found_club["id"], {})
+    summary = []
+    for comp in view.competitions:
+        places = booked.get(comp["id"], 0)
+        summary.append(
+            {
+                "id": comp["id"],
+                "name": comp["name"],
+                "booked": places,
+                "remainingAllowance": max(0, MAX_PLACES_PER_COMPETITION - places),
+                "open": is_competition_open(comp),
+            }
+        )
+    return {
+        "id": found_club["id"],
+        "club": found_club["name"],
+        "points": found_club["points"],
+        "totalBooked": sum(booked.values()),
+        "competitions": summary,
+    }
+
+
+def eligibility_matrix(view=None):
+    """
+    AJOUT: Places encore réservables par chaque club pour chaque compétition,
+    calculées en une passe pour toute la matrice. Le résultat est conservé
+    tant que ni les données ni l'état ouvert/fermé des compétitions ne
+    changent.
+    """
+    global _eligibility
+    view = view or current_view()
+    open_mask = tuple(is_competition_open(comp) for comp in view.competitions)
+    cached = _eligibility
+    if cached.get("key") != (view.version, open_mask):
+        cached = {
+            "key": (view.version, open_mask),
+            "matrix": eligibility.compute(
+                view.clubs,
+                view.competitions,
+                view.club_bookings,
+                open_mask,
+                MAX_PLACES_PER_COMPETITION,
+            ),
+        }
+        _eligibility = cached
+    return cached["matrix"]
+
+
+def admin_denied():
+    """
+    AJOUT: Réponse d'erreur si la requête ne porte pas le jeton
+    d'administration (ADMIN_TOKEN), None sinon.
+    """
+    token = app.config["ADMIN_TOKEN"]
+    if not token:
+        return {"error": "Admin access is not configured"}, 403
+    scheme, _, credentials = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(
+        credentials.encode(), token.encode()
+    ):
+        return {"error": "Admin token required"}, 401, {"WWW-Authenticate": "Bearer"}
+    return None
+
+
+@app.route("/api/eligibility")
+def api_eligibility():
+    """
+    AJOUT: Rapport d'éligibilité, réservé à l'administration (voir
+    admin_denied): par défaut, nombre de clubs éligibles et total des places
+    réservables par compétition. ?offset=&limit= renvoie les lignes de la
+    matrice (places encore réservables par club et par compétition, 0 si le
+    club ne peut pas réserver) pour une page de clubs, au plus
+    ELIGIBILITY_PAGE_SIZE. ?club=<identifiant ou nom> ne renvoie que la
+    ligne du club.
+    """
+    denied = admin_denied()
+    if denied is not None:
+        return denied
+    refresh_data()
+    view = current_view()
+    matrix = eligibility_matrix(view)
+    club = request.args.get("club")
+    if club is None:
+        if "offset" not in request.args and "limit" not in request.args:
+            return {"version": view.version, **matrix.summary()}
+        page_size = app.config["ELIGIBILITY_PAGE_SIZE"]
+        try:
+            offset = int(request.args.get("offset", 0))
+            limit = int(request.args.get("limit", page_size))
+        except ValueError:
+            return {"error": "offset and limit must be integers"}, 400
+        if offset < 0 or not 0 < limit <= page_size:
+            return {
+                "error": f"offset must be >= 0 and limit between 1 and {page_size}"
+            }, 400
+        return {
+            "version": view.version,
+            "offset": offset,
+            "limit": limit,
+            "totalClubs": len(matrix.club_ids),
+            "clubs": matrix.club_ids[offset:offset + limit],
+            "competitions": matrix.competition_ids,
+            "open": matrix.open_mask,
+            "maxBookable": matrix.rows(offset, offset + limit),
+        }
+    found_club = find_club(view, club)
+    if found_club is None:
+        return {"error": "Club not found"}, 404
+    return {
+        "version": view.version,
+        "id": found_club["id"],
+        "club": found_club["name"],
+        "competitions": matrix.competition_ids,
+        "maxBookable": matrix.row(found_club["id"]),
+    }
+
+
+@app.route("/api/competitions")
+def api_competitions():
+    """
+    AJOUT: Places disponibles et état ouvert/fermé de chaque compétition.
+    """
+    refresh_data()
+    view = current_view()
+    return {
+        "version": view.version,
+        "competitions": [competition_state(comp) for comp in view.competitions],
+    }
+
+
+@app.route("/api/competitions/stream")
+def api_competitions_stream():
+    """
+    AJOUT: Flux Server-Sent Events des changements de places.
+    Le premier événement ("snapshot") contient l'état de toutes les
+    compétitions; chaque réservation envoie ensuite un événement "update"
+    pour la compétition modifiée. Remplace l'interrogation répétée des pages.
+    """
+    refresh_data()
+    snapshot = app.json.dumps(
+        {
+            "competitions": [
+                competition_state(comp) for comp in current_view().competitions
+            ]
+        }
+    )
+    subscriber = competition_publisher.subscribe()
+    keepalive = app.config["SSE_KEEPALIVE"]
+
+    def stream():
+        try:
+            yield format_sse(snapshot, event="snapshot")
+            while True:
+                try:
+                    event = subscriber.get(timeout=keepalive)
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+                    continue
+                yield format_sse(app.json.dumps(event), event="update")
+        finally:
+            competition_publisher.unsubscribe(subscriber)
+
+    return Response(
+        stream(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def get_audit_log():
+    """
+    AJOUT: Journal d'audit, créé et démarré à la première utilisation. Les
+    événements en attente sont écrits à l'arrêt du processus.
+    """
+    global _audit_log
+    if _audit_log is None:
+        _audit_log = AuditLog(
+            app.config["AUDIT_PATH"],
+            capacity=app.config["AUDIT_BUFFER_SIZE"],
+            max_bytes=app.config["AUDIT_MAX_BYTES"],
+            backup_count=app.config["AUDIT_BACKUP_COUNT"],
+            flush_interval=app.config["AUDIT_FLUSH_INTERVAL"],
+        )
+        _audit_log.start()
+        atexit.register(_audit_log.stop, 5)
+    return _audit_log
+
+
+def audit_booking(outcome, started, club, competition, places, message=None, view=None):
+    """
+    AJOUT: Ajoute une demande de réservation au journal d'audit, sans entrée/
+    sortie: date, club, compétition, places demandées, résultat ("booked",
+    "refused", "invalid", "error" ou "rejected" par le contrôle d'admission),
+    durée depuis `started` (début de la requête) et, pour une
+    réservation effectuée (`view` publiée), les compteurs après réservation.
+    """
+    if not app.config["AUDIT_ENABLED"]:
+        return
+    event = {
+        "ts": datetime.now().isoformat(timespec="milliseconds"),
+        "outcome": outcome,
+        "club": club["name"] if club else None,
+        "clubId": club["id"] if club else None,
+        "competition": competition["name"] if competition else None,
+        "competitionId": competition["id"] if competition else None,
+        "places": places,
+        "latencyMs": (
+            None if started is None
+            else round((time.perf_counter() - started) * 1000, 3)
+        ),
+    }
+    if message is not None:
+        event["message"] = message
+    if view is not None:
+        event["pointsAfter"] = view.clubs_by_id[club["id"]]["points"]
+        event["placesAfter"] = view.competitions_by_id[competition["id"]][
+            "numberOfPlaces"
+        ]
+    get_audit_log().record(event)
+
+
+def _timestamp(value):
+    """AJOUT: Date ISO 8601 d'un timestamp, ou None."""
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value).isoformat(timespec="seconds")
+
+
+@app.route("/healthz")
+def healthz():
+    """
+    AJOUT: Sonde de vivacité: le processus répond. Aucun accès aux données.
+    """
+    return {"status": "ok", "uptime": round(time.time() - _started_at, 3)}
+
+
+@app.route("/readyz")
+def readyz():
+    """
+    AJOUT: Sonde de disponibilité, servie depuis l'état en mémoire uniquement
+    (ni lecture de fichier ni verrou de données): données chargées, nombre
+    d'enregistrements, version, dates du dernier chargement et de la
+    dernière sauvegarde, durées des sauvegardes et de l'attente des verrous.
+    Répond 503 tant que les données n'ont pas été chargées ou si le dernier
+    chargement a échoué (fichier absent ou invalide, `loadErrors`). Une liste
+    vide chargée sans erreur (toutes les compétitions archivées, aucune à
+    venir) ne rend pas le processus indisponible.
+    """
+    view = current_view()
+    load_errors = dict(_load_errors)
+    ready = _last_load is not None and not load_errors
+    body = {
+        "status": "ready" if ready else "not ready",
+        "data": {
+            "version": view.version,
+            "clubs": len(view.clubs),
+            "competitions": len(view.competitions),
+            "lastLoad": _timestamp(_last_load),
+            "loadErrors": load_errors,
+            "lastSave": _timestamp(_last_save),
+        },
+        "storage": {
+            "backend": app.config["DATA_BACKEND"],
+            "saveLatency": save_latency.summary(),
+        },
+        "locks": {
+            "waitLatency": lock_latency.summary(),
+            "admissionLastWaitMs": round(admission_controller.last_wait * 1000, 3),
+        },
+        "audit": _audit_log.stats() if _audit_log is not None else None,
+    }
+    return body, 200 if ready else 503
+
+
 @app.route("/logout")
 def logout():
-    """Route de déconnexion qui redirige vers la page d'accueil."""
-    return redirect(url_for("index"))
+    """
+    Route de déconnexion qui redirige vers la page d'accueil.
+    AJOUT: ferme la session côté serveur et efface son cookie.
+    """
+    response = redirect(url_for("index"))
+    session_id = request.cookies.get(app.config["SESSION_ID_COOKIE"])
+    if session_id:
+        get_session_store().delete(session_id)
+        response.delete_cookie(app.config["SESSION_ID_COOKIE"])
+    return response
 
 
 # AJOUT: Gestionnaires d'erreur pour les erreurs 404 et 500
@@ -494,8 +2207,9 @@ def not_found_error(error):
     """
     AJOUT: Gestionnaire pour les erreurs 404 (page non trouvée).
     Renvoie une page d'erreur personnalisée au lieu de l'erreur standard.
+    AMÉLIORATION: page rendue et compressée une seule fois (static_page_bodies).
     """
-    return render_template("404.html"), 404
+    return precomputed_response(static_page_bodies("404.html"), "text/html", 404)
 
 
 @app.errorhandler(500)
@@ -503,5 +2217,6 @@ def internal_error(error):
     """
     AJOUT: Gestionnaire pour les erreurs 500 (erreur serveur).
     Renvoie une page d'erreur personnalisée au lieu de l'erreur standard.
+    AMÉLIORATION: page rendue et compressée une seule fois (static_page_bodies).
     """
-    return render_template("500.html"), 500
+    return precomputed_response(static_page_bodies("500.html"), "text/html", 500)
@@ -0,0 +1,95 @@
+"""
+AJOUT: Sessions côté serveur conservant le club connecté.
+
+Sans état de connexion, chaque requête retrouvait le club à partir de l'email
+(showSummary) ou du nom transmis dans l'URL ou le formulaire (book,
+purchasePlaces). Après la connexion, le club résolu est enregistré dans une
+session côté serveur; le navigateur ne reçoit qu'un identifiant opaque et les
+requêtes suivantes retrouvent le club par une simple recherche de clé.
+
+Deux backends sont disponibles:
+
+- `MemorySessionBackend`: en mémoire du processus, LRU borné et expiration
+  glissante (la durée de vie repart à chaque utilisation),
+- `CacheSessionBackend`: délégation à un cache Flask-Caching, partagé entre
+  processus si le cache l'est (Redis, Memcached...).
+"""
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+
+def new_session_id():
+    """Identifiant de session aléatoire, non devinable."""
+    return secrets.token_urlsafe(32)
+
+
+class MemorySessionBackend:
+    """
+    Sessions en mémoire: LRU de `max_entries` sessions expirant `ttl`
+    secondes après leur dernière utilisation.
+    """
+
+    def __init__(self, max_entries=10000, ttl=1800, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sessions = OrderedDict()
+
+    def create(self, data):
+        """Enregistre une nouvelle session et renvoie son identifiant."""
+        session_id = new_session_id()
+        with self._lock:
+            self._sessions[session_id] = (data, self._clock() + self.ttl)
+            while len(self._sessions) > self.max_entries:
+                self._sessions.popitem(last=False)
+        return session_id
+
+    def get(self, session_id):
+        """Renvoie les données de la session (prolongée), ou None."""
+        now = self._clock()
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return None
+            data, expires_at = entry
+            if expires_at <= now:
+                del self._sessions[session_id]
+                return None
+            self._sessions[session_id] = (data, now + self.ttl)
+            self._sessions.move_to_end(session_id)
+            return data
+
+    def delete(self, session_id):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._sessions)
+
+
+class CacheSessionBackend:
+    """Sessions stockées dans un cache Flask-Caching (clé "session:<id>")."""
+
+    def __init__(self, cache, ttl=1800):
+        self.cache = cache
+        self.ttl = ttl
+
+    def create(self, data):
+        session_id = new_session_id()
+        self.cache.set(f"session:{session_id}", data, timeout=self.ttl)
+        return session_id
+
+    def get(self, session_id):
+        data = self.cache.get(f"session:{session_id}")
+        if data is not None:
+            # Expiration glissante, comme le backend en mémoire
+            self.cache.set(f"session:{session_id}", data, timeout=self.ttl)
+        return data
+
+    def delete(self, session_id):
+        self.cache.delete(f"session:{session_id}")
@@ -0,0 +1,156 @@
+"""
+AJOUT: Partitionnement de l'état des réservations par compétition.
+
+Les compétitions sont réparties en shards par un hachage stable de leur nom.
+Chaque shard possède son verrou, qui protège les compteurs de places et les
+totaux de réservations de ses compétitions: des réservations sur des
+compétitions de shards différents s'exécutent en parallèle.
+
+Les points d'un club pouvant être débités depuis n'importe quel shard, ils
+sont protégés par un verrou par club. Le protocole de réservation acquiert
+toujours les verrous dans le même ordre (shard, puis club), ce qui exclut tout
+interblocage entre shards:
+
+1. verrou du shard de la compétition,
+2. verrou du club,
+3. vérification des places, de la limite et des points, débit et sauvegarde.
+
+Le hachage étant stable d'un processus à l'autre, un répartiteur de charge
+peut aussi envoyer les réservations d'une compétition toujours vers le même
+processus; avec le backend "mmap", des verrous d'enregistrement (fcntl)
+prolongent le même protocole entre processus.
+
+Les réservations ne tiennent le verrou des données (`SharedLock`) qu'en mode
+partagé: seuls le rechargement des fichiers et l'archivage l'acquièrent en
+mode exclusif. Restent sérialisés entre shards: la réécriture de
+bookings.json (fichier unique, sous son verrou de fichier), la publication de
+la vue suivante (courte, O(√n)) et, avec le backend "json", la réécriture des
+fichiers clubs.json et competitions.json complets. Avec le backend "mmap", la
+vérification et la mise à jour en place des compteurs s'exécutent en
+parallèle.
+"""
+
+import threading
+import zlib
+from contextlib import ExitStack, contextmanager
+
+
+class SharedLock:
+    """
+    Verrou partagé/exclusif. Le mode exclusif (`with lock`, acquire/release,
+    comme un RLock) est réentrant et prioritaire: un écrivain en attente
+    bloque les nouvelles acquisitions partagées. Le détenteur du mode
+    exclusif peut aussi l'acquérir en mode partagé.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._shared = 0
+        self._owner = None
+        self._depth = 0
+        self._waiting = 0
+
+    def acquire(self, blocking=True):
+        """
+        Acquiert le verrou en mode exclusif; renvoie False s'il est déjà pris
+        et que `blocking` est faux.
+        """
+        me = threading.get_ident()
+        with self._condition:
+            if self._owner == me:
+                self._depth += 1
+                return True
+            if not blocking and (self._owner is not None or self._shared):
+                return False
+            self._waiting += 1
+            try:
+                while self._owner is not None or self._shared:
+                    self._condition.wait()
+            finally:
+                self._waiting -= 1
+            self._owner, self._depth = me, 1
+            return True
+
+    def release(self):
+        with self._condition:
+            self._depth -= 1
+            if self._depth == 0:
+                self._owner = None
+                self._condition.notify_all()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    @contextmanager
+    def shared(self):
+        """Acquiert le verrou en mode partagé pour la durée du bloc."""
+        with self._condition:
+            owner = self._owner == threading.get_ident()
+            if not owner:
+                while self._owner is not None or self._waiting:
+                    self._condition.wait()
+                self._shared += 1
+        try:
+            yield
+        finally:
+            if not owner:
+                with self._condition:
+                    self._shared -= 1
+                    if not self._shared:
+                        self._condition.notify_all()
+
+
+class Shard:
+    """Partition de compétitions, protégée par son propre verrou."""
+
+    def __init__(self, index):
+        self.index = index
+        self.lock = threading.Lock()
+
+
+class ShardRouter:
+    """Répartition stable des compétitions entre `count` shards."""
+
+    def __init__(self, count):
+        if count < 1:
+            raise ValueError("Shard count must be at least 1")
+        self.shards = [Shard(index) for index in range(count)]
+
+    def shard_for(self, competition_name):
+        """Renvoie le shard propriétaire de la compétition."""
+        index = zlib.crc32(competition_name.encode("utf-8")) % len(self.shards)
+        return self.shards[index]
+
+
+class ClubLocks:
+    """Verrous par club, créés à la demande."""
+
+    def __init__(self):
+        self._guard = threading.Lock()
+        self._locks = {}
+
+    def lock_for(self, club_name):
+        with self._guard:
+            lock = self._locks.get(club_name)
+            if lock is None:
+                lock = self._locks[club_name] = threading.Lock()
+            return lock
+
+
+@contextmanager
+def booking_locks(router, club_locks, club_name, competition_name, record_locks=()):
+    """
+    Acquiert les verrous d'une réservation dans l'ordre du protocole:
+    shard de la compétition, club, puis les éventuels verrous
+    d'enregistrement inter-processus (`record_locks`, gestionnaires de
+    contexte, compétition avant club). Renvoie le shard utilisé.
+    """
+    shard = router.shard_for(competition_name)
+    with shard.lock, club_locks.lock_for(club_name), ExitStack() as stack:
+        for record_lock in record_locks:
+            stack.enter_context(record_lock)
+        yield shard
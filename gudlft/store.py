@@ -0,0 +1,360 @@
+"""
+AJOUT: Stockage binaire à enregistrements de taille fixe pour les clubs et les compétitions.
+
+Les fichiers JSON doivent être entièrement réécrits à chaque réservation, même
+lorsqu'un seul compteur (points d'un club, places d'une compétition) change.
+Ce module propose un format alternatif:
+
+- un en-tête (signature, taille d'enregistrement, nombre d'enregistrements),
+- des enregistrements de taille fixe (champs texte complétés par des octets nuls,
+  un entier signé de 64 bits pour la valeur modifiable puis l'identifiant
+  numérique stable de l'enregistrement, 0 s'il n'en a pas encore),
+- un index en mémoire nom -> position construit à l'ouverture.
+
+Le fichier est projeté en mémoire (mmap): une mise à jour de `points` ou de
+`numberOfPlaces` n'écrit que 8 octets en place, et le chargement au démarrage
+lit directement les enregistrements sans analyser de JSON.
+Les fichiers JSON restent les formats d'import et d'export.
+"""
+
+import mmap
+import os
+import struct
+from collections import namedtuple
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+from . import jsoncodec
+from .jsonstream import JSONStreamError, iter_items
+from .validation import RecordValidator
+
+MAGIC = b"GUDREC02"
+HEADER = struct.Struct("<8sII")  # signature, taille d'un enregistrement, nombre
+
+# Résultat d'un import en flux: fichier créé (None s'il n'a pas été écrit),
+# nombre d'enregistrements écrits et erreurs ("clubs[3]: ...")
+ImportResult = namedtuple("ImportResult", ["store", "count", "errors"])
+
+# Nombre d'enregistrements lus entre deux appels du suivi de progression
+PROGRESS_EVERY = 10000
+
+# Description d'un type d'enregistrement: champs texte (nom, largeur en octets),
+# le premier étant la clé d'index, puis le champ entier modifiable en place
+# (suivi de l'identifiant "id").
+RecordLayout = namedtuple("RecordLayout", ["text_fields", "int_field"])
+
+CLUB_LAYOUT = RecordLayout(
+    text_fields=(("name", 64), ("email", 128)), int_field="points"
+)
+COMPETITION_LAYOUT = RecordLayout(
+    text_fields=(("name", 64), ("date", 32)), int_field="numberOfPlaces"
+)
+
+
+class StoreError(Exception):
+    """Erreur de lecture ou d'écriture d'un fichier d'enregistrements."""
+
+
+def _record_struct(layout):
+    """Construit le struct correspondant à un enregistrement du layout."""
+    fields = "".join(f"{width}s" for _, width in layout.text_fields)
+    return struct.Struct(f"<{fields}qq")
+
+
+def _encode_text(value, field, width):
+    """Encode un champ texte en UTF-8 en vérifiant qu'il tient dans sa largeur."""
+    data = str(value).encode("utf-8")
+    if len(data) > width or b"\0" in data:
+        raise StoreError(f"Field '{field}' does not fit in {width} bytes: {value!r}")
+    return data
+
+
+class RecordStore:
+    """
+    Fichier d'enregistrements de taille fixe projeté en mémoire, indexé par nom.
+
+    Les lectures et les mises à jour passent par le mmap: `set_value` modifie
+    l'entier d'un enregistrement en place sans réécrire le reste du fichier.
+    """
+
+    def __init__(self, path, layout):
+        self.path = path
+        self.layout = layout
+        self._struct = _record_struct(layout)
+        self._int_offset = sum(width for _, width in layout.text_fields)
+        self._file = open(path, "r+b")
+        stat = os.fstat(self._file.fileno())
+        # Identité du fichier ouvert: un remplacement (os.replace) par un
+        # autre processus est détecté par is_current()
+        self._file_id = (stat.st_dev, stat.st_ino)
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0)
+            magic, record_size, count = HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC or record_size != self._struct.size:
+                raise StoreError(f"Invalid record store: {path}")
+            self._count = count
+            self._index = self._build_index()
+        except (StoreError, ValueError, struct.error) as e:
+            self.close()
+            raise StoreError(f"Cannot open record store {path}: {e}") from e
+
+    def _build_index(self):
+        """Construit l'index nom -> offset en ne lisant que le champ clé."""
+        key_width = self.layout.text_fields[0][1]
+        index = {}
+        for position in range(self._count):
+            offset = HEADER.size + position * self._struct.size
+            name = self._mm[offset:offset + key_width].rstrip(b"\0").decode("utf-8")
+            if name in index:
+                raise StoreError(f"Duplicate record: {name}")
+            index[name] = offset
+        return index
+
+    @classmethod
+    def create(cls, path, layout, records):
+        """
+        Écrit un nouveau fichier à partir d'un itérable de dictionnaires.
+        Les enregistrements sont écrits au fil de l'eau puis le fichier
+        est remplacé atomiquement.
+        """
+        record_struct = _record_struct(layout)
+        tmp_path = f"{path}.tmp"
+        count = 0
+        f = open(tmp_path, "wb")
+        try:
+            with f:
+                f.write(HEADER.pack(MAGIC, record_struct.size, 0))
+                for record in records:
+                    values = [
+                        _encode_text(record[field], field, width)
+                        for field, width in layout.text_fields
+                    ]
+                    values.append(int(record[layout.int_field]))
+                    values.append(int(record.get("id") or 0))
+                    f.write(record_struct.pack(*values))
+                    count += 1
+                f.seek(0)
+                f.write(HEADER.pack(MAGIC, record_struct.size, count))
+        except BaseException:
+            # Import interrompu: le fichier existant reste inchangé
+            os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, path)
+        return cls(path, layout)
+
+    @classmethod
+    def import_json(cls, json_path, root_key, path, layout):
+        """
+        Crée le fichier d'enregistrements à partir d'un fichier JSON existant,
+        en attribuant leur identifiant aux enregistrements qui n'en ont pas.
+
+        AMÉLIORATION: import en flux (voir stream_import); lève StoreError si
+        un enregistrement est invalide.
+        """
+        result = stream_import(json_path, root_key, path, layout)
+        if result.errors:
+            raise StoreError(
+                f"Cannot import {json_path}: {result.errors[0]}"
+                f" ({len(result.errors)} error(s))"
+            )
+        return result.store
+
+    def export_json(self, json_path, root_key):
+        """
+        Exporte les enregistrements au format JSON de l'application
+        (valeurs entières stockées comme chaînes).
+        """
+        records = []
+        for record in self.records():
+            record[self.layout.int_field] = str(record[self.layout.int_field])
+            records.append(record)
+        with open(json_path, "w") as f:
+            jsoncodec.dump({root_key: records}, f)
+
+    def _decode(self, values):
+        record = {
+            field: raw.rstrip(b"\0").decode("utf-8")
+            for (field, _), raw in zip(self.layout.text_fields, values)
+        }
+        record[self.layout.int_field] = values[-2]
+        if values[-1]:
+            record["id"] = values[-1]
+        return record
+
+    def records(self):
+        """Renvoie tous les enregistrements sous forme de dictionnaires."""
+        end = HEADER.size + self._count * self._struct.size
+        return [
+            self._decode(values)
+            for values in self._struct.iter_unpack(self._mm[HEADER.size:end])
+        ]
+
+    def get(self, name):
+        """Renvoie l'enregistrement `name` ou None s'il n'existe pas."""
+        offset = self._index.get(name)
+        if offset is None:
+            return None
+        return self._decode(self._struct.unpack_from(self._mm, offset))
+
+    def get_value(self, name):
+        """Lit directement le champ entier de l'enregistrement `name`."""
+        offset = self._index.get(name)
+        if offset is None:
+            raise KeyError(name)
+        return struct.unpack_from("<q", self._mm, offset + self._int_offset)[0]
+
+    def is_current(self):
+        """
+        Indique si `path` désigne toujours le fichier ouvert (il a pu être
+        remplacé par un autre processus, par exemple lors d'un archivage).
+        """
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        return (stat.st_dev, stat.st_ino) == self._file_id
+
+    @contextmanager
+    def _lock(self, size, offset):
+        fcntl.lockf(self._file, fcntl.LOCK_EX, size, offset, os.SEEK_SET)
+        try:
+            # Fichier remplacé pendant l'attente: écrire dans l'ancien
+            # fichier perdrait la mise à jour
+            if not self.is_current():
+                raise StoreError(f"Record store {self.path} was replaced")
+            yield
+        finally:
+            fcntl.lockf(self._file, fcntl.LOCK_UN, size, offset, os.SEEK_SET)
+
+    @contextmanager
+    def lock_record(self, name):
+        """
+        Verrou exclusif inter-processus (fcntl) sur l'enregistrement `name`.
+        Sans effet si l'enregistrement est inconnu ou si fcntl est indisponible.
+        Lève StoreError si le fichier a été remplacé pendant l'attente.
+        """
+        offset = self._index.get(name)
+        if offset is None or fcntl is None:
+            yield
+            return
+        with self._lock(self._struct.size, offset):
+            yield
+
+    @contextmanager
+    def lock_file(self):
+        """
+        Verrou exclusif inter-processus (fcntl) sur tout le fichier: attend
+        la fin des réservations en cours des autres processus (verrous
+        d'enregistrement) avant de le réécrire.
+        """
+        if fcntl is None:
+            yield
+            return
+        with self._lock(0, 0):
+            yield
+
+    def fill_ids(self, next_id):
+        """
+        Attribue en place les identifiants manquants (0), à partir de
+        `next_id` et dans l'ordre du fichier. Renvoie le nombre attribué.
+        """
+        id_offset = self._int_offset + 8
+        assigned = 0
+        for position in range(self._count):
+            offset = HEADER.size + position * self._struct.size + id_offset
+            if not struct.unpack_from("<q", self._mm, offset)[0]:
+                struct.pack_into("<q", self._mm, offset, next_id + assigned)
+                assigned += 1
+        return assigned
+
+    def set_value(self, name, value):
+        """Met à jour en place le champ entier de l'enregistrement `name`."""
+        offset = self._index.get(name)
+        if offset is None:
+            raise KeyError(name)
+        struct.pack_into("<q", self._mm, offset + self._int_offset, int(value))
+
+    def flush(self):
+        """Force l'écriture des pages modifiées sur le disque."""
+        self._mm.flush()
+
+    def close(self):
+        """Ferme la projection mémoire et le fichier sous-jacent."""
+        mm = getattr(self, "_mm", None)
+        if mm is not None:
+            mm.close()
+            self._mm = None
+        self._file.close()
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, name):
+        return name in self._index
+
+
+def stream_import(
+    json_path, root_key, path, layout, skip_invalid=False, progress=None,
+    use_ijson=None,
+):
+    """
+    AJOUT: Importe la liste `root_key` ("clubs" ou "competitions") du fichier
+    JSON `json_path` dans le fichier d'enregistrements `path` sans charger le
+    document entier: chaque enregistrement est lu (voir jsonstream.py),
+    validé, converti et écrit avant de passer au suivant. La mémoire utilisée
+    ne dépend que de la taille d'un enregistrement et des index d'unicité
+    (noms, emails, identifiants).
+
+    Toutes les erreurs sont collectées. S'il y en a, le fichier n'est pas
+    écrit, sauf avec `skip_invalid` où seuls les enregistrements invalides
+    sont écartés. Les enregistrements sans identifiant en reçoivent un à la
+    suite du plus grand. `progress(lus, octets lus, taille du fichier)` est
+    appelé tous les PROGRESS_EVERY enregistrements et à la fin de la lecture.
+    """
+    validator = RecordValidator()
+    check = validator.club if root_key == "clubs" else validator.competition
+    errors = validator.errors
+    max_id = 0
+
+    def records(f, total):
+        nonlocal max_id
+        position = -1
+        for position, record in enumerate(iter_items(f, root_key, use_ijson)):
+            if progress is not None and position and not position % PROGRESS_EVERY:
+                progress(position, f.tell(), total)
+            converted = check(record, position)
+            if converted is None:
+                continue
+            try:
+                for field, width in layout.text_fields:
+                    _encode_text(converted[field], field, width)
+            except StoreError as e:
+                errors.append(f"{root_key}[{position}]: {e}")
+                continue
+            max_id = max(max_id, converted.get("id", 0))
+            yield converted
+        if progress is not None:
+            progress(position + 1, f.tell(), total)
+        if errors and not skip_invalid:
+            raise _ImportAborted
+
+    try:
+        with open(json_path, "rb") as f:
+            store = RecordStore.create(
+                path, layout, records(f, os.fstat(f.fileno()).st_size)
+            )
+    except _ImportAborted:
+        return ImportResult(None, 0, errors)
+    except (OSError, JSONStreamError) as e:
+        errors.append(f"{json_path}: {e}")
+        return ImportResult(None, 0, errors)
+    store.fill_ids(max_id + 1)
+    return ImportResult(store, len(store), errors)
+
+
+class _ImportAborted(Exception):
+    """Import interrompu à cause d'enregistrements invalides."""
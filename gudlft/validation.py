@@ -0,0 +1,208 @@
+"""
+AJOUT: Validation des enregistrements de clubs et de compétitions.
+
+Au chargement, loadClubs et loadCompetitions se contentent de convertir les
+compteurs en entiers et renvoient une liste vide à la première erreur; les
+dates ne sont vérifiées qu'à l'affichage. Ce module vérifie chaque
+enregistrement une seule fois et collecte toutes les erreurs (avec la position
+de l'enregistrement fautif) au lieu de s'arrêter à la première.
+Il est utilisé par les commandes `gudlft compile-data` et `gudlft import`.
+
+Il attribue aussi les identifiants numériques stables des enregistrements
+(voir assign_ids).
+"""
+
+from datetime import datetime
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def normalize_email(email):
+    """
+    AJOUT: Normalise une adresse email pour la recherche d'un club:
+    espaces retirés, minuscules et nom de domaine converti en IDNA
+    (un domaine internationalisé et sa forme ASCII sont équivalents).
+    """
+    email = email.strip().lower()
+    local, sep, domain = email.rpartition("@")
+    if not sep:
+        return email
+    try:
+        domain = domain.encode("idna").decode("ascii")
+    except UnicodeError:
+        pass
+    return f"{local}@{domain}"
+
+
+def parse_date(value):
+    """Analyse une date de compétition ("2025-05-10 21:14:55")."""
+    return datetime.strptime(value, DATE_FORMAT)
+
+
+def _parse_count(value):
+    """Convertit un compteur (entier ou chaîne) en entier positif ou nul."""
+    if isinstance(value, bool):
+        raise ValueError(value)
+    count = int(value)
+    if count < 0:
+        raise ValueError(value)
+    return count
+
+
+def parse_id(value):
+    """Identifiant d'enregistrement valide (entier strictement positif) ou None."""
+    if isinstance(value, bool):
+        return None
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return None
+    return value if value > 0 else None
+
+
+def assign_ids(records, last_id=0):
+    """
+    Attribue un identifiant numérique ("id") aux enregistrements qui n'en ont
+    pas (ou dont l'identifiant est invalide ou en double), à la suite du plus
+    grand identifiant existant et dans l'ordre du fichier. Les identifiants
+    existants sont conservés et enregistrés avec les données à la sauvegarde
+    suivante: ils restent stables même si les noms changent.
+    `last_id` est le plus grand identifiant déjà attribué hors de `records`
+    (compétitions archivées): il n'est jamais réattribué.
+    Modifie et renvoie `records`.
+    """
+    used = set()
+    missing = []
+    for record in records:
+        record_id = parse_id(record.get("id"))
+        if record_id is None or record_id in used:
+            missing.append(record)
+        else:
+            record["id"] = record_id
+            used.add(record_id)
+    next_id = max(max(used, default=0), last_id) + 1
+    for record in missing:
+        record["id"] = next_id
+        next_id += 1
+    return records
+
+
+def _text(record, field):
+    value = record.get(field)
+    if not isinstance(value, str) or not value.strip():
+        return None
+    return value
+
+
+class RecordValidator:
+    """
+    Valide des enregistrements un par un en vérifiant l'unicité des noms et
+    des emails. Les erreurs sont accumulées dans `errors`.
+    """
+
+    def __init__(self):
+        self.errors = []
+        self._club_names = set()
+        self._emails = set()
+        self._competition_names = set()
+        self._ids = {"clubs": set(), "competitions": set()}
+
+    def _error(self, kind, position, message):
+        self.errors.append(f"{kind}[{position}]: {message}")
+
+    def _check_id(self, kind, record, position):
+        """
+        Vérifie l'identifiant facultatif d'un enregistrement. Renvoie
+        (valide, identifiant ou None).
+        """
+        if "id" not in record:
+            return True, None
+        record_id = parse_id(record["id"])
+        if record_id is None:
+            self._error(kind, position, f"invalid id {record['id']!r}")
+            return False, None
+        if record_id in self._ids[kind]:
+            self._error(kind, position, f"duplicate id {record_id}")
+            return False, None
+        return True, record_id
+
+    def club(self, record, position):
+        """
+        Renvoie le club converti ({"name", "email", "points": int} et "id"
+        s'il est présent) ou None si l'enregistrement est invalide.
+        """
+        if not isinstance(record, dict):
+            self._error("clubs", position, "record is not an object")
+            return None
+        valid = True
+        name = _text(record, "name")
+        if name is None:
+            self._error("clubs", position, "missing or empty name")
+            valid = False
+        elif name in self._club_names:
+            self._error("clubs", position, f"duplicate name {name!r}")
+            valid = False
+        email = _text(record, "email")
+        if email is None or "@" not in email:
+            self._error("clubs", position, f"invalid email {record.get('email')!r}")
+            valid = False
+        elif normalize_email(email) in self._emails:
+            self._error("clubs", position, f"duplicate email {email!r}")
+            valid = False
+        try:
+            points = _parse_count(record.get("points"))
+        except (TypeError, ValueError):
+            self._error("clubs", position, f"invalid points {record.get('points')!r}")
+            valid = False
+        id_valid, record_id = self._check_id("clubs", record, position)
+        if not (valid and id_valid):
+            return None
+        self._club_names.add(name)
+        self._emails.add(normalize_email(email))
+        club = {"name": name, "email": email, "points": points}
+        if record_id is not None:
+            self._ids["clubs"].add(record_id)
+            club["id"] = record_id
+        return club
+
+    def competition(self, record, position):
+        """
+        Renvoie la compétition convertie ({"name", "date",
+        "numberOfPlaces": int} et "id" s'il est présent) ou None si
+        l'enregistrement est invalide.
+        """
+        if not isinstance(record, dict):
+            self._error("competitions", position, "record is not an object")
+            return None
+        valid = True
+        name = _text(record, "name")
+        if name is None:
+            self._error("competitions", position, "missing or empty name")
+            valid = False
+        elif name in self._competition_names:
+            self._error("competitions", position, f"duplicate name {name!r}")
+            valid = False
+        date = record.get("date")
+        try:
+            parse_date(date)
+        except (TypeError, ValueError):
+            self._error("competitions", position, f"invalid date {date!r}")
+            valid = False
+        try:
+            places = _parse_count(record.get("numberOfPlaces"))
+        except (TypeError, ValueError):
+            self._error(
+                "competitions",
+                position,
+                f"invalid numberOfPlaces {record.get('numberOfPlaces')!r}",
+            )
+            valid = False
+        id_valid, record_id = self._check_id("competitions", record, position)
+        if not (valid and id_valid):
+            return None
+        self._competition_names.add(name)
+        competition = {"name": name, "date": date, "numberOfPlaces": places}
+        if record_id is not None:
+            self._ids["competitions"].add(record_id)
+            competition["id"] = record_id
+        return competition
@@ -0,0 +1,234 @@
+"""
+AJOUT: Vues immuables des données en mémoire (isolation des lectures).
+
+Les routes de lecture et les réservations partageaient les mêmes dictionnaires:
+une réservation modifiait en place les points et les places pendant qu'une
+autre requête les affichait, et un rechargement remplaçait les listes globales
+au milieu d'une requête.
+
+Une `DataView` regroupe une version des clubs, des compétitions, de leurs
+index et des agrégats de réservations. Elle n'est jamais modifiée après sa
+publication (copie à l'écriture):
+
+- un lecteur récupère la vue courante une fois (simple lecture d'attribut,
+  sans verrou) et l'utilise pendant toute la requête,
+- un écrivain construit une nouvelle vue à partir de la courante, avec des
+  copies des seuls enregistrements modifiés, puis la publie en remplaçant la
+  référence (opération atomique).
+
+Les lectures ne bloquent donc jamais derrière une réservation et ne voient
+jamais une réservation à moitié appliquée.
+
+Une réservation ne recopie pas les listes et les index complets (O(nombre
+d'enregistrements) sous le verrou de publication): la vue suivante partage
+ceux de la vue courante et n'y ajoute que les enregistrements remplacés
+(`PersistentMap`, `PersistentSequence`). Les modifications accumulées sont
+fusionnées dans une nouvelle base au-delà de √n environ, soit un coût amorti
+en O(√n) par réservation.
+"""
+
+from collections.abc import Mapping, Sequence
+
+from .validation import normalize_email
+
+# Nombre minimal de modifications accumulées avant fusion dans une nouvelle base
+MIN_COMPACT = 32
+
+
+def _compact_limit(size):
+    return max(MIN_COMPACT, int(size ** 0.5))
+
+
+class PersistentMap(Mapping):
+    """
+    Dictionnaire immuable: base partagée entre les versions et modifications
+    propres à cette version. `set` renvoie la version suivante.
+    """
+
+    __slots__ = ("_base", "_changes", "_added")
+
+    def __init__(self, base, changes=None, added=0):
+        self._base = base
+        self._changes = changes or {}
+        self._added = added
+
+    def __getitem__(self, key):
+        changes = self._changes
+        if key in changes:
+            return changes[key]
+        return self._base[key]
+
+    def __contains__(self, key):
+        return key in self._changes or key in self._base
+
+    def __iter__(self):
+        yield from self._base
+        for key in self._changes:
+            if key not in self._base:
+                yield key
+
+    def __len__(self):
+        return len(self._base) + self._added
+
+    def set(self, key, value):
+        """Copie de la table où `key` vaut `value`."""
+        added = self._added + (key not in self)
+        if len(self._changes) >= _compact_limit(len(self._base)):
+            return PersistentMap({**self._base, **self._changes, key: value})
+        return PersistentMap(self._base, {**self._changes, key: value}, added)
+
+
+class PersistentSequence(Sequence):
+    """
+    Tuple immuable: base partagée entre les versions et éléments remplacés
+    ({position: élément}) propres à cette version. `replace` renvoie la
+    version suivante.
+    """
+
+    __slots__ = ("_base", "_changes")
+
+    def __init__(self, base, changes=None):
+        self._base = base
+        self._changes = changes or {}
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self)[index]
+        if index < 0:
+            index += len(self._base)
+        if index in self._changes:
+            return self._changes[index]
+        return self._base[index]
+
+    def __iter__(self):
+        changes = self._changes
+        if not changes:
+            yield from self._base
+            return
+        for index, item in enumerate(self._base):
+            yield changes.get(index, item)
+
+    def __len__(self):
+        return len(self._base)
+
+    def __eq__(self, other):
+        if isinstance(other, (tuple, PersistentSequence)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def replace(self, index, item):
+        """Copie de la séquence où l'élément à la position `index` est `item`."""
+        if len(self._changes) >= _compact_limit(len(self._base)):
+            items = list(self)
+            items[index] = item
+            return PersistentSequence(tuple(items))
+        return PersistentSequence(self._base, {**self._changes, index: item})
+
+
+class DataView:
+    """Version immuable des données: enregistrements, index et agrégats."""
+
+    __slots__ = (
+        "version",
+        "clubs",
+        "competitions",
+        "club_bookings",
+        "clubs_by_email",
+        "clubs_by_name",
+        "clubs_by_id",
+        "competitions_by_name",
+        "competitions_by_id",
+        "_club_positions",
+        "_competition_positions",
+    )
+
+    def __init__(self, version, clubs, competitions, club_bookings, email_keys=None):
+        """
+        `email_keys` contient les emails déjà normalisés des clubs (instantané
+        précompilé); ils sont sinon calculés ici. `club_bookings` est indexé
+        par identifiants: {id du club: {id de la compétition: places}}.
+        """
+        self.version = version
+        self.clubs = tuple(clubs)
+        self.competitions = tuple(competitions)
+        self.club_bookings = club_bookings
+        if email_keys is None:
+            email_keys = [normalize_email(club.get("email", "")) for club in self.clubs]
+        self.clubs_by_email = {}
+        self.clubs_by_name = {}
+        self.clubs_by_id = {}
+        for club, email_key in zip(self.clubs, email_keys):
+            # setdefault: en cas de doublon, le premier club du fichier est conservé
+            self.clubs_by_email.setdefault(email_key, club)
+            self.clubs_by_name.setdefault(club["name"], club)
+            self.clubs_by_id.setdefault(club["id"], club)
+        self.competitions_by_name = {}
+        self.competitions_by_id = {}
+        for comp in self.competitions:
+            self.competitions_by_name.setdefault(comp["name"], comp)
+            self.competitions_by_id.setdefault(comp["id"], comp)
+        # Positions des enregistrements, partagées par les vues suivantes
+        # (l'ordre ne change pas avec les réservations)
+        self._club_positions = {club["id"]: i for i, club in enumerate(self.clubs)}
+        self._competition_positions = {
+            comp["id"]: i for i, comp in enumerate(self.competitions)
+        }
+
+    def with_booking(self, club, competition, points, places, booked):
+        """
+        Renvoie la vue suivante après une réservation: le club et la
+        compétition sont remplacés par des copies portant leurs nouveaux
+        compteurs (`points`, `places`) et le total réservé par le club pour la
+        compétition devient `booked`. Les autres enregistrements, les listes
+        et les index sont partagés avec cette vue.
+        """
+        old_club = self.clubs_by_id[club["id"]]
+        old_comp = self.competitions_by_id[competition["id"]]
+        new_club = {**old_club, "points": points}
+        new_comp = {**old_comp, "numberOfPlaces": places}
+
+        view = object.__new__(DataView)
+        view.version = self.version + 1
+        view._club_positions = self._club_positions
+        view._competition_positions = self._competition_positions
+        view.clubs = _persistent_sequence(self.clubs).replace(
+            self._club_positions[old_club["id"]], new_club
+        )
+        view.competitions = _persistent_sequence(self.competitions).replace(
+            self._competition_positions[old_comp["id"]], new_comp
+        )
+        view.club_bookings = _persistent_map(self.club_bookings).set(
+            club["id"],
+            {**self.club_bookings.get(club["id"], {}), competition["id"]: booked},
+        )
+        view.clubs_by_email = self.clubs_by_email
+        email_key = normalize_email(old_club.get("email", ""))
+        if self.clubs_by_email.get(email_key) is old_club:
+            view.clubs_by_email = _persistent_map(self.clubs_by_email).set(
+                email_key, new_club
+            )
+        view.clubs_by_name = _persistent_map(self.clubs_by_name).set(
+            new_club["name"], new_club
+        )
+        view.clubs_by_id = _persistent_map(self.clubs_by_id).set(new_club["id"], new_club)
+        view.competitions_by_name = _persistent_map(self.competitions_by_name).set(
+            new_comp["name"], new_comp
+        )
+        view.competitions_by_id = _persistent_map(self.competitions_by_id).set(
+            new_comp["id"], new_comp
+        )
+        return view
+
+    def booked(self, club_id, competition_id):
+        """Places déjà réservées par un club pour une compétition."""
+        return self.club_bookings.get(club_id, {}).get(competition_id, 0)
+
+
+def _persistent_map(mapping):
+    return mapping if isinstance(mapping, PersistentMap) else PersistentMap(mapping)
+
+
+def _persistent_sequence(items):
+    return items if isinstance(items, PersistentSequence) else PersistentSequence(items)
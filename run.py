@@ -22,8 +22,16 @@ qui n'ont pas besoin de connaître les détails de configuration de Flask.
 --------------------------------------------------------------------------------
 """
 
+import os
+
+# AJOUT: Tâches de fond (archivage des compétitions passées), démarrées par
+# l'application uniquement dans le processus qui sert les requêtes: avec le
+# rechargement automatique, le processus parent ne fait que surveiller les fichiers
+if __name__ == "__main__" and os.environ.get("WERKZEUG_RUN_MAIN") != "true":
+    os.environ["GUDLFT_ARCHIVE_SCHEDULER"] = "0"
+
 # Import de l'application depuis le package gudlft
-from gudlft.server import app
+from gudlft.server import app  # noqa: E402
 
 # Exécution de l'application en mode débogage si ce script est lancé directement
 if __name__ == "__main__":
@@ -6,9 +6,24 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     install_requires=[
-        "flask",
+        "flask>=2.2",
         "flask-caching",
     ],
+    extras_require={
+        # Codecs JSON rapides et liste triée du classement, utilisés
+        # automatiquement lorsqu'ils sont installés
+        "fast": ["orjson", "msgspec", "sortedcontainers"],
+        # Compression brotli des réponses (gzip est toujours disponible)
+        "brotli": ["brotli"],
+        # Calculs vectorisés (rejeu du journal, matrice d'éligibilité)
+        "numpy": ["numpy"],
+        # Analyseur JSON incrémental de `gudlft import`
+        "stream": ["ijson"],
+    },
+    entry_points={
+        # Commandes d'administration des données (voir gudlft/cli.py)
+        "console_scripts": ["gudlft=gudlft.cli:main"],
+    },
     description="GUDLFT - Club Competition Booking System",
     author="OpenClassrooms Project",
     author_email="example@example.com",
@@ -2,11 +2,17 @@
 Fixtures communes pour les tests de l'application GUDLFT.
 """
 
+import os
 import pytest
 import json
-from gudlft.server import app
 from datetime import datetime, timedelta
 
+# Pas de tâche d'archivage en fond pendant les tests (voir test_archive.py)
+os.environ.setdefault("GUDLFT_ARCHIVE_SCHEDULER", "0")
+
+from gudlft import server  # noqa: E402
+from gudlft.server import app  # noqa: E402
+
 
 @pytest.fixture
 def client():
@@ -23,6 +29,25 @@ def client():
         yield client
 
 
+@pytest.fixture(autouse=True, scope="session")
+def audit_log_path(tmp_path_factory):
+    """Journal d'audit des tests écrit dans un répertoire temporaire."""
+    app.config["AUDIT_PATH"] = str(tmp_path_factory.mktemp("audit") / "audit.jsonl")
+    yield app.config["AUDIT_PATH"]
+
+
+@pytest.fixture(autouse=True)
+def disable_rate_limits():
+    """
+    Désactive la limitation de débit: les tests enchaînent de nombreuses
+    requêtes depuis la même adresse (voir test_ratelimit.py).
+    """
+    previous = app.config["RATELIMIT_ENABLED"]
+    app.config["RATELIMIT_ENABLED"] = False
+    yield
+    app.config["RATELIMIT_ENABLED"] = previous
+
+
 @pytest.fixture
 def clubs():
     """
@@ -91,6 +116,10 @@ def setup_test_data(clubs, competitions):
     with open("bookings.json", "w") as f:
         json.dump({}, f)
 
+    # Recharger les données en mémoire de l'application: la détection des
+    # modifications par date de fichier ne suffit pas entre deux tests très rapides
+    server.refresh_data(force=True)
+
     yield
 
     # Nettoyage après chaque test
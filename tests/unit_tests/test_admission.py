@@ -0,0 +1,123 @@
+"""
+Tests unitaires du contrôle d'admission des réservations (admission.py).
+Vérifie l'ordre FIFO, le refus lorsque la file est pleine, la réponse 429
+et le court-circuit des compétitions complètes.
+"""
+
+import json
+import threading
+import time
+import pytest
+from unittest.mock import patch
+from gudlft import server
+from gudlft.admission import AdmissionController, AdmissionRejected
+from gudlft.server import app
+
+
+@pytest.fixture
+def client():
+    """Fixture pour le client de test Flask."""
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+def test_fifo_order():
+    """
+    AJOUT: Test de l'équité.
+    Les requêtes en attente sont admises dans leur ordre d'arrivée.
+    """
+    controller = AdmissionController()
+    order = []
+
+    def worker(number):
+        with controller.admit("comp", max_waiting=10, timeout=5):
+            order.append(number)
+
+    with controller.admit("comp", max_waiting=10, timeout=5):
+        threads = []
+        for number in range(5):
+            thread = threading.Thread(target=worker, args=(number,))
+            thread.start()
+            threads.append(thread)
+            # Attendre que le thread soit dans la file avant d'en lancer un autre
+            while controller.waiting("comp") < number + 1:
+                time.sleep(0.001)
+    for thread in threads:
+        thread.join()
+    assert order == [0, 1, 2, 3, 4]
+
+
+def test_rejected_when_queue_full():
+    """AJOUT: Une requête est refusée immédiatement si la file est pleine."""
+    controller = AdmissionController()
+    with controller.admit("comp", max_waiting=0, timeout=5):
+        with pytest.raises(AdmissionRejected) as excinfo:
+            with controller.admit("comp", max_waiting=0, timeout=5, retry_after=3):
+                pass
+    assert excinfo.value.retry_after == 3
+    # Une autre compétition n'est pas concernée
+    with controller.admit("other", max_waiting=0, timeout=5):
+        pass
+
+
+def test_rejected_after_timeout():
+    """
+    AJOUT: Une requête qui attend plus longtemps que le délai est refusée et
+    quitte la file.
+    """
+    controller = AdmissionController()
+    with controller.admit("comp", max_waiting=1, timeout=5):
+        with pytest.raises(AdmissionRejected):
+            with controller.admit("comp", max_waiting=1, timeout=0.01):
+                pass
+        assert controller.waiting("comp") == 0
+    with controller.admit("comp", max_waiting=0, timeout=0):
+        pass
+
+
+def test_purchase_returns_429_when_queue_full(client):
+    """
+    AJOUT: Test de la réponse 429.
+    Une réservation sur une compétition saturée reçoit 429 avec Retry-After.
+    """
+    app.config["ADMISSION_MAX_WAITING"] = 0
+    try:
+        with server.admission_controller.admit("Spring Festival", 0, 5):
+            response = client.post(
+                "/purchasePlaces",
+                data={
+                    "club": "Simply Lift",
+                    "competition": "Spring Festival",
+                    "places": "1",
+                },
+            )
+    finally:
+        app.config["ADMISSION_MAX_WAITING"] = 32
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_sold_out_short_circuit(client):
+    """
+    AJOUT: Test du court-circuit "complet".
+    Une compétition sans places est refusée sans recharger les données.
+    """
+    with open("competitions.json", "w") as f:
+        json.dump(
+            {
+                "competitions": [
+                    {**comp, "numberOfPlaces": "0"}
+                    for comp in server.current_view().competitions
+                ]
+            },
+            f,
+        )
+    server.refresh_data(force=True)
+    with patch("gudlft.server.refresh_data") as mock_refresh:
+        response = client.post(
+            "/purchasePlaces",
+            data={"club": "Simply Lift", "competition": "Fall Classic", "places": "1"},
+        )
+    mock_refresh.assert_not_called()
+    assert b"Error: Competition is full" in response.data
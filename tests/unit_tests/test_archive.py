@@ -0,0 +1,144 @@
+"""
+Tests unitaires de l'archivage des compétitions passées (archive.py).
+Vérifie le déplacement des compétitions et de leurs réservations vers
+l'archive, la vue publiée ensuite et la tâche de fond périodique.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import pytest
+from gudlft import server
+from gudlft.archive import Archive, PeriodicTask
+from gudlft.server import app
+from gudlft.store import COMPETITION_LAYOUT, RecordStore, StoreError
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    """Fichier d'archive temporaire utilisé par l'application pendant le test."""
+    path = str(tmp_path / "archive.json")
+    previous = app.config["ARCHIVE_PATH"]
+    app.config["ARCHIVE_PATH"] = path
+    yield path
+    app.config["ARCHIVE_PATH"] = previous
+
+
+def test_archive_past_competitions(archive_path):
+    """
+    AJOUT: Test de l'archivage.
+    La compétition passée et ses réservations quittent les fichiers de travail.
+    """
+    with open("bookings.json", "w") as f:
+        json.dump(
+            {"Simply Lift_Past Competition": 2, "Simply Lift_Fall Classic": 1}, f
+        )
+    server.refresh_data(force=True)
+
+    assert server.archive_past_competitions() == ["Past Competition"]
+
+    view = server.current_view()
+    assert "Past Competition" not in view.competitions_by_name
+    # Agrégats par identifiants: Simply Lift (1) et Fall Classic (2)
+    assert view.club_bookings[1] == {2: 1}
+    with open("competitions.json") as f:
+        names = [comp["name"] for comp in json.load(f)["competitions"]]
+    assert names == ["Spring Festival", "Fall Classic"]
+    with open("bookings.json") as f:
+        assert json.load(f) == {"Simply Lift_Fall Classic": 1}
+
+    archive = Archive(archive_path).load()
+    assert [comp["name"] for comp in archive["competitions"]] == ["Past Competition"]
+    assert archive["bookings"] == {"Simply Lift_Past Competition": 2}
+
+
+def test_archived_ids_are_not_reassigned(archive_path):
+    """
+    AJOUT: Une nouvelle compétition ne reprend pas l'identifiant de la
+    compétition archivée, même s'il était le plus grand.
+    """
+    server.archive_past_competitions()
+    with open("competitions.json") as f:
+        data = json.load(f)
+    assert max(comp["id"] for comp in data["competitions"]) == 2
+    data["competitions"].append(
+        {"name": "New Competition", "date": "2030-01-01 10:00:00", "numberOfPlaces": "5"}
+    )
+    with open("competitions.json", "w") as f:
+        json.dump(data, f)
+    server.refresh_data(force=True)
+
+    assert server.current_view().competitions_by_name["New Competition"]["id"] == 4
+    assert Archive(archive_path).load()["lastId"] == 3
+
+
+def test_nothing_to_archive(archive_path):
+    """AJOUT: Sans compétition passée, aucun fichier n'est modifié."""
+    version = server.current_view().version
+    server.archive_past_competitions()
+    assert server.archive_past_competitions() == []
+    assert server.current_view().version == version + 1
+    archived = Archive(archive_path).load()["competitions"]
+    assert [comp["name"] for comp in archived] == ["Past Competition"]
+
+
+def test_periodic_task_runs_until_stopped():
+    """AJOUT: La tâche périodique s'exécute en fond et survit aux erreurs."""
+    calls = []
+    ran_twice = threading.Event()
+
+    def task():
+        calls.append(1)
+        if len(calls) == 2:
+            ran_twice.set()
+        raise RuntimeError("boom")
+
+    periodic = PeriodicTask(0.01, task)
+    periodic.start()
+    assert ran_twice.wait(2)
+    periodic.stop(timeout=2)
+    count = len(calls)
+    assert threading.Event().wait(0.05) is False
+    assert len(calls) == count
+
+
+def test_replaced_store_is_reopened(tmp_path, monkeypatch):
+    """
+    AJOUT: Test du remplacement d'un fichier d'enregistrements par un autre
+    processus (archivage). Les lectures rouvrent le nouveau fichier et un
+    verrou obtenu sur l'ancien est refusé.
+    """
+    path = str(tmp_path / "competitions.dat")
+    monkeypatch.setitem(
+        server.STORES, "competitions", (path, "competitions.json", COMPETITION_LAYOUT)
+    )
+    monkeypatch.setattr(server, "_open_stores", {})
+    monkeypatch.setitem(app.config, "DATA_BACKEND", "mmap")
+    old = server.get_store("competitions")
+    assert len(old) == 3
+
+    # Réécriture par "un autre processus"
+    RecordStore.create(path, COMPETITION_LAYOUT, old.records()[:1]).close()
+    assert not old.is_current()
+    assert len(server.get_store("competitions")) == 1
+    with pytest.raises(StoreError):
+        with old.lock_record("Fall Classic"):
+            pass
+    old.close()
+    server.close_stores()
+
+
+def test_scheduler_started_with_the_app():
+    """AJOUT: La tâche d'archivage démarre avec l'application, sauf si désactivée."""
+    code = (
+        "from gudlft import server; "
+        "print(server.archive_task is not None and server.archive_task._thread.is_alive())"
+    )
+    for flag, expected in (("1", "True"), ("0", "False")):
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True,
+            env={**os.environ, "GUDLFT_ARCHIVE_SCHEDULER": flag},
+        )
+        assert result.stdout.strip() == expected
@@ -0,0 +1,140 @@
+"""
+Tests unitaires du journal d'audit des réservations (audit.py).
+Vérifie le tampon circulaire, la rotation des fichiers, le thread de fond et
+les événements enregistrés par /purchasePlaces.
+"""
+
+import json
+import os
+import threading
+import time
+import pytest
+from gudlft import server
+from gudlft.audit import AuditLog
+from gudlft.server import app
+
+
+@pytest.fixture
+def client():
+    """Fixture pour le client de test Flask."""
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+def read_events(log):
+    events = []
+    for path in log.files():
+        with open(path) as f:
+            events.extend(json.loads(line) for line in f)
+    return events
+
+
+def test_overflow_drops_oldest_events(tmp_path):
+    """
+    AJOUT: Test du débordement du tampon.
+    Les événements les plus anciens sont abandonnés et comptés.
+    """
+    log = AuditLog(str(tmp_path / "audit.jsonl"), capacity=3)
+    for number in range(5):
+        log.record({"n": number})
+    log.flush()
+    events = read_events(log)
+    assert [(event["n"], event["seq"]) for event in events] == [(2, 3), (3, 4), (4, 5)]
+    assert {event["log"] for event in events} == {log.instance}
+    assert log.stats() == {
+        "recorded": 5, "written": 3, "dropped": 2, "pending": 0, "writeErrors": 0,
+    }
+
+
+def test_rotation_keeps_backup_count(tmp_path):
+    """AJOUT: Au-delà de max_bytes, le fichier tourne en gardant backup_count copies."""
+    log = AuditLog(str(tmp_path / "audit.jsonl"), max_bytes=40, backup_count=2)
+    for number in range(6):
+        log.record({"n": number, "pad": "x" * 10})
+        log.flush()
+    assert [path.rsplit("/", 1)[1] for path in log.files()] == [
+        "audit.jsonl.2", "audit.jsonl.1", "audit.jsonl",
+    ]
+    assert [event["n"] for event in read_events(log)] == [3, 4, 5]
+
+
+def test_rotation_waits_for_file_lock(tmp_path):
+    """
+    AJOUT: Un autre processus tenant le verrou du journal (simulé par un
+    second descripteur), l'écriture et la rotation attendent sa libération.
+    """
+    fcntl = pytest.importorskip("fcntl")
+    log = AuditLog(str(tmp_path / "audit.jsonl"), max_bytes=1)
+    log.record({"n": 0})
+    log.flush()
+    log.record({"n": 1})
+    fd = os.open(str(tmp_path / "audit.jsonl.lock"), os.O_RDWR | os.O_CREAT)
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    writer = threading.Thread(target=log.flush)
+    writer.start()
+    writer.join(0.2)
+    assert writer.is_alive()
+    assert log.files() == [str(tmp_path / "audit.jsonl")]
+    os.close(fd)
+    writer.join(5)
+    assert [event["n"] for event in read_events(log)] == [0, 1]
+    assert len(log.files()) == 2
+
+
+def test_background_thread_writes_and_stop_flushes(tmp_path):
+    """AJOUT: Le thread de fond écrit le tampon; l'arrêt écrit les derniers événements."""
+    log = AuditLog(str(tmp_path / "audit.jsonl"), capacity=2, flush_interval=60)
+    log.start()
+    log.record({"n": 1})
+    log.stop(timeout=2)
+    assert read_events(log) == [{"log": log.instance, "seq": 1, "n": 1}]
+
+
+def test_purchase_events_recorded_off_request_path(client, tmp_path, monkeypatch):
+    """
+    AJOUT: Test des événements de /purchasePlaces.
+    La requête n'écrit rien; le journal contient ensuite chaque issue.
+    """
+    log = AuditLog(str(tmp_path / "audit.jsonl"))
+    monkeypatch.setattr(server, "_audit_log", log)
+    data = {"club": "Simply Lift", "competition": "Spring Festival", "places": "2"}
+    client.post("/purchasePlaces", data=data)
+    client.post("/purchasePlaces", data={**data, "places": "20"})
+    client.post("/purchasePlaces", data={**data, "places": "x"})
+    assert log.files() == []
+
+    log.flush()
+    booked, refused, invalid = read_events(log)
+    assert booked["outcome"] == "booked" and booked["places"] == 2
+    assert (booked["clubId"], booked["competitionId"]) == (1, 1)
+    assert (booked["pointsAfter"], booked["placesAfter"]) == (11, 23)
+    assert refused["outcome"] == "refused" and refused["latencyMs"] >= 0
+    assert invalid == {**invalid, "outcome": "invalid", "places": "x"}
+
+
+def test_latency_and_admission_rejection_recorded(client, tmp_path, monkeypatch):
+    """
+    AJOUT: La durée enregistrée couvre toute la requête (pas seulement
+    l'écriture) et les refus du contrôle d'admission sont journalisés.
+    """
+    log = AuditLog(str(tmp_path / "audit.jsonl"))
+    monkeypatch.setattr(server, "_audit_log", log)
+    refresh_data = server.refresh_data
+
+    def slow_refresh(*args, **kwargs):
+        time.sleep(0.05)
+        return refresh_data(*args, **kwargs)
+
+    monkeypatch.setattr(server, "refresh_data", slow_refresh)
+    data = {"club": "Simply Lift", "competition": "Spring Festival", "places": "1"}
+    client.post("/purchasePlaces", data=data)
+    monkeypatch.setitem(app.config, "ADMISSION_MAX_WAITING", 0)
+    with server.admission_controller.admit("Spring Festival", 0, 5):
+        assert client.post("/purchasePlaces", data=data).status_code == 429
+
+    log.flush()
+    booked, rejected = read_events(log)
+    assert booked["outcome"] == "booked" and booked["latencyMs"] >= 50
+    assert rejected["outcome"] == "rejected" and rejected["places"] == "1"
+    assert (rejected["clubId"], rejected["competitionId"]) == (1, 1)
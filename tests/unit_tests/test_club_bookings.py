@@ -0,0 +1,74 @@
+"""
+Tests unitaires du résumé des réservations par club (/api/clubs/<club>/bookings).
+"""
+
+import json
+import pytest
+from unittest.mock import patch
+from gudlft import server
+from gudlft.server import app, aggregate_bookings
+
+
+@pytest.fixture
+def client():
+    """Fixture pour le client de test Flask."""
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+def test_summary_after_booking(client):
+    """
+    AJOUT: Test du résumé après réservation.
+    Les places réservées, la marge sous la limite de 12 et les points sont à jour.
+    """
+    client.post(
+        "/purchasePlaces",
+        data={"club": "Simply Lift", "competition": "Spring Festival", "places": "5"},
+    )
+    response = client.get("/api/clubs/Simply Lift/bookings")
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data["points"] == 8
+    assert data["totalBooked"] == 5
+    spring = next(c for c in data["competitions"] if c["name"] == "Spring Festival")
+    assert spring == {
+        "id": 1,
+        "name": "Spring Festival",
+        "booked": 5,
+        "remainingAllowance": 7,
+        "open": True,
+    }
+    past = next(c for c in data["competitions"] if c["name"] == "Past Competition")
+    assert past["booked"] == 0 and past["open"] is False
+
+
+def test_summary_unknown_club(client):
+    """AJOUT: Un club inconnu renvoie une erreur 404 au format JSON."""
+    response = client.get("/api/clubs/Unknown/bookings")
+    assert response.status_code == 404
+    assert json.loads(response.data) == {"error": "Club not found"}
+
+
+def test_aggregates_updated_without_reading_file(client):
+    """
+    AJOUT: Test de la mise à jour incrémentale.
+    La limite de 12 places est vérifiée à partir de l'agrégat de la vue
+    publiée par la réservation, sans relire bookings.json.
+    """
+    client.post(
+        "/purchasePlaces",
+        data={"club": "She Lifts", "competition": "Fall Classic", "places": "4"},
+    )
+    with patch("gudlft.server.load_bookings", side_effect=AssertionError):
+        assert server.get_club_competition_bookings("She Lifts", "Fall Classic") == 4
+
+
+def test_aggregate_keys_with_underscores():
+    """AJOUT: Les clés "club_compétition" sont séparées même si les noms contiennent "_"."""
+    clubs = [{"name": "Club_A", "id": 1}, {"name": "Club", "id": 2}]
+    competitions = [{"name": "A_Cup", "id": 1}, {"name": "Cup", "id": 2}]
+    aggregates = aggregate_bookings(
+        {"Club_A_Cup": 3, "Club_A_A_Cup": 2, "Other_Cup": 1}, clubs, competitions
+    )
+    assert aggregates == {2: {1: 3}, 1: {1: 2}}
@@ -0,0 +1,68 @@
+"""
+Tests unitaires de la disponibilité des compétitions (/api/competitions)
+et du flux Server-Sent Events associé.
+"""
+
+import json
+import pytest
+from gudlft import server
+from gudlft.events import Publisher
+from gudlft.server import app
+
+
+@pytest.fixture
+def client():
+    """Fixture pour le client de test Flask."""
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+def _sse_data(chunk):
+    """Extrait les données JSON d'un message SSE."""
+    if isinstance(chunk, bytes):
+        chunk = chunk.decode("utf-8")
+    line = next(line for line in chunk.splitlines() if line.startswith("data: "))
+    return json.loads(line[len("data: "):])
+
+
+def test_api_competitions(client):
+    """AJOUT: L'API renvoie les places et l'état ouvert/fermé de chaque compétition."""
+    data = json.loads(client.get("/api/competitions").data)
+    states = {comp["name"]: comp for comp in data["competitions"]}
+    assert states["Spring Festival"]["numberOfPlaces"] == 25
+    assert states["Spring Festival"]["open"] is True
+    assert states["Past Competition"]["open"] is False
+
+
+def test_stream_pushes_booking_updates(client):
+    """
+    AJOUT: Test du flux SSE.
+    Le flux envoie d'abord l'état complet puis la compétition modifiée par une réservation.
+    """
+    response = client.get("/api/competitions/stream")
+    assert response.mimetype == "text/event-stream"
+    chunks = iter(response.response)
+    snapshot = _sse_data(next(chunks))
+    assert len(snapshot["competitions"]) == 3
+    assert len(server.competition_publisher) == 1
+
+    client.post(
+        "/purchasePlaces",
+        data={"club": "Simply Lift", "competition": "Fall Classic", "places": "2"},
+    )
+    update = _sse_data(next(chunks))
+    assert update["name"] == "Fall Classic"
+    assert update["numberOfPlaces"] == 11
+
+    response.close()
+    assert len(server.competition_publisher) == 0
+
+
+def test_publisher_drops_oldest_when_full():
+    """AJOUT: Un abonné lent perd les événements les plus anciens sans bloquer le diffuseur."""
+    publisher = Publisher(max_queue_size=2)
+    subscriber = publisher.subscribe()
+    for number in range(3):
+        publisher.publish(number)
+    assert [subscriber.get_nowait(), subscriber.get_nowait()] == [1, 2]
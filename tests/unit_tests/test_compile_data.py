@@ -0,0 +1,154 @@
+"""
+Tests unitaires de la commande compile-data (cli.py, compiled.py, validation.py).
+Vérifie la validation des sources, l'écriture de l'instantané binaire et son
+utilisation par l'application tant que les fichiers JSON n'ont pas changé.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from gudlft import cli, compiled, server
+from gudlft.server import app
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    """Chemin d'instantané temporaire, utilisé par l'application pendant le test."""
+    path = str(tmp_path / "data.snapshot")
+    previous = app.config["SNAPSHOT_PATH"]
+    app.config["SNAPSHOT_PATH"] = path
+    yield path
+    app.config["SNAPSHOT_PATH"] = previous
+    server.refresh_data(force=True)
+
+
+def test_compile_data_writes_snapshot(snapshot_path, capsys):
+    """
+    AJOUT: Test de la compilation de données valides.
+    Vérifie que l'instantané relu contient les clubs, les emails normalisés et les dates.
+    """
+    assert cli.main(["compile-data", "--output", snapshot_path]) == 0
+    snapshot = compiled.read_snapshot(snapshot_path)
+    assert [club["name"] for club in snapshot.clubs] == [
+        club["name"] for club in server.loadClubs()
+    ]
+    assert snapshot.clubs[0]["points"] == 13
+    assert snapshot.email_keys[0] == "john@simplylift.co"
+    assert snapshot.competitions[1]["numberOfPlaces"] == 13
+    date_text = snapshot.competitions[0]["date"]
+    assert snapshot.dates[date_text].strftime("%Y-%m-%d %H:%M:%S") == date_text
+    assert "Snapshot written" in capsys.readouterr().out
+
+
+def test_compile_data_reports_every_error(tmp_path, capsys):
+    """
+    AJOUT: Test de la compilation de données invalides.
+    Vérifie que toutes les erreurs sont listées et qu'aucun instantané n'est écrit.
+    """
+    clubs_path = tmp_path / "clubs.json"
+    clubs_path.write_text(
+        json.dumps(
+            {
+                "clubs": [
+                    {"name": "A", "email": "a@a.com", "points": "1"},
+                    {"name": "A", "email": "A@a.com", "points": "3"},
+                    {"name": "B", "email": "b.com", "points": "x"},
+                ]
+            }
+        )
+    )
+    competitions_path = tmp_path / "competitions.json"
+    competitions_path.write_text(
+        json.dumps(
+            {"competitions": [{"name": "C", "date": "soon", "numberOfPlaces": "-1"}]}
+        )
+    )
+    output = tmp_path / "data.snapshot"
+    status = cli.main(
+        [
+            "compile-data",
+            "--clubs",
+            str(clubs_path),
+            "--competitions",
+            str(competitions_path),
+            "--output",
+            str(output),
+        ]
+    )
+    assert status == 1
+    assert not output.exists()
+    err = capsys.readouterr().err
+    assert "clubs[2]: invalid email 'b.com'" in err
+    assert "clubs[2]: invalid points 'x'" in err
+    assert "clubs[1]: duplicate name 'A'" in err
+    assert "clubs[1]: duplicate email 'A@a.com'" in err
+    assert "competitions[0]: invalid date 'soon'" in err
+    assert "competitions[0]: invalid numberOfPlaces '-1'" in err
+
+
+def test_app_loads_fresh_snapshot(snapshot_path, monkeypatch):
+    """
+    AJOUT: Test du chargement de l'instantané par l'application.
+    Vérifie que les fichiers JSON ne sont pas analysés et que l'index des emails est construit.
+    """
+    assert compiled.compile_data("clubs.json", "competitions.json", snapshot_path) == []
+
+    def fail():
+        raise AssertionError("JSON should not be parsed")
+
+    monkeypatch.setattr(server, "loadClubs", fail)
+    monkeypatch.setattr(server, "loadCompetitions", fail)
+    server.refresh_data(force=True)
+    view = server.current_view()
+    assert view.clubs_by_email["john@simplylift.co"]["points"] == 13
+    assert len(view.competitions) == 3
+
+
+def test_stale_snapshot_is_ignored(snapshot_path):
+    """
+    AJOUT: Test d'un instantané périmé.
+    Vérifie que l'application relit les fichiers JSON modifiés après la compilation.
+    """
+    assert compiled.compile_data("clubs.json", "competitions.json", snapshot_path) == []
+    with open("clubs.json", "w") as f:
+        json.dump(
+            {"clubs": [{"name": "Solo", "email": "solo@club.com", "points": "5"}]}, f
+        )
+    assert server.load_snapshot() is None
+    server.refresh_data(force=True)
+    assert [club["name"] for club in server.current_view().clubs] == ["Solo"]
+
+
+def test_snapshot_rewritten_after_booking(snapshot_path):
+    """
+    AJOUT: Une réservation réécrit l'instantané: il reste valide pour le
+    démarrage suivant et contient les nouveaux compteurs.
+    """
+    assert compiled.compile_data("clubs.json", "competitions.json", snapshot_path) == []
+    server.refresh_data(force=True)
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        client.post(
+            "/purchasePlaces",
+            data={"club": "Simply Lift", "competition": "Spring Festival", "places": "2"},
+        )
+    snapshot = server.load_snapshot()
+    assert snapshot is not None
+    assert snapshot.clubs[0]["points"] == 11
+    assert snapshot.competitions[0]["numberOfPlaces"] == 23
+
+
+def test_cli_does_not_load_the_app(tmp_path):
+    """
+    AJOUT: Les commandes n'importent pas le serveur: aucun fichier de données
+    du répertoire courant n'est lu ni créé au chargement de cli.py.
+    """
+    code = "import sys, gudlft.cli; print('gudlft.server' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=tmp_path, capture_output=True, text=True,
+        env={"GUDLFT_DATA_BACKEND": "mmap", "PYTHONPATH": str(Path(__file__).parents[2])},
+    )
+    assert result.stdout.strip() == "False"
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,59 @@
+"""
+Tests unitaires de la compression des réponses (compression.py).
+Vérifie la négociation gzip, la compression à la volée des pages dynamiques
+et le service des variantes précalculées.
+"""
+
+import gzip
+import pytest
+from gudlft import compression
+from gudlft.server import app
+
+
+@pytest.fixture
+def client():
+    """Fixture pour le client de test Flask."""
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+def test_dynamic_page_compressed(client):
+    """
+    AJOUT: Test de la compression à la volée.
+    La page de résumé d'un club est compressée si le client accepte gzip.
+    """
+    response = client.post(
+        "/showSummary",
+        data={"email": "john@simplylift.co"},
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert b"Welcome, john@simplylift.co" in gzip.decompress(response.data)
+
+
+def test_dynamic_page_not_compressed_without_accept_encoding(client):
+    """AJOUT: Sans Accept-Encoding, la réponse reste en clair."""
+    response = client.post("/showSummary", data={"email": "john@simplylift.co"})
+    assert "Content-Encoding" not in response.headers
+    assert "Accept-Encoding" in response.headers["Vary"]
+
+
+def test_small_response_not_compressed(client):
+    """AJOUT: Les réponses plus petites que COMPRESS_MIN_SIZE ne sont pas compressées."""
+    response = client.get("/logout", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers
+
+
+def test_index_served_from_precomputed_variants(client):
+    """AJOUT: La page d'accueil statique est servie depuis sa variante gzip précalculée."""
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert b"GUDLFT Registration Portal" in gzip.decompress(response.data)
+
+
+def test_compressed_variants():
+    """AJOUT: Les variantes précalculées se décompressent vers le contenu original."""
+    variants = compression.compressed_variants(b"hello" * 100)
+    assert gzip.decompress(variants["gzip"]) == variants["identity"]
+    assert variants["etag"]
@@ -0,0 +1,126 @@
+"""
+Tests unitaires du calcul groupé de l'éligibilité (eligibility.py), de
+l'API /api/eligibility et de la commande `gudlft eligibility`.
+"""
+
+import json
+import pytest
+from gudlft import cli, eligibility
+from gudlft.server import app
+
+CLUBS = [{"id": 1, "points": 13}, {"id": 2, "points": 4}, {"id": 3, "points": 0}]
+COMPETITIONS = [
+    {"id": 1, "numberOfPlaces": 25},
+    {"id": 2, "numberOfPlaces": 3},
+    {"id": 3, "numberOfPlaces": 13},
+]
+BOOKINGS = {1: {1: 10, 2: 1}, 2: {9: 5}}
+
+
+ADMIN = {"Authorization": "Bearer test-admin-token"}
+
+
+@pytest.fixture
+def client():
+    """Fixture pour le client de test Flask, avec un jeton d'administration."""
+    app.config["TESTING"] = True
+    previous = app.config["ADMIN_TOKEN"]
+    app.config["ADMIN_TOKEN"] = "test-admin-token"
+    with app.test_client() as client:
+        yield client
+    app.config["ADMIN_TOKEN"] = previous
+
+
+def test_compute_applies_booking_rules():
+    """
+    AJOUT: Test de la matrice en Python pur.
+    Chaque case est le minimum des points, des places restantes et de la
+    limite moins les places déjà réservées; 0 si la compétition est fermée.
+    """
+    result = eligibility.compute(
+        CLUBS, COMPETITIONS, BOOKINGS, [True, True, False], 12, use_numpy=False
+    )
+    assert result.max_bookable == [[2, 3, 0], [4, 3, 0], [0, 0, 0]]
+    assert result.eligible_clubs() == [2, 2, 0]
+    assert result.bookable_places() == [6, 6, 0]
+    assert result.row(2) == [4, 3, 0]
+
+
+def test_numpy_matches_pure_python():
+    """AJOUT: Le calcul numpy donne la même matrice que la version Python."""
+    pytest.importorskip("numpy")
+    results = [
+        eligibility.compute(
+            CLUBS, COMPETITIONS, BOOKINGS, [True, False, True], 12, use_numpy=use_numpy
+        )
+        for use_numpy in (False, True)
+    ]
+    assert results[0].report() == results[1].report()
+    assert results[0].row(2) == results[1].row(2)
+    report = json.loads(json.dumps(results[1].report()))
+    assert report["eligibleClubs"] == [2, 0, 2]
+
+
+def test_api_eligibility_follows_bookings(client):
+    """
+    AJOUT: Test de /api/eligibility.
+    Le rapport reflète une réservation dès la version suivante des données.
+    """
+    data = json.loads(client.get("/api/eligibility?offset=0", headers=ADMIN).data)
+    assert data["open"] == [True, True, False]
+    assert data["maxBookable"] == [[12, 12, 0], [4, 4, 0], [12, 12, 0]]
+    client.post(
+        "/purchasePlaces",
+        data={"club": "Simply Lift", "competition": "Spring Festival", "places": "2"},
+    )
+    data = json.loads(client.get("/api/eligibility?club=1", headers=ADMIN).data)
+    assert (data["club"], data["maxBookable"]) == ("Simply Lift", [10, 11, 0])
+    response = client.get("/api/eligibility?club=unknown", headers=ADMIN)
+    assert response.status_code == 404
+
+
+def test_api_eligibility_requires_admin_token(client):
+    """
+    AJOUT: Sans le jeton d'administration, le rapport est refusé; sans jeton
+    configuré, il l'est toujours.
+    """
+    assert client.get("/api/eligibility").status_code == 401
+    response = client.get(
+        "/api/eligibility", headers={"Authorization": "Bearer wrong"}
+    )
+    assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"] == "Bearer"
+    app.config["ADMIN_TOKEN"] = None
+    assert client.get("/api/eligibility", headers=ADMIN).status_code == 403
+
+
+def test_api_eligibility_summary_and_pages(client):
+    """
+    AJOUT: Par défaut, seuls les totaux par compétition sont renvoyés; la
+    matrice est paginée par clubs.
+    """
+    data = json.loads(client.get("/api/eligibility", headers=ADMIN).data)
+    assert "maxBookable" not in data
+    assert (data["eligibleClubs"], data["bookablePlaces"]) == ([3, 3, 0], [28, 28, 0])
+    data = json.loads(
+        client.get("/api/eligibility?offset=1&limit=1", headers=ADMIN).data
+    )
+    assert (data["clubs"], data["maxBookable"], data["totalClubs"]) == (
+        [2], [[4, 4, 0]], 3
+    )
+    app.config["ELIGIBILITY_PAGE_SIZE"], previous = 2, app.config["ELIGIBILITY_PAGE_SIZE"]
+    try:
+        response = client.get("/api/eligibility?limit=3", headers=ADMIN)
+        assert response.status_code == 400
+    finally:
+        app.config["ELIGIBILITY_PAGE_SIZE"] = previous
+
+
+def test_cli_report(capsys):
+    """AJOUT: `gudlft eligibility` affiche les clubs éligibles par compétition."""
+    assert cli.main(["eligibility"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == (
+        "Spring Festival (open, 25 places): 3 eligible club(s), 28 place(s) bookable"
+    )
+    assert lines[2].startswith("Past Competition (closed")
@@ -0,0 +1,51 @@
+"""
+Tests unitaires de l'index des emails utilisé par showSummary.
+"""
+
+import pytest
+from gudlft import server
+from gudlft.server import app, normalize_email
+
+
+@pytest.fixture
+def client():
+    """Fixture pour le client de test Flask."""
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+def test_normalize_email():
+    """
+    AJOUT: Test de la normalisation des emails.
+    Casse, espaces et domaines internationalisés sont normalisés.
+    """
+    assert normalize_email("  John@SimplyLift.CO ") == "john@simplylift.co"
+    assert normalize_email("admin@bücher.de") == "admin@xn--bcher-kva.de"
+    assert normalize_email("not-an-email") == "not-an-email"
+
+
+def test_login_is_case_insensitive(client):
+    """AJOUT: La connexion fonctionne quelle que soit la casse de l'email."""
+    response = client.post("/showSummary", data={"email": " JOHN@SimplyLift.co "})
+    assert response.status_code == 200
+    assert b"Welcome, john@simplylift.co" in response.data
+
+
+def test_index_rebuilt_on_reload(client):
+    """
+    AJOUT: Test de la reconstruction de l'index.
+    L'index contient tous les clubs chargés et suit le rechargement des données.
+    """
+    server.refresh_data()
+    view = server.current_view()
+    assert set(view.clubs_by_email) == {
+        normalize_email(club["email"]) for club in view.clubs
+    }
+    assert view.clubs_by_email["kate@shelifts.co.uk"]["name"] == "She Lifts"
+
+
+def test_unknown_email(client):
+    """AJOUT: Un email inconnu renvoie vers la page d'accueil."""
+    response = client.post("/showSummary", data={"email": "nobody@nowhere.com"})
+    assert response.status_code == 302
@@ -0,0 +1,65 @@
+"""
+Tests unitaires des erreurs métier (errors.py) et des réponses d'erreur
+précalculées: refus de réservation, erreurs inattendues et page 404.
+"""
+
+import pytest
+from unittest.mock import patch
+from gudlft import server
+from gudlft.errors import InvalidRequest
+from gudlft.server import app, cache
+
+
+@pytest.fixture
+def client():
+    """Fixture pour le client de test Flask."""
+    app.config["TESTING"] = True
+    cache.clear()
+    with app.test_client() as client:
+        yield client
+
+
+def test_refused_booking_page_rendered_once(client):
+    """
+    AJOUT: Test de la page de refus précalculée.
+    Une même réservation refusée n'est rendue qu'une fois.
+    """
+    data = {"club": "Iron Temple", "competition": "Spring Festival", "places": "5"}
+    first = client.post("/purchasePlaces", data=data)
+    assert b"Error: Not enough points" in first.data
+    with patch(
+        "gudlft.server.render_template", wraps=server.render_template
+    ) as mock_render:
+        second = client.post("/purchasePlaces", data=data)
+    assert mock_render.call_count == 0
+    assert second.data == first.data
+    assert server.current_view().clubs_by_name["Iron Temple"]["points"] == 4
+
+
+def test_unexpected_error_is_logged_not_shown(client):
+    """AJOUT: Une exception inattendue affiche un message générique, sans détail interne."""
+    with patch("gudlft.server.save_booking", side_effect=RuntimeError("disk secret")):
+        response = client.post(
+            "/purchasePlaces",
+            data={"club": "Simply Lift", "competition": "Fall Classic", "places": "1"},
+            follow_redirects=True,
+        )
+    assert b"An error occurred, please try again" in response.data
+    assert b"disk secret" not in response.data
+
+
+def test_404_served_from_static_bytes(client):
+    """AJOUT: La page 404 est servie précompressée, sans nouveau rendu."""
+    client.get("/missing")
+    with patch("gudlft.server.render_template") as mock_render:
+        response = client.get("/missing-too", headers={"Accept-Encoding": "gzip"})
+    mock_render.assert_not_called()
+    assert response.status_code == 404
+    assert response.headers["Content-Encoding"] == "gzip"
+
+
+def test_validate_booking_request_raises():
+    """AJOUT: Les données invalides lèvent InvalidRequest avec le message affiché."""
+    assert server.validate_booking_request("Cup", "Club", "3") == 3
+    with pytest.raises(InvalidRequest, match="Invalid number of places"):
+        server.validate_booking_request("Cup", "Club", "-1")
@@ -0,0 +1,75 @@
+"""
+Tests unitaires des fragments de templates mis en cache.
+Vérifie que la liste des compétitions et le tableau des points sont rendus une
+fois par version des données et que seules les parties propres au club varient.
+"""
+
+import pytest
+from unittest.mock import patch
+from gudlft import server
+from gudlft.server import app, cache
+
+
+@pytest.fixture
+def client():
+    """Fixture pour le client de test Flask."""
+    app.config["TESTING"] = True
+    cache.clear()
+    with app.test_client() as client:
+        yield client
+
+
+def test_welcome_contains_club_links(client):
+    """
+    AJOUT: Test du remplacement du club dans le fragment partagé.
+    Les liens de réservation pointent vers le club connecté, par identifiants
+    (Spring Festival: 1, She Lifts: 3).
+    """
+    response = client.post("/showSummary", data={"email": "kate@shelifts.co.uk"})
+    assert b"/book/1/3" in response.data
+    assert server.CLUB_PLACEHOLDER.encode() not in response.data
+    assert b"Past Competition" not in response.data
+
+
+def test_competitions_fragment_rendered_once_per_version(client):
+    """
+    AJOUT: Test du rendu unique du fragment.
+    Deux connexions de clubs différents réutilisent le même fragment.
+    """
+    client.post("/showSummary", data={"email": "john@simplylift.co"})
+    with patch(
+        "gudlft.server.render_template", wraps=server.render_template
+    ) as mock_render:
+        response = client.post("/showSummary", data={"email": "kate@shelifts.co.uk"})
+    rendered = [call.args[0] for call in mock_render.call_args_list]
+    assert rendered == ["welcome.html"]
+    assert b"/book/2/3" in response.data
+
+
+def test_booking_invalidates_fragments(client):
+    """
+    AJOUT: Test de l'invalidation par version.
+    Après une réservation, la page des points et la liste des compétitions
+    affichent les nouvelles valeurs.
+    """
+    client.get("/points")
+    version = server.current_view().version
+    response = client.post(
+        "/purchasePlaces",
+        data={"club": "Simply Lift", "competition": "Fall Classic", "places": "3"},
+    )
+    assert server.current_view().version > version
+    assert b"Number of Places: 10" in response.data
+
+    response = client.get("/points")
+    assert b"<td>Simply Lift</td>" in response.data
+    assert b'<td class="points">10</td>' in response.data
+
+
+def test_special_characters_in_club_name():
+    """AJOUT: Les liens utilisent l'identifiant du club, quel que soit son nom."""
+    club = {"id": 7, "name": "A&B <C>", "email": "ab<c>@c.com", "points": 1}
+    with app.test_request_context():
+        html = server.render_welcome(club)
+    assert "/book/1/7" in html
+    assert "<C>" not in html and "<c>" not in html
@@ -9,9 +9,10 @@ import pytest
 import json
 import os
 from unittest.mock import patch, MagicMock, mock_open
+from gudlft import server
 from gudlft.server import (
     app,
-    get_club_competition_bookings,
+    load_bookings,
     save_booking,
     is_competition_open,
     not_found_error,
@@ -41,29 +42,26 @@ def test_invalid_competition_date():
     assert result is False
 
 
-def test_get_club_competition_bookings_new_file():
+def test_load_bookings_new_file():
     """
-    AJOUT: Test de get_club_competition_bookings avec un fichier inexistant.
+    AJOUT: Test de load_bookings avec un fichier inexistant.
     Utilise un mock pour simuler un fichier manquant (FileNotFoundError) et vérifie
-    que la fonction renvoie 0 comme valeur par défaut, ce qui permet à l'application
+    que la fonction renvoie un dictionnaire vide, ce qui permet à l'application
     de continuer à fonctionner même si le fichier de réservations n'existe pas encore.
     """
     with patch("builtins.open", side_effect=FileNotFoundError):
-        result = get_club_competition_bookings("Test Club", "Test Competition")
-        assert result == 0
+        assert load_bookings() == {}
 
 
-def test_get_club_competition_bookings_invalid_json():
+def test_load_bookings_invalid_json():
     """
-    AJOUT: Test de get_club_competition_bookings avec un JSON invalide.
+    AJOUT: Test de load_bookings avec un JSON invalide.
     Utilise un mock pour simuler un fichier JSON corrompu ou mal formaté et vérifie
-    que la fonction gère cette erreur et renvoie 0 comme valeur par défaut.
+    que la fonction gère cette erreur et renvoie un dictionnaire vide.
     Ce test couvre un cas d'erreur important pour la robustesse de l'application.
     """
     with patch("builtins.open", mock_open(read_data="invalid json")):
-        with patch("json.load", side_effect=json.JSONDecodeError("Test error", "", 0)):
-            result = get_club_competition_bookings("Test Club", "Test Competition")
-            assert result == 0
+        assert load_bookings() == {}
 
 
 def test_save_booking_new_file():
@@ -74,8 +72,10 @@ def test_save_booking_new_file():
     Ce test couvre le cas où l'application est utilisée pour la première fois.
     """
     m = mock_open()
-    with patch("builtins.open", side_effect=[FileNotFoundError, m()]):
-        with patch("json.dump") as mock_dump:
+    with patch("builtins.open", side_effect=[FileNotFoundError, m()]), patch(
+        "os.replace"
+    ):
+        with patch("gudlft.jsoncodec.dump") as mock_dump:
             save_booking("Test Club", "Test Competition", 5)
             mock_dump.assert_called_once()
 
@@ -90,9 +90,9 @@ def test_save_booking_invalid_json():
     m = mock_open()
     with patch(
         "builtins.open", side_effect=[mock_open()(read_data="invalid json"), m()]
-    ):
+    ), patch("os.replace"):
         with patch("json.load", side_effect=json.JSONDecodeError("Test error", "", 0)):
-            with patch("json.dump") as mock_dump:
+            with patch("gudlft.jsoncodec.dump") as mock_dump:
                 save_booking("Test Club", "Test Competition", 5)
                 mock_dump.assert_called_once()
 
@@ -102,12 +102,19 @@ def test_404_error_handler():
     AJOUT: Test du gestionnaire d'erreur 404.
     Vérifie que le gestionnaire d'erreur 404 renvoie le bon template et code de statut.
     Ce test s'assure que l'utilisateur obtient une page d'erreur conviviale en cas d'URL invalide.
+    AMÉLIORATION: la page est rendue une seule fois puis servie depuis le cache.
     """
-    with patch("gudlft.server.render_template", return_value="404 page") as mock_render:
+    server._static_bodies.clear()
+    with app.test_request_context(), patch(
+        "gudlft.server.render_template", return_value="404 page"
+    ) as mock_render:
         error = MagicMock()
-        response, status_code = not_found_error(error)
-        mock_render.assert_called_with("404.html")
-        assert status_code == 404
+        response = not_found_error(error)
+        not_found_error(error)
+        mock_render.assert_called_once_with("404.html", messages=())
+        assert response.status_code == 404
+        assert response.get_data() == b"404 page"
+    server._static_bodies.clear()
 
 
 def test_500_error_handler():
@@ -117,11 +124,15 @@ def test_500_error_handler():
     Ce test s'assure que l'utilisateur obtient une page d'erreur conviviale en cas d'erreur serveur,
     améliorant ainsi l'expérience utilisateur même dans les situations problématiques.
     """
-    with patch("gudlft.server.render_template", return_value="500 page") as mock_render:
+    server._static_bodies.clear()
+    with app.test_request_context(), patch(
+        "gudlft.server.render_template", return_value="500 page"
+    ) as mock_render:
         error = MagicMock()
-        response, status_code = internal_error(error)
-        mock_render.assert_called_with("500.html")
-        assert status_code == 500
+        response = internal_error(error)
+        mock_render.assert_called_once_with("500.html", messages=())
+        assert response.status_code == 500
+    server._static_bodies.clear()
 
 
 def test_logout(client):
@@ -0,0 +1,87 @@
+"""
+Tests unitaires des sondes de santé (/healthz, /readyz) et des mesures de
+durée (health.py).
+"""
+
+import json
+from datetime import datetime, timedelta
+import pytest
+from unittest.mock import patch
+from gudlft import server
+from gudlft.health import LatencyGauge
+from gudlft.server import app
+
+
+@pytest.fixture
+def client():
+    """Fixture pour le client de test Flask."""
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+def test_latency_gauge():
+    """AJOUT: La jauge conserve la dernière durée, la moyenne mobile et le maximum."""
+    gauge = LatencyGauge(alpha=0.5)
+    assert gauge.summary()["lastMs"] is None
+    gauge.record(0.010)
+    gauge.record(0.002)
+    assert gauge.summary() == {"count": 2, "lastMs": 2.0, "avgMs": 6.0, "maxMs": 10.0}
+
+
+def test_probes_do_not_touch_disk(client):
+    """
+    AJOUT: Test des sondes sans accès disque.
+    Les deux sondes répondent même si aucun fichier ne peut être ouvert.
+    """
+    with patch("builtins.open", side_effect=AssertionError), patch(
+        "os.stat", side_effect=AssertionError
+    ):
+        assert json.loads(client.get("/healthz").data)["status"] == "ok"
+        response = client.get("/readyz")
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data["status"] == "ready"
+    assert data["data"]["clubs"] == 3 and data["data"]["competitions"] == 3
+    assert data["data"]["version"] == server.current_view().version
+
+
+def test_readyz_reports_saves(client):
+    """AJOUT: Après une réservation, /readyz indique la sauvegarde et sa durée."""
+    count = server.save_latency.summary()["count"]
+    client.post(
+        "/purchasePlaces",
+        data={"club": "Simply Lift", "competition": "Spring Festival", "places": "1"},
+    )
+    data = json.loads(client.get("/readyz").data)
+    assert data["data"]["lastSave"] is not None
+    assert data["storage"]["saveLatency"]["count"] == count + 1
+    assert data["locks"]["waitLatency"]["count"] >= 1
+
+
+def test_readyz_not_ready_after_failed_load(client):
+    """
+    AJOUT: Si le chargement échoue (fichier invalide), /readyz répond 503
+    avec l'erreur; il redevient prêt au chargement suivant réussi.
+    """
+    with open("clubs.json", "w") as f:
+        f.write("{invalid")
+    server.refresh_data(force=True)
+    response = client.get("/readyz")
+    assert response.status_code == 503
+    data = json.loads(response.data)
+    assert data["status"] == "not ready"
+    assert list(data["data"]["loadErrors"]) == ["clubs"]
+
+
+def test_readyz_ready_without_competitions(client, monkeypatch, tmp_path):
+    """
+    AJOUT: Des données chargées sans compétition (toutes archivées) laissent
+    le processus disponible.
+    """
+    monkeypatch.setitem(app.config, "ARCHIVE_PATH", str(tmp_path / "archive.json"))
+    server.archive_past_competitions(now=datetime.now() + timedelta(days=365))
+    assert server.current_view().competitions == ()
+    response = client.get("/readyz")
+    assert response.status_code == 200
+    assert json.loads(response.data)["data"]["loadErrors"] == {}
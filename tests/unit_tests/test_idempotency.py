@@ -0,0 +1,103 @@
+"""
+Tests unitaires des clés d'idempotence des réservations (idempotency.py).
+"""
+
+import pytest
+from gudlft import server
+from gudlft.idempotency import IdempotencyStore
+from gudlft.server import app
+
+
+@pytest.fixture
+def client():
+    """Fixture pour le client de test Flask."""
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+def _book(client, key, club="Simply Lift"):
+    return client.post(
+        "/purchasePlaces",
+        data={"club": club, "competition": "Spring Festival", "places": "2"},
+        headers={"Idempotency-Key": key},
+    )
+
+
+def test_retry_returns_cached_outcome(client):
+    """
+    AJOUT: Test d'une nouvelle tentative.
+    La seconde demande renvoie le même résultat sans débiter les points une seconde fois.
+    """
+    first = _book(client, "retry-1")
+    second = _book(client, "retry-1")
+    assert b"Great-booking complete!" in first.data
+    assert second.data == first.data
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert server.current_view().clubs_by_name["Simply Lift"]["points"] == 11
+    assert server.get_club_competition_bookings("Simply Lift", "Spring Festival") == 2
+
+
+def test_keys_are_scoped_by_club(client):
+    """AJOUT: Deux clubs utilisant la même clé réservent chacun de leur côté."""
+    _book(client, "shared-key")
+    response = _book(client, "shared-key", club="She Lifts")
+    assert "Idempotent-Replayed" not in response.headers
+    assert server.current_view().clubs_by_name["She Lifts"]["points"] == 10
+
+
+def test_form_field_key(client):
+    """AJOUT: La clé peut être transmise par le champ idempotency_key du formulaire."""
+    data = {
+        "club": "She Lifts",
+        "competition": "Fall Classic",
+        "places": "1",
+        "idempotency_key": "form-key",
+    }
+    client.post("/purchasePlaces", data=data)
+    response = client.post("/purchasePlaces", data=data)
+    assert response.headers["Idempotent-Replayed"] == "true"
+    assert server.current_view().clubs_by_name["She Lifts"]["points"] == 11
+
+
+def test_booking_form_contains_key(client):
+    """AJOUT: Le formulaire de réservation contient une clé d'idempotence."""
+    response = client.get("/book/1/1")
+    assert b'name="idempotency_key"' in response.data
+
+
+def test_store_lru_and_ttl():
+    """AJOUT: Le magasin est borné (éviction LRU) et les résultats expirent."""
+    now = [0.0]
+    store = IdempotencyStore(max_entries=2, ttl=10, clock=lambda: now[0])
+    for key in ("a", "b", "c"):
+        is_new, entry = store.begin(key)
+        store.complete(entry, key)
+    assert len(store) == 2
+    assert store.begin("a")[0] is True
+
+    is_new, entry = store.begin("c")
+    assert is_new is False and entry.result == "c"
+    now[0] = 11.0
+    assert store.begin("c")[0] is True
+
+
+def test_replay_negotiates_encoding(client):
+    """
+    AJOUT: Test de l'encodage d'une réponse rejouée.
+    Une nouvelle tentative sans compression reçoit le corps non compressé,
+    même si la première réponse (page d'erreur précalculée) était en gzip.
+    """
+    data = {"club": "Iron Temple", "competition": "Spring Festival", "places": "5"}
+    first = client.post(
+        "/purchasePlaces", data=data,
+        headers={"Idempotency-Key": "encoding-1", "Accept-Encoding": "gzip"},
+    )
+    assert first.headers["Content-Encoding"] == "gzip"
+    second = client.post(
+        "/purchasePlaces", data=data,
+        headers={"Idempotency-Key": "encoding-1", "Accept-Encoding": "identity"},
+    )
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert "Content-Encoding" not in second.headers
+    assert b"Not enough points" in second.data
@@ -0,0 +1,73 @@
+"""
+Tests unitaires des identifiants numériques stables des clubs et des
+compétitions (validation.assign_ids, routes et formulaires par identifiants).
+"""
+
+import json
+import pytest
+from gudlft import cli, server
+from gudlft.server import app
+from gudlft.validation import assign_ids
+
+
+@pytest.fixture
+def client():
+    """Fixture pour le client de test Flask."""
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+def test_assign_ids_keeps_existing_ids():
+    """
+    AJOUT: Test de l'attribution des identifiants.
+    Les identifiants valides sont conservés; les autres (absents, invalides ou
+    en double) suivent le plus grand, dans l'ordre du fichier.
+    """
+    records = [{"id": 5}, {}, {"id": "x"}, {"id": 5}, {"id": "2"}]
+    assert [record["id"] for record in assign_ids(records)] == [5, 6, 7, 8, 2]
+    # Identifiants archivés jusqu'à 9: jamais réattribués
+    records = [{"id": 5}, {}]
+    assert [record["id"] for record in assign_ids(records, 9)] == [5, 10]
+
+
+def test_legacy_url_redirects_to_ids(client):
+    """AJOUT: L'ancienne adresse par noms redirige vers la page par identifiants."""
+    response = client.get("/book/Fall Classic/She Lifts")
+    assert response.status_code == 302
+    assert response.headers["Location"].endswith("/book/2/3")
+    response = client.get("/book/2/3")
+    assert b'name="club_id" value="3"' in response.data
+    assert b'name="competition_id" value="2"' in response.data
+    assert client.get("/book/2/99").status_code == 302
+
+
+def test_purchase_by_ids(client):
+    """
+    AJOUT: Test d'une réservation par identifiants.
+    Les identifiants sont enregistrés avec les données sauvegardées.
+    """
+    response = client.post(
+        "/purchasePlaces",
+        data={"club_id": "1", "competition_id": "2", "places": "3"},
+    )
+    assert b"Great-booking complete!" in response.data
+    view = server.current_view()
+    assert view.clubs_by_id[1]["points"] == 10
+    assert view.booked(1, 2) == 3
+    with open("clubs.json") as f:
+        assert [club["id"] for club in json.load(f)["clubs"]] == [1, 2, 3]
+    data = json.loads(client.get("/api/clubs/1/bookings").data)
+    assert data["club"] == "Simply Lift" and data["totalBooked"] == 3
+
+
+def test_assign_ids_command(tmp_path):
+    """AJOUT: La commande assign-ids écrit les identifiants dans les fichiers JSON."""
+    clubs = tmp_path / "clubs.json"
+    competitions = tmp_path / "competitions.json"
+    clubs.write_text(json.dumps({"clubs": [{"name": "A", "id": 4}, {"name": "B"}]}))
+    competitions.write_text(json.dumps({"competitions": [{"name": "Cup"}]}))
+    argv = ["assign-ids", "--clubs", str(clubs), "--competitions", str(competitions)]
+    assert cli.main(argv) == 0
+    assert json.loads(clubs.read_text())["clubs"][1] == {"name": "B", "id": 5}
+    assert json.loads(competitions.read_text())["competitions"][0]["id"] == 1
@@ -0,0 +1,115 @@
+"""
+Tests unitaires de l'import en flux des clubs et des compétitions
+(jsonstream.py, store.stream_import et commande `gudlft import`).
+"""
+
+import io
+import json
+import pytest
+from gudlft import cli, store
+from gudlft.jsonstream import JSONStreamError, iter_items
+from gudlft.store import CLUB_LAYOUT, stream_import
+
+DOCUMENT = {
+    "version": [1, {"nested": "]}"}],
+    "clubs": [
+        {"name": "Club Été", "email": "a@a.com", "points": 12345678901, "id": 4},
+        {"name": "Club B", "email": "b@b.com", "points": "3"},
+        {"name": "Club C", "email": "c@c.com", "points": 0},
+    ],
+}
+
+
+def write_clubs(path, clubs):
+    path.write_text(json.dumps({"clubs": clubs}), encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("use_ijson", [False, True])
+def test_iter_items_matches_full_decode(use_ijson):
+    """
+    AJOUT: Test de la lecture incrémentale.
+    Les éléments lus par petits blocs (coupant chaînes, nombres et caractères
+    UTF-8) sont ceux du décodage complet; les documents invalides sont signalés.
+    """
+    if use_ijson:
+        pytest.importorskip("ijson")
+    data = json.dumps(DOCUMENT, ensure_ascii=False, indent=2).encode("utf-8")
+    items = iter_items(io.BytesIO(data), "clubs", use_ijson=use_ijson, chunk_size=3)
+    assert list(items) == DOCUMENT["clubs"]
+    for invalid in (b'{"other": []}', b'{"clubs": {}}', b'{"clubs": [{"a": 1},'):
+        with pytest.raises(JSONStreamError):
+            list(iter_items(io.BytesIO(invalid), "clubs", use_ijson=use_ijson))
+
+
+def test_stream_import_assigns_missing_ids(tmp_path):
+    """
+    AJOUT: Test de l'import en flux.
+    Les enregistrements sont convertis et les identifiants manquants suivent
+    le plus grand identifiant du fichier.
+    """
+    source = write_clubs(tmp_path / "clubs.json", DOCUMENT["clubs"])
+    result = stream_import(source, "clubs", str(tmp_path / "clubs.dat"), CLUB_LAYOUT)
+    assert (result.count, result.errors) == (3, [])
+    assert [(club["name"], club["points"], club["id"]) for club in result.store.records()] == [
+        ("Club Été", 12345678901, 4), ("Club B", 3, 5), ("Club C", 0, 6),
+    ]
+    result.store.close()
+
+
+def test_stream_import_collects_errors(tmp_path):
+    """
+    AJOUT: Test des erreurs par enregistrement.
+    Toutes les erreurs sont collectées; le fichier n'est écrit qu'avec
+    skip_invalid, sans les enregistrements invalides.
+    """
+    clubs = DOCUMENT["clubs"] + [
+        {"name": "Club B", "email": "d@d.com", "points": 1},
+        {"name": "x" * 65, "email": "e@e.com", "points": 1},
+    ]
+    source = write_clubs(tmp_path / "clubs.json", clubs)
+    output = tmp_path / "clubs.dat"
+    result = stream_import(source, "clubs", str(output), CLUB_LAYOUT)
+    assert result.store is None and not output.exists()
+    assert [error.split(":")[0] for error in result.errors] == ["clubs[3]", "clubs[4]"]
+    assert not (tmp_path / "clubs.dat.tmp").exists()
+
+    result = stream_import(source, "clubs", str(output), CLUB_LAYOUT, skip_invalid=True)
+    assert result.count == 3 and len(result.errors) == 2
+    result.store.close()
+
+
+def test_cli_import_reports_progress(tmp_path, monkeypatch, capsys):
+    """AJOUT: `gudlft import` affiche la progression puis le nombre d'enregistrements écrits."""
+    monkeypatch.setattr(store, "PROGRESS_EVERY", 2)
+    source = write_clubs(tmp_path / "clubs.json", DOCUMENT["clubs"])
+    output = str(tmp_path / "clubs.dat")
+    assert cli.main(["import", "clubs", source, "--output", output]) == 0
+    captured = capsys.readouterr()
+    assert captured.err.splitlines() == [
+        "2 record(s) read (100%)", "3 record(s) read (100%)",
+    ]
+    assert captured.out == f"3 record(s) written to {output}\n"
+
+
+def test_reader_fails_fast_on_syntax_error():
+    """
+    AJOUT: Une erreur de syntaxe est signalée sans lire la suite du fichier;
+    un élément plus grand que max_item_size est refusé. Un nombre coupé par
+    un bloc ("10000000000" puis ".0") est lu en entier.
+    """
+    numbers = b'{"clubs": [10000000000.0, 1e5, -2]}'
+    for chunk_size in range(1, len(numbers)):
+        items = iter_items(io.BytesIO(numbers), "clubs", use_ijson=False, chunk_size=chunk_size)
+        assert list(items) == [1e10, 1e5, -2]
+
+    padding = b", ".join([b'{"name": "Club", "points": 1}'] * 10000)
+    data = io.BytesIO(b'{"clubs": [{"name": x}, ' + padding + b"]}")
+    with pytest.raises(JSONStreamError, match="Expecting value"):
+        list(iter_items(data, "clubs", use_ijson=False, chunk_size=64))
+    assert data.tell() < 1024
+
+    data = io.BytesIO(b'{"clubs": [{"name": "' + b"x" * 10000 + b'"}]}')
+    with pytest.raises(JSONStreamError, match="item larger than 1000 characters"):
+        list(iter_items(data, "clubs", use_ijson=False, chunk_size=64, max_item_size=1000))
+    assert data.tell() < 4096
@@ -0,0 +1,78 @@
+"""
+Tests unitaires du codec JSON (jsoncodec.py).
+Vérifie le décodage, la sérialisation et l'enregistrement du fournisseur JSON
+de l'application, quel que soit le backend disponible.
+"""
+
+import io
+import json
+import pytest
+from gudlft import jsoncodec
+from gudlft.server import app, loadClubs
+
+
+def test_roundtrip():
+    """
+    AJOUT: Test d'aller-retour du codec.
+    Vérifie que la sérialisation produit un JSON valide relu à l'identique.
+    """
+    data = {"clubs": [{"name": "Club A", "email": "a@a.com", "points": "7"}]}
+    encoded = jsoncodec.dumps(data)
+    assert json.loads(encoded) == data
+    assert jsoncodec.loads(encoded) == data
+    assert jsoncodec.loads(encoded.encode("utf-8")) == data
+
+
+def test_dump_and_load_file():
+    """AJOUT: Test de l'écriture et de la lecture via des fichiers ouverts en mode texte."""
+    buffer = io.StringIO()
+    jsoncodec.dump({"Club A_Competition": 3}, buffer)
+    buffer.seek(0)
+    assert jsoncodec.load(buffer) == {"Club A_Competition": 3}
+
+
+def test_invalid_document_raises_decode_error():
+    """AJOUT: Un document invalide lève une erreur de DECODE_ERRORS."""
+    with pytest.raises(jsoncodec.DECODE_ERRORS):
+        jsoncodec.loads("invalid json")
+
+
+def test_typed_clubs_are_integers():
+    """
+    AJOUT: Test du chargement typé des clubs.
+    Les points sont des entiers, que la conversion soit faite par le codec ou par loadClubs.
+    """
+    assert all(isinstance(club["points"], int) for club in loadClubs())
+
+
+def test_load_keeps_unknown_fields_and_reassigns_invalid_ids(tmp_path, monkeypatch):
+    """
+    AJOUT: Quel que soit le backend, les champs inconnus sont conservés et un
+    identifiant invalide est réattribué au lieu de rejeter tout le fichier.
+    """
+    clubs = [
+        {"id": 1, "name": "A", "email": "a@a.com", "points": "3", "phone": "0102"},
+        {"id": "abc", "name": "B", "email": "b@b.com", "points": 5},
+    ]
+    (tmp_path / "clubs.json").write_text(json.dumps({"clubs": clubs}))
+    monkeypatch.chdir(tmp_path)
+    loaded = loadClubs()
+    assert [(club["id"], club["points"]) for club in loaded] == [(1, 3), (2, 5)]
+    assert loaded[0]["phone"] == "0102"
+
+
+def test_flask_json_provider():
+    """
+    AJOUT: Test du fournisseur JSON de Flask.
+    Vérifie que le fournisseur rapide est enregistré et qu'il sert les réponses de l'API.
+    """
+    assert isinstance(app.json, jsoncodec.FastJSONProvider)
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        response = client.get("/api/points")
+    assert response.mimetype == "application/json"
+    assert "clubs" in json.loads(response.data)
+    assert json.loads(app.json.dumps({"b": 1, "a": [1, 2]}, indent=2)) == {
+        "a": [1, 2],
+        "b": 1,
+    }
@@ -0,0 +1,79 @@
+"""
+Tests unitaires des réponses précalculées de /points et /api/points.
+Vérifie la cohérence des deux vues, la négociation de la compression et les
+réponses conditionnelles (ETag).
+"""
+
+import gzip
+import json
+import pytest
+from gudlft import server
+from gudlft.server import app
+
+
+@pytest.fixture
+def client():
+    """Fixture pour le client de test Flask."""
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+def test_points_bodies_built_once_per_version(client, monkeypatch):
+    """
+    AJOUT: Test du précalcul par version.
+    Deux requêtes successives réutilisent le même corps de réponse; les autres
+    corps et encodages ne sont construits qu'à leur première demande.
+    """
+    monkeypatch.setattr(server, "_points_bodies", {})
+    client.get("/api/points")
+    body = server.points_body("json")
+    client.get("/api/points")
+    assert server.points_body("json") is body
+    assert set(body) == {"identity", "etag"}
+    assert server._points_bodies.keys() == {"version", "json"}
+    assert server._points_bodies["version"] == server.current_view().version
+
+    client.get("/api/points", headers={"Accept-Encoding": "gzip"})
+    client.get("/points")
+    assert set(body) == {"identity", "etag", "gzip"}
+    assert server._points_bodies.keys() == {"version", "json", "html"}
+
+
+def test_gzip_variant_served(client):
+    """AJOUT: Le corps gzip précalculé est servi si le client l'accepte."""
+    response = client.get("/api/points", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    data = json.loads(gzip.decompress(response.data))
+    assert {"id": 1, "name": "Simply Lift", "points": 13} in data["clubs"]
+
+
+def test_identity_without_accept_encoding(client):
+    """AJOUT: Sans Accept-Encoding, la réponse n'est pas compressée."""
+    response = client.get("/points")
+    assert "Content-Encoding" not in response.headers
+    assert b"Club Points" in response.data
+
+
+def test_conditional_request(client):
+    """AJOUT: Un client possédant déjà la version courante reçoit une réponse 304."""
+    etag = client.get("/api/points").headers["ETag"]
+    response = client.get("/api/points", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_page_and_api_agree_after_booking(client):
+    """
+    AJOUT: Test de cohérence.
+    Après une réservation, la page et l'API reflètent les mêmes points sans vider de cache.
+    """
+    client.get("/api/points")
+    client.post(
+        "/purchasePlaces",
+        data={"club": "She Lifts", "competition": "Spring Festival", "places": "2"},
+    )
+    data = json.loads(client.get("/api/points").data)
+    points = next(club["points"] for club in data["clubs"] if club["name"] == "She Lifts")
+    assert points == 10
+    assert b'<td class="points">10</td>' in client.get("/points").data
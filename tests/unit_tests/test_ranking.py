@@ -0,0 +1,87 @@
+"""
+Tests unitaires du classement des clubs par points (ranking.py).
+Vérifie le classement maintenu, ses deux implémentations et les routes
+/points?sort=points, /api/points?top=N et /api/clubs/<club>/rank.
+"""
+
+import json
+import pytest
+from gudlft import ranking
+from gudlft.server import app
+
+
+@pytest.fixture
+def client():
+    """Fixture pour le client de test Flask."""
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture(params=["sortedcontainers", "bisect"])
+def make_leaderboard(request, monkeypatch):
+    """Construit un classement avec chacune des deux listes triées."""
+    if request.param == "bisect":
+        monkeypatch.setattr(ranking, "SortedList", None)
+    elif ranking.SortedList is None:
+        pytest.skip("sortedcontainers is not installed")
+    return ranking.Leaderboard
+
+
+def test_leaderboard_updates_and_ties(make_leaderboard):
+    """
+    AJOUT: Test du classement maintenu.
+    Les ex aequo partagent le même rang et un débit déplace le club.
+    """
+    board = make_leaderboard(
+        [
+            {"name": "A", "points": 5},
+            {"name": "B", "points": 9},
+            {"name": "C", "points": 5},
+        ]
+    )
+    assert board.top() == [
+        {"name": "B", "points": 9, "rank": 1},
+        {"name": "A", "points": 5, "rank": 2},
+        {"name": "C", "points": 5, "rank": 2},
+    ]
+    assert board.rank("C") == 2
+    board.update("B", 1)
+    assert [row["name"] for row in board.top(2)] == ["A", "C"]
+    assert board.rank("B") == 3
+    assert board.rank("Unknown") is None
+
+
+def test_ranked_points_page(client):
+    """AJOUT: /points?sort=points affiche les clubs par points décroissants."""
+    html = client.get("/points?sort=points").data.decode()
+    positions = [html.index(name) for name in ("Simply Lift", "She Lifts", "Iron Temple")]
+    assert positions == sorted(positions)
+    assert "<th>Rank</th>" in html
+    assert "<th>Rank</th>" not in client.get("/points").data.decode()
+
+
+def test_api_top_and_rank_follow_bookings(client):
+    """
+    AJOUT: Test de la mise à jour du classement après une réservation.
+    Simply Lift (13 points) passe derrière She Lifts (12 points).
+    """
+    client.post(
+        "/purchasePlaces",
+        data={"club": "Simply Lift", "competition": "Spring Festival", "places": "2"},
+    )
+    data = json.loads(client.get("/api/points?top=2").data)
+    assert data["clubs"] == [
+        {"id": 3, "name": "She Lifts", "points": 12, "rank": 1},
+        {"id": 1, "name": "Simply Lift", "points": 11, "rank": 2},
+    ]
+    expected = {"id": 1, "club": "Simply Lift", "points": 11, "rank": 2, "clubs": 3}
+    assert json.loads(client.get("/api/clubs/Simply Lift/rank").data) == expected
+    assert json.loads(client.get("/api/clubs/1/rank").data) == expected
+
+
+def test_invalid_top_and_unknown_club(client):
+    """AJOUT: Paramètre top invalide (400) et club inconnu (404)."""
+    assert client.get("/api/points?top=zero").status_code == 400
+    assert client.get("/api/points?top=0").status_code == 400
+    assert client.get("/api/clubs/Unknown/rank").status_code == 404
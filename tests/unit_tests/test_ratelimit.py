@@ -0,0 +1,109 @@
+"""
+Tests unitaires de la limitation de débit (ratelimit.py).
+Vérifie les seaux à jetons (remplissage, Retry-After, backend cache) et les
+réponses 429 par adresse IP et par club.
+"""
+
+import pytest
+from flask_caching import Cache
+from gudlft import server
+from gudlft.ratelimit import CacheRateLimiter, MemoryRateLimiter
+from gudlft.server import app
+
+
+@pytest.fixture
+def limits():
+    """Active la limitation avec des limites propres au test."""
+    previous = app.config["RATE_LIMITS"]
+    app.config["RATELIMIT_ENABLED"] = True
+    server._rate_limiter = None
+    yield app.config
+    app.config["RATE_LIMITS"] = previous
+    server._rate_limiter = None
+
+
+@pytest.fixture
+def client():
+    """Fixture pour le client de test Flask."""
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+def test_token_bucket_refill():
+    """
+    AJOUT: Test du seau à jetons.
+    Deux jetons par 10 secondes: la troisième requête attend 5 secondes.
+    """
+    now = [0.0]
+    limiter = MemoryRateLimiter(clock=lambda: now[0])
+    assert limiter.consume("a", 2, 10) == (True, 0)
+    assert limiter.consume("a", 2, 10) == (True, 0)
+    assert limiter.consume("a", 2, 10) == (False, 5.0)
+    assert limiter.consume("b", 2, 10)[0] is True
+    now[0] = 5
+    assert limiter.consume("a", 2, 10)[0] is True
+
+
+def test_show_summary_limited_by_ip(client, limits):
+    """AJOUT: Au-delà de la limite par IP, showSummary répond 429 avec Retry-After."""
+    limits["RATE_LIMITS"] = {"showSummary": {"ip": (2, 60)}}
+    for _ in range(2):
+        response = client.post("/showSummary", data={"email": "unknown@test.com"})
+        assert response.status_code == 302
+    response = client.post("/showSummary", data={"email": "john@simplylift.co"})
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "30"
+
+
+def test_purchase_limited_by_club(client, limits):
+    """
+    AJOUT: Test de la limite par club.
+    Le club connecté limité est refusé sans réservation; les autres clubs
+    réservent.
+    """
+    limits["RATE_LIMITS"] = {"purchasePlaces": {"club": (1, 60)}}
+    client.post("/showSummary", data={"email": "john@simplylift.co"})
+    data = {"club": "Simply Lift", "competition": "Spring Festival", "places": "1"}
+    assert client.post("/purchasePlaces", data=data).status_code == 200
+    assert client.post("/purchasePlaces", data=data).status_code == 429
+    assert server.current_view().clubs_by_name["Simply Lift"]["points"] == 12
+    client.post("/showSummary", data={"email": "kate@shelifts.co.uk"})
+    data["club"] = "She Lifts"
+    assert client.post("/purchasePlaces", data=data).status_code == 200
+
+
+def test_anonymous_requests_do_not_drain_club_bucket(client, limits):
+    """
+    AJOUT: Les requêtes sans session, même au nom d'un club (email, club du
+    formulaire), ne consomment pas le seau de ce club.
+    """
+    limits["RATE_LIMITS"] = {
+        "showSummary": {"club": (1, 60)},
+        "purchasePlaces": {"club": (1, 60)},
+    }
+    data = {"club": "Simply Lift", "competition": "Spring Festival", "places": "1"}
+    with app.test_client() as attacker:
+        for _ in range(3):
+            assert attacker.post(
+                "/showSummary", data={"email": "john@simplylift.co"}
+            ).status_code == 200
+            attacker.delete_cookie(app.config["SESSION_ID_COOKIE"])
+            assert attacker.post("/purchasePlaces", data=data).status_code == 200
+    client.post("/showSummary", data={"email": "john@simplylift.co"})
+    assert client.post("/purchasePlaces", data=data).status_code == 200
+
+
+def test_eligibility_report_limited_by_ip(client, limits):
+    """AJOUT: Le rapport d'éligibilité est limité par IP, avant le contrôle du jeton."""
+    limits["RATE_LIMITS"] = {"api_eligibility": {"ip": (1, 60)}}
+    assert client.get("/api/eligibility").status_code in (401, 403)
+    assert client.get("/api/eligibility").status_code == 429
+
+
+def test_cache_backend():
+    """AJOUT: Le backend "cache" conserve les seaux dans un cache Flask-Caching."""
+    limiter = CacheRateLimiter(Cache(app, config={"CACHE_TYPE": "SimpleCache"}))
+    assert limiter.consume("a", 1, 60)[0] is True
+    allowed, retry_after = limiter.consume("a", 1, 60)
+    assert allowed is False and 0 < retry_after <= 60
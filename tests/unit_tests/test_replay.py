@@ -0,0 +1,264 @@
+"""
+Tests unitaires du rejeu du journal d'audit (replay.py) et des commandes
+`gudlft verify` / `gudlft rebuild`.
+"""
+
+import json
+import pytest
+from gudlft import cli
+from gudlft.audit import journal_files
+from gudlft.replay import IncompleteJournalError, Replay, Verification
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    numpy = None
+
+CLUBS = [
+    {"id": 1, "name": "Simply Lift", "email": "john@simplylift.co", "points": "13"},
+    {"id": 2, "name": "Iron Temple", "email": "admin@irontemple.com", "points": "4"},
+]
+COMPETITIONS = [
+    {"id": 1, "name": "Spring Festival", "date": "2030-03-27 10:00:00", "numberOfPlaces": "25"},
+    {"id": 2, "name": "Fall Classic", "date": "2030-10-22 13:30:00", "numberOfPlaces": "13"},
+]
+
+
+def booked(club_id, competition_id, places, points_after, places_after):
+    return {
+        "outcome": "booked", "clubId": club_id, "competitionId": competition_id,
+        "places": places, "pointsAfter": points_after, "placesAfter": places_after,
+    }
+
+
+def numbered(events, log="a", first=1):
+    return [{"log": log, "seq": first + i, **event} for i, event in enumerate(events)]
+
+
+EVENTS = numbered([
+    booked(1, 1, 2, 11, 23),
+    {"outcome": "refused", "clubId": 2, "competitionId": 2, "places": 12},
+    booked(2, 2, 1, 3, 12),
+    booked(1, 1, 3, 8, 20),
+    booked(9, 1, 1, 0, 19),
+])
+
+
+# Point de reprise au début du journal: valeurs de CLUBS et COMPETITIONS
+CHECKPOINT = {
+    "positions": {}, "bookings": {},
+    "points": {"1": 13, "2": 4}, "places": {"1": 25, "2": 13},
+}
+
+
+def write_journal(directory, events, split=2):
+    lines = [json.dumps(event) + "\n" for event in events]
+    (directory / "audit.jsonl.1").write_text("".join(lines[:split]))
+    (directory / "audit.jsonl").write_text("".join(lines[split:]))
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """
+    Fichiers de données cohérents avec EVENTS, journal réparti sur deux
+    fichiers et point de reprise au début du journal (aucune réservation).
+    """
+    clubs = [dict(club) for club in CLUBS]
+    clubs[0]["points"], clubs[1]["points"] = "8", "3"
+    competitions = [dict(comp) for comp in COMPETITIONS]
+    competitions[0]["numberOfPlaces"], competitions[1]["numberOfPlaces"] = "20", "12"
+    (tmp_path / "clubs.json").write_text(json.dumps({"clubs": clubs}))
+    (tmp_path / "competitions.json").write_text(
+        json.dumps({"competitions": competitions})
+    )
+    (tmp_path / "bookings.json").write_text(
+        json.dumps({"Simply Lift_Spring Festival": 5, "Iron Temple_Fall Classic": 1})
+    )
+    write_journal(tmp_path, EVENTS)
+    (tmp_path / "audit.jsonl.checkpoint").write_text(json.dumps(CHECKPOINT))
+    return tmp_path
+
+
+def paths(directory):
+    return [
+        str(directory / name)
+        for name in ("clubs.json", "competitions.json", "bookings.json")
+    ]
+
+
+def test_replay_aggregates_by_chunks(data_dir):
+    """
+    AJOUT: Test du rejeu par blocs.
+    Les totaux sont calculés quel que soit le découpage; les événements
+    inconnus et les lignes illisibles sont comptés.
+    """
+    with open(data_dir / "audit.jsonl", "a") as f:
+        f.write('{"outcome": "booked", trunc\n')
+    journal = journal_files(str(data_dir / "audit.jsonl"))
+    assert [path.rsplit("/", 1)[1] for path in journal] == ["audit.jsonl.1", "audit.jsonl"]
+    result = Replay(CLUBS, COMPETITIONS, use_numpy=False, chunk_size=2).feed(journal)
+    assert result.totals() == {(1, 1): 5, (2, 2): 1}
+    assert result.club_totals() == {1: 5, 2: 1}
+    assert result.competition_totals() == {1: 5, 2: 1}
+    assert (result.events, result.unknown, result.invalid_lines) == (3, 1, 1)
+    assert (result.positions, result.missing) == ({"a": 5}, 0)
+
+
+def test_verify_detects_mismatches(data_dir, capsys):
+    """
+    AJOUT: Test de `gudlft verify`.
+    Les fichiers cohérents passent; une écriture perdue est signalée.
+    """
+    clubs, competitions, bookings = paths(data_dir)
+    options = [
+        "--clubs", clubs, "--competitions", competitions, "--bookings", bookings,
+        "--journal", str(data_dir / "audit.jsonl"), "--no-numpy",
+    ]
+    assert cli.main(["verify", *options]) == 0
+
+    (data_dir / "bookings.json").write_text(json.dumps({"Simply Lift_Spring Festival": 2}))
+    assert cli.main(["verify", *options]) == 1
+    output = capsys.readouterr().out
+    assert "bookings Simply Lift_Spring Festival: stored 2, journal 5" in output
+    assert "bookings Iron Temple_Fall Classic: stored 0, journal 1" in output
+
+
+def test_rebuild_repairs_data_files(data_dir):
+    """AJOUT: `gudlft rebuild` réécrit points, places et totaux d'après le journal."""
+    clubs, competitions, bookings = paths(data_dir)
+    (data_dir / "clubs.json").write_text(json.dumps({"clubs": CLUBS}))
+    (data_dir / "bookings.json").write_text(json.dumps({"Iron Temple_Spring Festival": 4}))
+    journal = journal_files(str(data_dir / "audit.jsonl"))
+    checkpoint = CHECKPOINT
+
+    verification = Verification(
+        clubs, competitions, bookings, journal, checkpoint, use_numpy=False
+    )
+    assert {mismatch.kind for mismatch in verification.mismatches} == {"points", "bookings"}
+    verification.repair()
+
+    assert Verification(clubs, competitions, bookings, journal, checkpoint).mismatches == []
+    saved_clubs = json.loads((data_dir / "clubs.json").read_text())["clubs"]
+    assert [club["points"] for club in saved_clubs] == ["8", "3"]
+    assert json.loads((data_dir / "bookings.json").read_text()) == {
+        "Iron Temple_Spring Festival": 4,
+        "Simply Lift_Spring Festival": 5, "Iron Temple_Fall Classic": 1,
+    }
+    assert verification.next_checkpoint()["positions"] == {"a": 5}
+    assert verification.next_checkpoint()["points"] == {"1": 8, "2": 3}
+
+
+def test_expected_values_do_not_depend_on_file_order(data_dir):
+    """
+    AJOUT: Les journaux de deux processus ne sont pas dans l'ordre des
+    réservations: le journal "b" (réservation la plus récente) est lu avant
+    le journal "a". Points et places attendus sont ceux des fichiers.
+    """
+    clubs, competitions, bookings = paths(data_dir)
+    write_journal(
+        data_dir,
+        numbered([booked(1, 1, 2, 8, 20)], log="b")
+        + numbered([booked(1, 1, 3, 10, 22), booked(2, 2, 1, 3, 12)], log="a"),
+        split=1,
+    )
+    journal = journal_files(str(data_dir / "audit.jsonl"))
+    for use_numpy in (False, True) if numpy else (False,):
+        verification = Verification(
+            clubs, competitions, bookings, journal, CHECKPOINT, use_numpy=use_numpy
+        )
+        assert verification.expected_counters() == [{1: 8, 2: 3}, {1: 20, 2: 12}]
+        assert verification.mismatches == verification.unverifiable == []
+
+
+def test_replay_starts_from_checkpoint(data_dir, capsys):
+    """
+    AJOUT: Test du point de reprise.
+    Seuls les événements suivants sont rejoués et ajoutés aux totaux du point
+    de reprise; un total modifié sans réservation dans le journal est
+    signalé comme invérifiable et conservé par `gudlft rebuild`.
+    """
+    clubs, competitions, bookings = paths(data_dir)
+    journal = str(data_dir / "audit.jsonl")
+    options = [
+        "--clubs", clubs, "--competitions", competitions, "--bookings", bookings,
+        "--journal", journal, "--no-numpy",
+    ]
+    # Réservations antérieures au journal, puis un événement avant le point de reprise
+    (data_dir / "bookings.json").write_text(
+        json.dumps({"Simply Lift_Spring Festival": 10, "Iron Temple_Spring Festival": 4})
+    )
+    write_journal(data_dir, numbered([booked(1, 1, 1, 9, 21)]), split=0)
+    assert cli.main([
+        "checkpoint", "--clubs", clubs, "--competitions", competitions,
+        "--bookings", bookings, "--journal", journal,
+    ]) == 0
+    checkpoint = json.loads((data_dir / "audit.jsonl.checkpoint").read_text())
+    assert checkpoint["positions"] == {"a": 1}
+    assert checkpoint["points"] == {"1": 8, "2": 3}
+
+    write_journal(
+        data_dir,
+        numbered([booked(1, 1, 1, 9, 21), booked(1, 1, 1, 8, 20)]),
+        split=0,
+    )
+    (data_dir / "bookings.json").write_text(
+        json.dumps({"Simply Lift_Spring Festival": 11, "Iron Temple_Spring Festival": 7})
+    )
+    saved = json.loads((data_dir / "clubs.json").read_text())
+    saved["clubs"][0]["points"] = "7"
+    (data_dir / "clubs.json").write_text(json.dumps(saved))
+    saved = json.loads((data_dir / "competitions.json").read_text())
+    saved["competitions"][0]["numberOfPlaces"] = "19"
+    (data_dir / "competitions.json").write_text(json.dumps(saved))
+    capsys.readouterr()
+    assert cli.main(["verify", *options]) == 0
+    output = capsys.readouterr().out
+    assert "Replayed 1 booking(s)" in output
+    assert "unverifiable bookings Iron Temple_Spring Festival: stored 7, checkpoint 4" in output
+    assert cli.main(["rebuild", *options]) == 0
+    assert json.loads((data_dir / "bookings.json").read_text()) == {
+        "Simply Lift_Spring Festival": 11, "Iron Temple_Spring Festival": 7,
+    }
+
+
+def test_rebuild_refuses_incomplete_journal(data_dir, capsys):
+    """
+    AJOUT: Le journal doit remonter jusqu'au point de reprise sans événement
+    manquant, sinon `gudlft rebuild` ne réécrit rien.
+    """
+    clubs, competitions, bookings = paths(data_dir)
+    journal = journal_files(str(data_dir / "audit.jsonl"))
+    checkpoint = dict(CHECKPOINT, positions={"a": 1})
+    # Événement du point de reprise supprimé par la rotation, puis trou
+    write_journal(data_dir, EVENTS[1:3] + EVENTS[4:])
+    verification = Verification(clubs, competitions, bookings, journal, checkpoint)
+    assert verification.problems == [
+        "the journal does not reach back to the checkpoint (1 log(s))",
+        "1 event(s) missing from the journal",
+    ]
+    with pytest.raises(IncompleteJournalError):
+        verification.repair()
+
+    before = (data_dir / "bookings.json").read_text()
+    (data_dir / "audit.jsonl.checkpoint").write_text(json.dumps(checkpoint))
+    options = [
+        "--clubs", clubs, "--competitions", competitions, "--bookings", bookings,
+        "--journal", str(data_dir / "audit.jsonl"),
+    ]
+    assert cli.main(["rebuild", *options]) == 1
+    assert "Incomplete journal: 1 event(s) missing" in capsys.readouterr().err
+    assert (data_dir / "bookings.json").read_text() == before
+
+
+def test_numpy_matches_pure_python(data_dir):
+    """AJOUT: L'agrégation numpy donne les mêmes résultats que la version Python."""
+    pytest.importorskip("numpy")
+    journal = journal_files(str(data_dir / "audit.jsonl"))
+    results = [
+        Replay(CLUBS, COMPETITIONS, use_numpy=use_numpy, chunk_size=2).feed(journal)
+        for use_numpy in (False, True)
+    ]
+    python, vectorised = (
+        [r.totals(), r.club_totals(), r.competition_totals()] for r in results
+    )
+    assert python == vectorised
@@ -0,0 +1,66 @@
+"""
+Tests unitaires du mode sans session des messages (SESSIONLESS_MESSAGES).
+Vérifie que les routes de réservation n'émettent aucun cookie et que les
+messages sont rendus dans la page ou transmis par code à la page d'accueil.
+"""
+
+import pytest
+from gudlft.server import app
+
+
+@pytest.fixture
+def client():
+    """Fixture pour le client de test Flask, en mode sans session."""
+    app.config["TESTING"] = True
+    app.config["SESSIONLESS_MESSAGES"] = True
+    with app.test_client() as client:
+        yield client
+    app.config["SESSIONLESS_MESSAGES"] = False
+
+
+def test_booking_result_rendered_without_cookie(client):
+    """
+    AJOUT: Test du résultat d'une réservation.
+    Le message est dans la page rendue et la réponse n'a pas de Set-Cookie.
+    """
+    response = client.post(
+        "/purchasePlaces",
+        data={"club": "Simply Lift", "competition": "Spring Festival", "places": "1"},
+    )
+    assert b"Great-booking complete!" in response.data
+    assert "Set-Cookie" not in response.headers
+
+
+def test_redirect_carries_message_code(client):
+    """
+    AJOUT: Test d'une redirection vers l'accueil.
+    Le message est transmis par code et affiché par une page précalculée.
+    """
+    response = client.post("/showSummary", data={"email": ""})
+    assert response.status_code == 302
+    assert response.headers["Location"].endswith("/?msg=email-required")
+    assert "Set-Cookie" not in response.headers
+
+    page = client.get("/?msg=email-required")
+    assert b"<li>Please provide an email</li>" in page.data
+    assert "Set-Cookie" not in page.headers
+    assert "Cookie" not in page.headers.get("Vary", "")
+
+
+def test_unknown_code_and_purchase_error(client):
+    """AJOUT: Un code inconnu est ignoré; une réservation invalide redirige avec son code."""
+    assert b"<li>" not in client.get("/?msg=nope").data
+    response = client.post(
+        "/purchasePlaces",
+        data={"club": "Simply Lift", "competition": "Unknown", "places": "1"},
+    )
+    assert response.headers["Location"].endswith("/?msg=not-found")
+
+
+def test_session_mode_shows_flash_on_index():
+    """AJOUT: Sans le mode sans session, l'accueil affiche les messages flash."""
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        client.post("/showSummary", data={"email": ""})
+        assert b"<li>Please provide an email</li>" in client.get("/").data
+        assert b"<li>" not in client.get("/").data
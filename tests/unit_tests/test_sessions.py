@@ -0,0 +1,83 @@
+"""
+Tests unitaires des sessions côté serveur (sessions.py).
+Vérifie les backends (LRU, expiration, cache partagé) et l'utilisation du club
+connecté par les routes book, purchasePlaces et logout.
+"""
+
+import pytest
+from flask_caching import Cache
+from gudlft import server
+from gudlft.server import app
+from gudlft.sessions import CacheSessionBackend, MemorySessionBackend
+
+
+@pytest.fixture
+def client():
+    """Fixture pour le client de test Flask."""
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+    app.config["REQUIRE_LOGIN"] = False
+
+
+def login(client, email="john@simplylift.co"):
+    response = client.post("/showSummary", data={"email": email})
+    assert response.status_code == 200
+    return response
+
+
+def test_memory_backend_lru_and_ttl():
+    """
+    AJOUT: Test du backend en mémoire.
+    La session la moins récemment utilisée est évincée et une session
+    inactive expire.
+    """
+    now = [0.0]
+    backend = MemorySessionBackend(max_entries=2, ttl=10, clock=lambda: now[0])
+    first = backend.create({"club": "A"})
+    second = backend.create({"club": "B"})
+    assert backend.get(first) == {"club": "A"}
+    backend.create({"club": "C"})
+    assert backend.get(second) is None
+    now[0] = 9
+    assert backend.get(first) == {"club": "A"}
+    now[0] = 30
+    assert backend.get(first) is None
+
+
+def test_cache_backend():
+    """AJOUT: Le backend "cache" stocke les sessions dans un cache Flask-Caching."""
+    backend = CacheSessionBackend(Cache(app, config={"CACHE_TYPE": "SimpleCache"}))
+    session_id = backend.create({"club": "A"})
+    assert backend.get(session_id) == {"club": "A"}
+    backend.delete(session_id)
+    assert backend.get(session_id) is None
+
+
+def test_login_keeps_club_for_booking(client):
+    """
+    AJOUT: Test du club connecté.
+    Après la connexion, la réservation n'a plus besoin du nom du club et un
+    autre club ne peut pas être utilisé.
+    """
+    response = login(client)
+    assert "HttpOnly" in response.headers["Set-Cookie"]
+
+    response = client.post(
+        "/purchasePlaces", data={"competition": "Spring Festival", "places": "1"}
+    )
+    assert b"Great-booking complete!" in response.data
+    assert server.current_view().clubs_by_name["Simply Lift"]["points"] == 12
+
+    response = client.get("/book/Spring Festival/Iron Temple")
+    assert response.status_code == 302
+
+
+def test_require_login_and_logout(client):
+    """AJOUT: Avec REQUIRE_LOGIN, seul un club connecté peut réserver."""
+    app.config["REQUIRE_LOGIN"] = True
+    assert client.get("/book/1/1").status_code == 302
+    login(client)
+    assert client.get("/book/1/1").status_code == 200
+    client.get("/logout")
+    assert client.get("/book/1/1").status_code == 302
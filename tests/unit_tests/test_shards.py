@@ -0,0 +1,168 @@
+"""
+Tests unitaires du partitionnement des réservations par compétition (shards.py).
+"""
+
+import multiprocessing
+import os
+import threading
+import pytest
+from gudlft import server
+from gudlft.server import app
+from gudlft.shards import ClubLocks, ShardRouter, booking_locks
+
+
+def test_shard_for_is_stable():
+    """AJOUT: Une compétition est toujours attribuée au même shard."""
+    router = ShardRouter(8)
+    assert router.shard_for("Spring Festival") is router.shard_for("Spring Festival")
+    assert ShardRouter(8).shard_for("Spring Festival").index == (
+        router.shard_for("Spring Festival").index
+    )
+    with pytest.raises(ValueError):
+        ShardRouter(0)
+
+
+def test_other_shards_not_blocked():
+    """
+    AJOUT: Test du parallélisme entre shards.
+    Pendant qu'une réservation tient le verrou de son shard, une réservation
+    d'un autre club sur un autre shard obtient ses verrous.
+    """
+    router = ShardRouter(2)
+    locks = ClubLocks()
+    names = ["Competition %d" % number for number in range(10)]
+    first = names[0]
+    other = next(n for n in names if router.shard_for(n) is not router.shard_for(first))
+    same = next(
+        n for n in names[1:] if router.shard_for(n) is router.shard_for(first)
+    )
+    acquired = {}
+
+    def book(club, competition):
+        shard = router.shard_for(competition)
+        acquired[competition] = shard.lock.acquire(timeout=0.05)
+        if acquired[competition]:
+            shard.lock.release()
+
+    with booking_locks(router, locks, "Club A", first):
+        for competition in (other, same):
+            thread = threading.Thread(target=book, args=("Club B", competition))
+            thread.start()
+            thread.join()
+    assert acquired == {other: True, same: False}
+
+
+def test_concurrent_bookings_keep_points_consistent():
+    """
+    AJOUT: Test de cohérence sous concurrence.
+    Des réservations simultanées d'un même club sur deux compétitions ne
+    débitent jamais plus de points que le club n'en possède.
+    """
+    app.config["TESTING"] = True
+    results = []
+
+    def book(competition):
+        with app.test_client() as client:
+            response = client.post(
+                "/purchasePlaces",
+                data={"club": "Iron Temple", "competition": competition, "places": "1"},
+            )
+            results.append(b"Great-booking complete!" in response.data)
+
+    threads = [
+        threading.Thread(
+            target=book, args=(("Spring Festival", "Fall Classic")[number % 2],)
+        )
+        for number in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    server.refresh_data(force=True)
+    assert results.count(True) == 4
+    assert server.current_view().clubs_by_name["Iron Temple"]["points"] == 0
+    booked = server.current_view().club_bookings[2]
+    assert sum(booked.values()) == 4
+
+
+@pytest.fixture
+def mmap_backend():
+    """Active le backend mmap puis supprime les fichiers d'enregistrements créés."""
+    app.config["DATA_BACKEND"] = "mmap"
+    yield
+    server.close_stores()
+    app.config["DATA_BACKEND"] = "json"
+    for store_path, _, _ in server.STORES.values():
+        if os.path.exists(store_path):
+            os.remove(store_path)
+
+
+def test_bookings_on_other_shards_overlap(mmap_backend, monkeypatch):
+    """
+    AJOUT: Test du parallélisme des réservations.
+    Avec le backend mmap, deux réservations de clubs différents sur des
+    compétitions de shards différents mettent à jour leurs compteurs en même
+    temps: chacune attend l'autre dans l'écriture des points.
+    """
+    router = server.shard_router
+    assert router.shard_for("Spring Festival") is not router.shard_for("Fall Classic")
+    app.config["TESTING"] = True
+    server.refresh_data(force=True)
+    store = server.get_store("clubs")
+    set_value = store.set_value
+    barrier = threading.Barrier(2, timeout=2)
+
+    def overlapping_set_value(name, value):
+        barrier.wait()
+        set_value(name, value)
+
+    monkeypatch.setattr(store, "set_value", overlapping_set_value)
+    results = []
+
+    def book(club, competition):
+        with app.test_client() as client:
+            response = client.post(
+                "/purchasePlaces",
+                data={"club": club, "competition": competition, "places": "1"},
+            )
+            results.append(b"Great-booking complete!" in response.data)
+
+    threads = [
+        threading.Thread(target=book, args=("Simply Lift", "Spring Festival")),
+        threading.Thread(target=book, args=("Iron Temple", "Fall Classic")),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [True, True]
+    assert not barrier.broken
+    view = server.current_view()
+    assert view.clubs_by_name["Simply Lift"]["points"] == 12
+    assert view.clubs_by_name["Iron Temple"]["points"] == 3
+
+
+def _book_repeatedly(club_name, count):
+    for _ in range(count):
+        server.save_booking(club_name, "Spring Festival", 1)
+
+
+def test_bookings_file_shared_between_processes():
+    """
+    AJOUT: Test du verrou inter-processus de bookings.json.
+    Des processus réservant pour des clubs différents ne perdent aucune mise
+    à jour des totaux.
+    """
+    context = multiprocessing.get_context("fork")
+    clubs = ["Club %d" % number for number in range(4)]
+    processes = [
+        context.Process(target=_book_repeatedly, args=(club, 25)) for club in clubs
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    bookings = server.load_bookings()
+    assert [bookings[f"{club}_Spring Festival"] for club in clubs] == [25] * 4
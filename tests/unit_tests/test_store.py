@@ -0,0 +1,153 @@
+"""
+Tests unitaires du stockage à enregistrements de taille fixe (store.py).
+Vérifie la création, la mise à jour en place, l'export JSON et l'utilisation
+du backend "mmap" par l'application.
+"""
+
+import json
+import os
+import pytest
+from gudlft import server
+from gudlft.server import app
+from gudlft.store import CLUB_LAYOUT, RecordStore, StoreError
+
+
+@pytest.fixture
+def client():
+    """Fixture pour le client de test Flask."""
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def mmap_backend():
+    """Active le backend mmap puis supprime les fichiers d'enregistrements créés."""
+    app.config["DATA_BACKEND"] = "mmap"
+    yield
+    server.close_stores()
+    app.config["DATA_BACKEND"] = "json"
+    for store_path, _, _ in server.STORES.values():
+        if os.path.exists(store_path):
+            os.remove(store_path)
+
+
+def test_create_and_read_records(tmp_path):
+    """
+    AJOUT: Test de création d'un fichier d'enregistrements.
+    Vérifie que les enregistrements relus sont identiques et que les points sont des entiers.
+    """
+    path = str(tmp_path / "clubs.dat")
+    store = RecordStore.create(
+        path, CLUB_LAYOUT, [{"name": "Club A", "email": "a@a.com", "points": "7"}]
+    )
+    assert len(store) == 1
+    assert store.records() == [{"name": "Club A", "email": "a@a.com", "points": 7}]
+    assert store.get("Unknown") is None
+    store.close()
+
+
+def test_set_value_updates_in_place(tmp_path):
+    """
+    AJOUT: Test de la mise à jour en place.
+    Vérifie que la taille du fichier ne change pas et que la valeur est persistée.
+    """
+    path = str(tmp_path / "clubs.dat")
+    store = RecordStore.create(
+        path,
+        CLUB_LAYOUT,
+        [
+            {"name": "Club A", "email": "a@a.com", "points": 7},
+            {"name": "Club B", "email": "b@b.com", "points": 3},
+        ],
+    )
+    size = os.path.getsize(path)
+    store.set_value("Club B", 1)
+    store.close()
+
+    assert os.path.getsize(path) == size
+    reopened = RecordStore(path, CLUB_LAYOUT)
+    assert reopened.get("Club B")["points"] == 1
+    assert reopened.get("Club A")["points"] == 7
+    with pytest.raises(KeyError):
+        reopened.set_value("Unknown", 1)
+    reopened.close()
+
+
+def test_export_json_roundtrip(tmp_path):
+    """
+    AJOUT: Test de l'export JSON.
+    Vérifie que l'export respecte le format de clubs.json (points en chaînes).
+    """
+    path = str(tmp_path / "clubs.dat")
+    json_path = str(tmp_path / "clubs.json")
+    store = RecordStore.create(
+        path, CLUB_LAYOUT, [{"name": "Club A", "email": "a@a.com", "points": 7}]
+    )
+    store.export_json(json_path, "clubs")
+    store.close()
+    with open(json_path) as f:
+        assert json.load(f) == {
+            "clubs": [{"name": "Club A", "email": "a@a.com", "points": "7"}]
+        }
+
+
+def test_field_too_long(tmp_path):
+    """AJOUT: Un champ trop long pour sa largeur fixe est refusé."""
+    with pytest.raises(StoreError):
+        RecordStore.create(
+            str(tmp_path / "clubs.dat"),
+            CLUB_LAYOUT,
+            [{"name": "x" * 100, "email": "a@a.com", "points": 1}],
+        )
+
+
+def test_invalid_store_file(tmp_path):
+    """AJOUT: Un fichier qui n'est pas un fichier d'enregistrements est refusé."""
+    path = tmp_path / "clubs.dat"
+    path.write_bytes(b"not a record store file")
+    with pytest.raises(StoreError):
+        RecordStore(str(path), CLUB_LAYOUT)
+
+
+def test_booking_with_mmap_backend(client, mmap_backend):
+    """
+    AJOUT: Test d'une réservation avec le backend mmap.
+    Les compteurs sont mis à jour dans les enregistrements et les fichiers JSON
+    ne sont pas réécrits.
+    """
+    with open("clubs.json") as f:
+        clubs_json = f.read()
+
+    response = client.post(
+        "/purchasePlaces",
+        data={"club": "Simply Lift", "competition": "Spring Festival", "places": "2"},
+    )
+    assert b"Great-booking complete!" in response.data
+    assert server.get_store("clubs").get("Simply Lift")["points"] == 11
+    assert server.get_store("competitions").get("Spring Festival")[
+        "numberOfPlaces"
+    ] == 23
+    with open("clubs.json") as f:
+        assert f.read() == clubs_json
+
+    server.export_stores()
+    with open("clubs.json") as f:
+        clubs = json.load(f)["clubs"]
+    assert next(c for c in clubs if c["name"] == "Simply Lift")["points"] == "11"
+
+
+def test_get_value_and_lock_record(tmp_path):
+    """
+    AJOUT: Test de la lecture directe et du verrou d'enregistrement.
+    La valeur lue sous verrou reflète les mises à jour en place.
+    """
+    path = str(tmp_path / "clubs.dat")
+    store = RecordStore.create(
+        path, CLUB_LAYOUT, [{"name": "Club A", "email": "a@a.com", "points": 7}]
+    )
+    with store.lock_record("Club A"):
+        store.set_value("Club A", store.get_value("Club A") - 2)
+    with store.lock_record("Unknown"):
+        assert store.get_value("Club A") == 5
+    store.close()
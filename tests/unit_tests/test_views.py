@@ -0,0 +1,132 @@
+"""
+Tests unitaires des vues immuables des données (views.py).
+Vérifie que les réservations publient une nouvelle vue sans modifier celle
+que les lectures en cours utilisent.
+"""
+
+import json
+import threading
+import time
+import pytest
+from gudlft import server
+from gudlft.server import app
+from gudlft.views import DataView
+
+
+@pytest.fixture
+def client():
+    """Fixture pour le client de test Flask."""
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+def test_with_booking_copies_changed_records():
+    """
+    AJOUT: Test de la copie à l'écriture.
+    Seuls le club et la compétition réservés sont copiés; l'ancienne vue est intacte.
+    """
+    clubs = [
+        {"id": 1, "name": "A", "email": "a@a.com", "points": 10},
+        {"id": 2, "name": "B", "email": "b@b.com", "points": 5},
+    ]
+    competitions = [
+        {"id": 1, "name": "Cup", "date": "2099-01-01 10:00:00", "numberOfPlaces": 20}
+    ]
+    view = DataView(1, clubs, competitions, {})
+    new_view = view.with_booking(clubs[0], competitions[0], 7, 17, 3)
+
+    assert new_view.version == 2
+    assert view.clubs_by_name["A"]["points"] == 10
+    assert view.booked(1, 1) == 0
+    assert new_view.clubs_by_email["a@a.com"]["points"] == 7
+    assert new_view.competitions_by_name["Cup"]["numberOfPlaces"] == 17
+    assert new_view.booked(1, 1) == 3
+    assert new_view.clubs_by_id[1]["points"] == 7
+    assert new_view.clubs_by_name["B"] is view.clubs_by_name["B"]
+
+
+def test_with_booking_shares_unchanged_indexes():
+    """
+    AJOUT: Une réservation ne recopie ni les listes ni les index: les vues
+    suivantes partagent ceux de la vue de départ et n'ajoutent que les
+    enregistrements remplacés.
+    """
+    clubs = [
+        {"id": i, "name": f"Club {i}", "email": f"c{i}@a.com", "points": 10}
+        for i in range(1, 101)
+    ]
+    competitions = [
+        {"id": 1, "name": "Cup", "date": "2099-01-01 10:00:00", "numberOfPlaces": 50}
+    ]
+    view = DataView(1, clubs, competitions, {})
+    new_view = view
+    for club_id in (3, 7):
+        club = new_view.clubs_by_id[club_id]
+        comp = new_view.competitions_by_id[1]
+        new_view = new_view.with_booking(club, comp, 9, comp["numberOfPlaces"] - 1, 1)
+
+    for index in ("clubs_by_id", "clubs_by_name", "clubs_by_email", "competitions_by_id"):
+        assert getattr(new_view, index)._base is getattr(view, index)
+    assert new_view.clubs._base is view.clubs
+    assert new_view.clubs_by_name["Club 1"] is view.clubs_by_name["Club 1"]
+    assert [club["points"] for club in new_view.clubs][:8] == [10, 10, 9, 10, 10, 10, 9, 10]
+    assert len(new_view.clubs_by_email) == 100
+    assert new_view.competitions[0]["numberOfPlaces"] == 48
+    assert new_view.club_bookings == {3: {1: 1}, 7: {1: 1}}
+
+
+def test_booking_publishes_new_view(client):
+    """
+    AJOUT: Test de l'isolation des lectures.
+    Une vue obtenue avant une réservation n'est pas modifiée par celle-ci.
+    """
+    before = server.current_view()
+    client.post(
+        "/purchasePlaces",
+        data={"club": "Simply Lift", "competition": "Spring Festival", "places": "2"},
+    )
+    after = server.current_view()
+    assert after is not before
+    assert before.clubs_by_name["Simply Lift"]["points"] == 13
+    assert before.competitions_by_name["Spring Festival"]["numberOfPlaces"] == 25
+    assert after.clubs_by_name["Simply Lift"]["points"] == 11
+    assert after.competitions_by_name["Spring Festival"]["numberOfPlaces"] == 23
+
+
+def test_unchanged_reload_keeps_view():
+    """AJOUT: Un rechargement sans changement conserve la vue (et son cache)."""
+    view = server.current_view()
+    assert server.refresh_data(force=True) is False
+    assert server.current_view() is view
+
+
+def test_reads_do_not_wait_for_writer(client):
+    """
+    AJOUT: Test des lectures pendant une écriture.
+    Tant qu'un écrivain tient le verrou des données (fichiers déjà modifiés),
+    les lectures servent la vue courante sans attendre; le rechargement a lieu
+    une fois le verrou libéré.
+    """
+    view = server.current_view()
+    holding, release = threading.Event(), threading.Event()
+
+    def writer():
+        with server._data_lock:
+            with open("bookings.json", "w") as f:
+                json.dump({"Simply Lift_Spring Festival": 3}, f)
+            holding.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    holding.wait(5)
+    started = time.perf_counter()
+    assert client.get("/points").status_code == 200
+    assert time.perf_counter() - started < 0.5
+    assert server.current_view() is view
+    release.set()
+    thread.join()
+
+    assert server.refresh_data()
+    assert server.current_view().booked(1, 1) == 3